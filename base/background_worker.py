@@ -0,0 +1,112 @@
+import threading
+
+
+class BackgroundWorker:
+    """Runs slow functions (AI planning) on a worker thread, so the frame never waits for them; only the newest function
+    that was submitted is run (older ones that haven't started are dropped) and only the newest result is kept
+
+    If is_threaded is False, the functions are ran as soon as they are submitted (replays need the results to come in the
+    same frame every time)"""
+
+    is_threaded = True
+    name = ""
+    lock = None
+    # Set when there is a function to run; the worker waits for it
+    has_work_event = None
+    thread = None
+    pending_function = None
+    is_running_function = False
+    result = None
+    has_result = False
+    exception = None
+
+    def __init__(self, name="BackgroundWorker"):
+        """ summary: initializes the object (the thread is started the first time a function is submitted)
+
+            params:
+                name: String; the name of the worker's thread
+
+            returns: None
+        """
+
+        self.name = name
+        self.lock = threading.Lock()
+        self.has_work_event = threading.Event()
+
+    def submit(self, function):
+        """ summary: runs the function on the worker thread (or right away if is_threaded is False); the function must only
+            use objects the frame doesn't change (copies) because it runs while the frame does
+
+            params:
+                function: Function; the function that is ran; what it returns becomes the result
+
+            returns: None
+        """
+
+        if not BackgroundWorker.is_threaded:
+            self.pending_function = function
+            self.run_pending_function()
+            return
+
+        with self.lock:
+            self.pending_function = function
+
+        if self.thread is None:
+            self.thread = threading.Thread(target=self.work, name=self.name, daemon=True)
+            self.thread.start()
+
+        self.has_work_event.set()
+
+    def work(self):
+        """Runs the functions that are submitted forever (the thread is a daemon, so it ends with the game)"""
+
+        while True:
+            self.has_work_event.wait()
+            self.has_work_event.clear()
+            self.run_pending_function()
+
+    def run_pending_function(self):
+        """Runs the newest submitted function and stores what it returned (or the exception it raised)"""
+
+        with self.lock:
+            function, self.pending_function = self.pending_function, None
+            self.is_running_function = function is not None
+
+        if function is None:
+            return
+
+        result, exception = None, None
+
+        try:
+            result = function()
+
+        # The exception is raised in the frame's thread by get_result(), so errors aren't silently lost on the worker
+        except Exception as error:
+            exception = error
+
+        with self.lock:
+            self.result, self.exception, self.has_result = result, exception, True
+            self.is_running_function = False
+
+    def is_busy(self):
+        """returns: boolean; if a function is waiting to be ran or is being ran"""
+
+        with self.lock:
+            return self.pending_function is not None or self.is_running_function
+
+    def get_result(self):
+        """ summary: takes the newest result (raises the exception if the function raised one)
+
+            params: None
+
+            returns: Object; what the newest function returned or None if there isn't a new result since the last call
+        """
+
+        with self.lock:
+            result, exception, has_result = self.result, self.exception, self.has_result
+            self.result, self.exception, self.has_result = None, None, False
+
+        if exception is not None:
+            raise exception
+
+        return result if has_result else None
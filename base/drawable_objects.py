@@ -1,9 +1,35 @@
+from itertools import count
+
 from base.dimensions import Dimensions
+from base.utility_classes import HistoryKeeper
 from base.utility_functions import *
 
 from gui_components.component import Component
 
 
+class DimensionAttribute:
+    """One of a GameObject's dimensions (x_coordinate, y_coordinate, length, or height); setting it to a different value
+    gives the object a new dimensions_version. It only has __set__, so reading it is the same lookup in the object's
+    __dict__ as any other attribute"""
+
+    __slots__ = ("name",)
+
+    def __init__(self, name):
+        """Initializes the object"""
+
+        self.name = name
+
+    def __set__(self, game_object, value):
+        """Sets the dimension and gives the game_object a new dimensions_version if the dimension changed"""
+
+        attributes = game_object.__dict__
+
+        if attributes.get(self.name) != value:
+            attributes["dimensions_version"] = next(GameObject.dimensions_versions)
+
+        attributes[self.name] = value
+
+
 class GameObject(Component):
     """ Adds onto Dimensions (x and y coordinates, length, height, etc.) and adds upon that drawing,
         getting an object's x and y coordinates"""
@@ -12,6 +38,21 @@ class GameObject(Component):
     name = ""
     attributes = ["x_coordinate", "y_coordinate"]
     object_type = ""
+    # Bitmasks: the collision_layer is what the object is and the collision_mask is what it can collide with; -1 has
+    # Every bit set, so by default an object can collide with everything
+    collision_layer = 1
+    collision_mask = -1
+    # Every time the x_coordinate, y_coordinate, length, or height changes the object gets a new dimensions_version
+    # (unique across all GameObjects), so HistoryKeeper.add_if_changed() can tell if the object changed since it was added
+    dimensions_versions = count(1)
+    dimensions_version = 0
+    x_coordinate = DimensionAttribute("x_coordinate")
+    y_coordinate = DimensionAttribute("y_coordinate")
+    length = DimensionAttribute("length")
+    height = DimensionAttribute("height")
+    # The values the dimensions have before they are set; a subclass's defaults (like 'length = 50') are moved into here
+    # by __init_subclass__(), so they don't hide the DimensionAttributes
+    dimension_defaults = {"x_coordinate": 0, "y_coordinate": 0, "length": 0, "height": 0}
 
     def __init__(self, x_coordinate=0, y_coordinate=0, height=0, length=0, color=(0, 0, 0)):
         """summary: Initializes the object with the numbers (int) and color (RGB tuple) provided
@@ -31,6 +72,26 @@ class GameObject(Component):
         self.color = color
         self.name = id(self)
 
+    def __init_subclass__(cls, **kwargs):
+        """Moves the dimensions the subclass gives a default value to into its dimension_defaults"""
+
+        super().__init_subclass__(**kwargs)
+        cls.dimension_defaults = dict(cls.dimension_defaults)
+
+        for name in GameObject.dimension_defaults.keys():
+            value = cls.__dict__.get(name, GameObject.__dict__[name])
+
+            if not isinstance(value, DimensionAttribute):
+                cls.dimension_defaults[name] = value
+                setattr(cls, name, GameObject.__dict__[name])
+
+    def __new__(cls, *args, **kwargs):
+        """Makes the object with its dimensions already in its __dict__ (the DimensionAttributes can't give defaults)"""
+
+        game_object = super().__new__(cls)
+        game_object.__dict__.update(cls.dimension_defaults)
+        return game_object
+
     def render(self):
         """ summary: draws the game_object on to the game_window using the variables provided in __init__
             (x_coordinate, y_coordinate, length, height, and color)
@@ -39,8 +100,31 @@ class GameObject(Component):
             returns: None
         """
 
-        pygame.draw.rect(game_window.get_window(), self.color, (self.x_coordinate,
-                         self.y_coordinate, self.length, self.height))
+        if not game_window.is_rendering:
+            return
+
+        x_coordinate, y_coordinate = self.get_render_coordinates()
+        pygame.draw.rect(game_window.get_window(), self.color, (x_coordinate,
+                         y_coordinate, self.length, self.height))
+
+    def get_render_coordinates(self):
+        """ summary: finds where the object should be drawn; it is drawn game_window.interpolation of the way between
+            where it was last cycle (from HistoryKeeper) and where it is now, so the movement looks smooth even when the
+            game isn't drawn after every step
+
+            params: None
+            returns: List of float; [x_coordinate, y_coordinate] where the object should be drawn
+        """
+
+        interpolation = game_window.interpolation
+        last_object = HistoryKeeper.get_last(self.name) if interpolation != 1 else None
+
+        if last_object is None:
+            return [self.x_coordinate, self.y_coordinate]
+
+        last_x_coordinate, last_y_coordinate = last_object.x_coordinate, last_object.y_coordinate
+        return [last_x_coordinate + (self.x_coordinate - last_x_coordinate) * interpolation,
+                last_y_coordinate + (self.y_coordinate - last_y_coordinate) * interpolation]
 
     def run(self):
         pass
@@ -129,18 +213,23 @@ class Ellipse(GameObject):
             returns: None
         """
 
+        if not game_window.is_rendering:
+            return
+
+        x_coordinate, y_coordinate = self.get_render_coordinates()
+
         if self.is_outline:
             outline_length = self.length * .1
             outline_height = self.height * .1
-            pygame.draw.ellipse(game_window.get_window(), self.color, (self.x_coordinate + outline_length,
-                                self.y_coordinate + outline_height, self.length - outline_length, self.height - outline_height))
+            pygame.draw.ellipse(game_window.get_window(), self.color, (x_coordinate + outline_length,
+                                y_coordinate + outline_height, self.length - outline_length, self.height - outline_height))
 
-            pygame.draw.ellipse(game_window.get_window(), self.color, (self.x_coordinate,
-                                self.y_coordinate, self.length, self.height))
+            pygame.draw.ellipse(game_window.get_window(), self.color, (x_coordinate,
+                                y_coordinate, self.length, self.height))
 
         else:
-            pygame.draw.ellipse(game_window.get_window(), self.color, (self.x_coordinate,
-                                self.y_coordinate, self.length, self.height))
+            pygame.draw.ellipse(game_window.get_window(), self.color, (x_coordinate,
+                                y_coordinate, self.length, self.height))
 
     def get_equation_variables(self):
         """ summary: finds the equations for this equation of an ellipse: (x - h)^2 / a^2 + (y - k)^2 / b^2 = 1
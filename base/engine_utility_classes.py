@@ -2,8 +2,9 @@ from math import sqrt
 
 from base.drawable_objects import GameObject, Ellipse
 from base.equations import Point, LineSegment
+from base.intervals import RangeSet
 from base.path import Path, ObjectPath, SimplePath
-from base.utility_classes import HistoryKeeper, Range
+from base.utility_classes import Range, RecordPool
 from base.important_variables import (
     screen_height,
     screen_length
@@ -16,11 +17,9 @@ from base.velocity_calculator import VelocityCalculator
 
 class CollisionData:
     """Stores all the data for collisions"""
-    is_collision = False
-    is_moving_collision = False
-    is_moving_right_collision = False
-    is_moving_left_collision = False
-    object_xy = None
+
+    # Two CollisionData are made for every pair of objects every frame, so it uses __slots__ (see CollisionsUtilityFunctions.collision_data_pool)
+    __slots__ = ("is_collision", "is_moving_collision", "is_moving_right_collision", "is_moving_left_collision", "object_xy")
 
     def __init__(self, is_collision, is_moving_collision, is_moving_right_collision, is_moving_left_collision, object_xy):
         self.is_collision, self.is_moving_collision = is_collision, is_moving_collision
@@ -28,15 +27,135 @@ class CollisionData:
         self.object_xy = object_xy
 
 
+class ContactRecord:
+    """Stores everything about a collision between two objects from the perspective of one of the objects; the sides
+    are the sides of the other object that this object collided with"""
+
+    is_collision = False
+    is_left_collision = False
+    is_right_collision = False
+    is_top_collision = False
+    is_bottom_collision = False
+    collision_data = None
+
+    def __init__(self, collision_data, is_left_collision, is_right_collision, is_top_collision, is_bottom_collision):
+        """Initializes the object"""
+
+        self.collision_data, self.is_collision = collision_data, collision_data.is_collision
+        self.is_left_collision, self.is_right_collision = is_left_collision, is_right_collision
+        self.is_top_collision, self.is_bottom_collision = is_top_collision, is_bottom_collision
+
+
+class CollisionCache:
+    """Stores the CollisionData of every pair of objects for the current frame; (object1, object2) and (object2, object1)
+    share one entry. Entries are stamped with the generation they were added in, so starting a new frame only changes
+    the generation instead of making a new dict"""
+
+    pairs_to_entry = {}
+    generation = 0
+    # Once there are this many entries the ones from old frames are removed, so the dict can't grow forever
+    max_size = 10000
+    hits = 0
+    misses = 0
+    inserts = 0
+
+    def __init__(self, max_size=10000):
+        """Initializes the object"""
+
+        self.pairs_to_entry = {}
+        self.max_size = max_size
+        self.reset_counters()
+
+    def get_key(object1, object2):
+        """returns: tuple of int; (smaller id, bigger id) the key for the pair of objects"""
+
+        object1_id, object2_id = id(object1), id(object2)
+        return (object1_id, object2_id) if object1_id <= object2_id else (object2_id, object1_id)
+
+    def get(self, object1, object2):
+        """returns: CollisionData; object1's CollisionData with object2 from this frame (None if there isn't one)"""
+
+        object1_id, object2_id = id(object1), id(object2)
+        key = (object1_id, object2_id) if object1_id <= object2_id else (object2_id, object1_id)
+        entry = self.pairs_to_entry.get(key)
+
+        # An entry from a previous frame is stale, so it counts as not being there
+        if entry is None or entry[0] != self.generation:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return entry[1] if object1_id <= object2_id else entry[2]
+
+    def set(self, object1, object2, object1_data, object2_data):
+        """Stores the CollisionData of object1 and object2 for this frame"""
+
+        self.inserts += 1
+
+        # The last two items are the ContactRecords, which are only found if they are asked for (see set_contact())
+        if id(object1) <= id(object2):
+            self.pairs_to_entry[(id(object1), id(object2))] = [self.generation, object1_data, object2_data, None, None]
+
+        else:
+            self.pairs_to_entry[(id(object2), id(object1))] = [self.generation, object2_data, object1_data, None, None]
+
+    def get_contact(self, object1, object2):
+        """returns: ContactRecord; object1's ContactRecord with object2 from this frame (None if there isn't one)"""
+
+        entry = self.pairs_to_entry.get(CollisionCache.get_key(object1, object2))
+
+        if entry is None or entry[0] != self.generation:
+            return None
+
+        return entry[3] if id(object1) <= id(object2) else entry[4]
+
+    def set_contact(self, object1, object2, contact):
+        """Stores object1's ContactRecord with object2; the pair's CollisionData must already be stored this frame"""
+
+        entry = self.pairs_to_entry.get(CollisionCache.get_key(object1, object2))
+        entry[3 if id(object1) <= id(object2) else 4] = contact
+
+    def start_new_frame(self):
+        """Makes all the entries stale; should be called once every frame"""
+
+        self.generation += 1
+
+        if len(self.pairs_to_entry) >= self.max_size:
+            self.pairs_to_entry = {key: entry for key, entry in self.pairs_to_entry.items() if entry[0] == self.generation}
+
+    def clear(self):
+        """Removes all the entries"""
+
+        self.pairs_to_entry = {}
+        self.generation += 1
+
+    def reset_counters(self):
+        """Sets hits, misses, and inserts back to 0"""
+
+        self.hits, self.misses, self.inserts = 0, 0, 0
+
+    def get_counters(self):
+        """returns: dict; the hits, misses, inserts, and the hit rate of the cache"""
+
+        lookups = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses, "inserts": self.inserts,
+                "hit_rate": self.hits / lookups if lookups != 0 else 0}
+
+
 class CollisionsUtilityFunctions:
     point_deviation_allowed = pow(10, -7) # The amount a suggested collision point and a point on the actual line can deviate
+    # If the areas two objects swept through are farther apart than this, get_path_collision_time() can't find a collision
+    # (it is well above point_deviation_allowed and the .0000000001 LineSegment adds to straight lines)
+    swept_bounds_margin = pow(10, -5)
+    # The CollisionData and Ranges are recycled every frame (see start_new_frame()), so they aren't allocated for every pair
+    collision_data_pool = RecordPool(CollisionData)
+    range_pool = RecordPool(Range)
 
-    def get_object_xy(current_object, prev_object, time):
-        """returns: Point; the object's x and y at that time"""
+    def start_new_frame():
+        """Recycles the CollisionData and Ranges from last frame; should be called once every frame"""
 
-        x_line = LineSegment(Point(0, prev_object.x_coordinate), Point(VelocityCalculator.time, current_object.x_coordinate))
-        y_line = LineSegment(Point(0, prev_object.y_coordinate), Point(VelocityCalculator.time, current_object.y_coordinate))
-        return Point(x_line.get_y_coordinate(time), y_line.get_y_coordinate(time))
+        CollisionsUtilityFunctions.collision_data_pool.start_new_frame()
+        CollisionsUtilityFunctions.range_pool.start_new_frame()
 
     def get_is_right_collision(object1_x_displacement, object2_x_displacement):
         """ summary: uses the displacements to find out if it is a right collision
@@ -63,21 +182,6 @@ class CollisionsUtilityFunctions:
 
         return is_moving_right_collision
 
-    def get_collision_data(object1, object2, collision_time, is_moving_collision):
-        """returns: List of CollisionData; [object1 Collision Data, object2 Collision Data]"""
-
-        is_collision = collision_time != -1
-
-        prev_object1 = HistoryKeeper.get_last(object1.name)
-        prev_object2 = HistoryKeeper.get_last(object2.name)
-        object1_displacement = object1.x_coordinate - prev_object1.x_coordinate
-        object2_displacement = object2.x_coordinate - prev_object2.x_coordinate
-        object_xy = CollisionsUtilityFunctions.get_object_xy(object1, prev_object1, collision_time)
-        is_moving_right_collision = CollisionsUtilityFunctions.get_is_right_collision(object1_displacement, object2_displacement)
-        is_moving_left_collision = not is_moving_right_collision
-
-        return CollisionData(is_collision, is_moving_collision, is_moving_right_collision, is_moving_left_collision, object_xy)
-
     def get_path_collision_time(object1_path, object2_path):
         """ summary: finds the time that object1 and object2 collide using their paths
 
@@ -106,29 +210,72 @@ class CollisionsUtilityFunctions:
         prev_object1, current_object1 = object1_path.prev_object, object1_path.current_object
         prev_object2, current_object2 = object2_path.prev_object, object2_path.current_object
 
-        for x_range in x_ranges:
-            y_and_bottom_equal = (prev_object1.y_coordinate == prev_object2.y_coordinate and
-                                  current_object1.bottom == current_object2.bottom)
+        y_and_bottom_equal = (prev_object1.y_coordinate == prev_object2.y_coordinate and
+                              current_object1.bottom == current_object2.bottom)
 
-            x_and_right_edge_equal = (prev_object1.x_coordinate == prev_object2.x_coordinate
-                                      and current_object1.right_edge == current_object2.right_edge)
+        x_and_right_edge_equal = (prev_object1.x_coordinate == prev_object2.x_coordinate
+                                  and current_object1.right_edge == current_object2.right_edge)
 
-            if y_and_bottom_equal:
-                return_value = x_range.start if x_range.start < return_value else return_value
+        # If they move the same vertically, they collide as soon as they overlap horizontally (and the other way around)
+        if y_and_bottom_equal and len(x_ranges) != 0:
+            return_value = min(x_range.start for x_range in x_ranges)
 
-            for y_range in y_ranges:
-                if x_and_right_edge_equal:
-                    return_value = y_range.start if y_range.start < return_value else return_value
+        if x_and_right_edge_equal and len(x_ranges) != 0 and len(y_ranges) != 0:
+            return_value = min(return_value, min(y_range.start for y_range in y_ranges))
 
-                smaller_range = x_range if x_range.is_less_than(y_range) else y_range
-                bigger_range = x_range if not x_range.is_less_than(y_range) else y_range
-                # Meaning that the ranges share a similar point
-                if smaller_range.end >= bigger_range.start and bigger_range.start < return_value:
-                    time = bigger_range.start
-                    return_value = time if time < return_value else return_value
+        time = RangeSet(x_ranges).get_earliest_common_time(RangeSet(y_ranges))
+        return_value = time if time is not None and time < return_value else return_value
 
         return return_value if return_value != float('inf') else -1
 
+    def get_swept_box(prev_object, current_object):
+        """returns: List of double; [prev x_coordinate, prev y_coordinate, prev right_edge, prev bottom, x_coordinate,
+        y_coordinate, right_edge, bottom] the box the object started at and the box it ended at this cycle"""
+
+        return [prev_object.x_coordinate, prev_object.y_coordinate, prev_object.right_edge, prev_object.bottom,
+                current_object.x_coordinate, current_object.y_coordinate, current_object.right_edge, current_object.bottom]
+
+    def swept_boxes_are_apart(box1, box2):
+        """returns: boolean; if the areas that the boxes from get_swept_box() went through this cycle are farther apart
+        than swept_bounds_margin- if they are, the objects couldn't have collided"""
+
+        margin = CollisionsUtilityFunctions.swept_bounds_margin
+
+        return (min(box1[0], box1[4]) > max(box2[2], box2[6]) + margin or min(box2[0], box2[4]) > max(box1[2], box1[6]) + margin or
+                min(box1[1], box1[5]) > max(box2[3], box2[7]) + margin or min(box2[1], box2[5]) > max(box1[3], box1[7]) + margin)
+
+    def get_swept_collision_data(box1, box2, collision_time, is_moving_collision, total_time=None):
+        """ summary: finds the CollisionData of both objects from where they started and ended this cycle
+
+            params:
+                box1: List of double; the get_swept_box() of object1
+                box2: List of double; the get_swept_box() of object2
+                collision_time: double; the time the objects collided (-1 if they didn't collide)
+                is_moving_collision: boolean; if it was a moving collision
+                total_time: double; the time it took the objects to go from their start box to their end box
+                (VelocityCalculator.time by default)
+
+            returns: List of CollisionData; [object1 CollisionData, object2 CollisionData]
+        """
+
+        total_time = total_time if total_time is not None else VelocityCalculator.time
+        is_collision = collision_time != -1
+
+        # No time has passed (VelocityCalculator.time is 0 before the first cycle), so the objects are where they started
+        fraction = collision_time / total_time if total_time != 0 else 0
+
+        object1_displacement = box1[4] - box1[0]
+        object2_displacement = box2[4] - box2[0]
+        object1_xy = Point(box1[0] + object1_displacement * fraction, box1[1] + (box1[5] - box1[1]) * fraction)
+        object2_xy = Point(box2[0] + object2_displacement * fraction, box2[1] + (box2[5] - box2[1]) * fraction)
+
+        is_moving_right_collision1 = CollisionsUtilityFunctions.get_is_right_collision(object1_displacement, object2_displacement)
+        is_moving_right_collision2 = CollisionsUtilityFunctions.get_is_right_collision(object2_displacement, object1_displacement)
+
+        collision_data_pool = CollisionsUtilityFunctions.collision_data_pool
+        return [collision_data_pool.get(is_collision, is_moving_collision, is_moving_right_collision1, not is_moving_right_collision1, object1_xy),
+                collision_data_pool.get(is_collision, is_moving_collision, is_moving_right_collision2, not is_moving_right_collision2, object2_xy)]
+
     def filter_ranges(ranges):
         """summary: deletes all the ranges that are from 0 to 0 (0 -> 0)"""
 
@@ -152,6 +299,7 @@ class CollisionsUtilityFunctions:
         """returns: List of Range; the times that 'line' is between 'top_line' and 'bottom_line' NOTE: the lines must have
         time as their x coordinate and the coordinates (x, y, bottom, or right_edge) as the y coordinate"""
 
+        range_pool = CollisionsUtilityFunctions.range_pool
         is_between_lines = CollisionsUtilityFunctions.is_between_lines(line, bottom_line, top_line, False)
 
         collision_times = []
@@ -170,18 +318,18 @@ class CollisionsUtilityFunctions:
         return_value = None
         for collision_time in collision_times:
             if is_between_lines:
-                return_value = Range(start_time, collision_time)
+                return_value = range_pool.get(start_time, collision_time)
 
             is_between_lines = not is_between_lines
             start_time = collision_time
 
         if is_between_lines and CollisionsUtilityFunctions.is_between_lines(line, bottom_line, top_line, True):
-            return_value = Range(start_time, VelocityCalculator.time)
+            return_value = range_pool.get(start_time, VelocityCalculator.time)
 
         if len(collision_times) == 0 or return_value is None:
             always_between_lines = is_between_lines and CollisionsUtilityFunctions.is_between_lines(line, bottom_line, top_line, True)
             # If the lines never collide and it is between the lines that means it was always between the lines otherwise it never was
-            return_value = Range(0, 0) if not always_between_lines else Range(0, VelocityCalculator.time)
+            return_value = range_pool.get(0, 0) if not always_between_lines else range_pool.get(0, VelocityCalculator.time)
 
         return return_value
 
@@ -385,37 +533,38 @@ class CollisionsUtilityFunctions:
         x_path1, right_edge_path1, y_path1, bottom_path1 = object1_paths
         x_path2, right_edge_path2, y_path2, bottom_path2 = object2_paths
 
-        x_ranges = []
-        x_ranges += CollisionsUtilityFunctions.get_ranges_between(x_path1, x_path2, right_edge_path2)
-        x_ranges += CollisionsUtilityFunctions.get_ranges_between(right_edge_path1, x_path2, right_edge_path2)
-        x_ranges += CollisionsUtilityFunctions.get_ranges_between(x_path2, x_path1, right_edge_path1)
-        x_ranges += CollisionsUtilityFunctions.get_ranges_between(right_edge_path2, x_path1, right_edge_path1)
+        x_range_set = CollisionsUtilityFunctions.get_range_set_between([[x_path1, x_path2, right_edge_path2], [right_edge_path1, x_path2, right_edge_path2],
+                                                                        [x_path2, x_path1, right_edge_path1], [right_edge_path2, x_path1, right_edge_path1]])
 
-        y_ranges = []
-        y_ranges += CollisionsUtilityFunctions.get_ranges_between(y_path1, y_path2, bottom_path2)
-        y_ranges += CollisionsUtilityFunctions.get_ranges_between(bottom_path1, y_path2, bottom_path2)
-        y_ranges += CollisionsUtilityFunctions.get_ranges_between(y_path2, y_path1, bottom_path1)
-        y_ranges += CollisionsUtilityFunctions.get_ranges_between(bottom_path2, y_path1, bottom_path1)
+        y_range_set = CollisionsUtilityFunctions.get_range_set_between([[y_path1, y_path2, bottom_path2], [bottom_path1, y_path2, bottom_path2],
+                                                                        [y_path2, y_path1, bottom_path1], [bottom_path2, y_path1, bottom_path1]])
 
-        x_ranges = CollisionsUtilityFunctions.filter_ranges(x_ranges)
-        y_ranges = CollisionsUtilityFunctions.filter_ranges(y_ranges)
-        return_value = float('inf')
+        time = x_range_set.get_earliest_common_time(y_range_set)
+        return time if time is not None else -1
 
-        for x_range in x_ranges:
-            for y_range in y_ranges:
-                smaller_range = x_range if x_range.is_less_than(y_range) else y_range
-                bigger_range = x_range if not x_range.is_less_than(y_range) else y_range
-                # Meaning that the ranges share a similar point
-                if smaller_range.end >= bigger_range.start and bigger_range.start < return_value:
-                    time = bigger_range.start
-                    return_value = time if time < return_value else return_value
+    def get_range_set_between(paths_list):
+        """ summary: finds the times that each path is between its bottom path and top path
 
-        return return_value if return_value != float('inf') else -1
+            params:
+                paths_list: List of List of SimplePath; [[path, bottom_path, top_path]] (see get_ranges_between())
+
+            returns: RangeSet; the times that any of the paths is between its bottom path and top path
+        """
+
+        return_value = RangeSet()
+
+        # Each get_ranges_between() is already sorted, so each union is one walk through the ranges
+        for path, bottom_path, top_path in paths_list:
+            ranges = CollisionsUtilityFunctions.get_ranges_between(path, bottom_path, top_path)
+            return_value = return_value.get_union(RangeSet(CollisionsUtilityFunctions.filter_ranges(ranges)))
+
+        return return_value
 
     def get_ranges_between(path: SimplePath, bottom_path: SimplePath, top_path: SimplePath):
         """returns: List of Range; the times that 'line' is between 'top_line' and 'bottom_line' NOTE: the lines must have
         time as their x coordinate and the coordinates (x, y, bottom, or right_edge) as the y coordinate"""
 
+        range_pool = CollisionsUtilityFunctions.range_pool
         collision_times = CollisionsUtilityFunctions.get_path_collision_times(path, bottom_path)
         collision_times += CollisionsUtilityFunctions.get_path_collision_times(path, top_path)
 
@@ -431,7 +580,7 @@ class CollisionsUtilityFunctions:
         # TODO is this logic correct or inaccurate; what if it collides with the bottom line two times in a row?
         for collision_time in collision_times:
             if is_between_lines:
-                return_value.append(Range(start_time, collision_time))
+                return_value.append(range_pool.get(start_time, collision_time))
 
             is_between_lines = not is_between_lines
             start_time = collision_time
@@ -439,26 +588,101 @@ class CollisionsUtilityFunctions:
         if len(collision_times) == 0 or len(return_value) == 0:
             always_between_lines = is_between_lines and CollisionsUtilityFunctions.is_between_lines(path.get_last_line(), bottom_path.get_last_line(), top_path.get_last_line(), True)
             # If the lines never collide and it is between the lines that means it was always between the lines otherwise it never was
-            return_value = [Range(0, 0)] if not always_between_lines else [Range(0, VelocityCalculator.time)]
+            return_value = [range_pool.get(0, 0)] if not always_between_lines else [range_pool.get(0, VelocityCalculator.time)]
 
         elif is_between_lines:
             # Since it ended in between the lines it must go from the previous collision time -> the end of the time of the paths
-            return_value.append(Range(start_time, path.last_point.x_coordinate))
+            return_value.append(range_pool.get(start_time, path.last_point.x_coordinate))
 
         return return_value
 
     def get_path_collision_times(path1, path2):
+        """ summary: finds the x coordinates (times) where the simple paths' lines cross; if both paths' x coordinates only
+            increase, the lines are walked through like a merge, so only the lines whose x coordinates overlap are tested
+
+            params:
+                path1: SimplePath; one of the paths
+                path2: SimplePath; the other path
+
+            returns: List of double; the x coordinates where the paths cross (in the order of path1's lines then path2's lines)
+        """
 
         collision_times = []
+        number_of_lines1, number_of_lines2 = len(path1.slopes), len(path2.slopes)
+        x_coordinates1, x_coordinates2 = path1.x_coordinates, path2.x_coordinates
+        is_merging = path1.is_increasing and path2.is_increasing
+        point_deviation_allowed = CollisionsUtilityFunctions.point_deviation_allowed
+        first_index2 = 0
+
+        for index1 in range(number_of_lines1):
+            index2, end_x_coordinate = 0, float("inf")
+
+            if is_merging:
+                start_x_coordinate = x_coordinates1[index1] - point_deviation_allowed
+                end_x_coordinate = x_coordinates1[index1 + 1] + point_deviation_allowed
+
+                # The lines of path2 that end before this line starts end before all the next lines of path1 start too
+                while first_index2 < number_of_lines2 and x_coordinates2[first_index2 + 1] + point_deviation_allowed < start_x_coordinate:
+                    first_index2 += 1
 
-        for line1 in path1.get_lines():
-            for line2 in path2.get_lines():
+                index2 = first_index2
 
-                collision_point = CollisionsUtilityFunctions.get_line_collision_point(line1, line2)
+            # Once path2's lines start after this line ends they can't cross it
+            while index2 < number_of_lines2 and x_coordinates2[index2] - point_deviation_allowed <= end_x_coordinate:
+                collision_time = CollisionsUtilityFunctions.get_path_lines_collision_time(path1, index1, path2, index2)
 
                 # Meaning it is a collision
-                if collision_point is not None:
-                    collision_times.append(collision_point.x_coordinate)
+                if collision_time is not None:
+                    collision_times.append(collision_time)
+
+                index2 += 1
 
         return collision_times
 
+    def get_path_lines_collision_time(path1, index1, path2, index2):
+        """returns: double; the x coordinate where path1's line at index1 and path2's line at index2 cross (None if they
+        don't); the same as get_line_collision_point() without making the LineSegments"""
+
+        slope1, slope2 = path1.slopes[index1], path2.slopes[index2]
+        y_intercept1, y_intercept2 = path1.y_intercepts[index1], path2.y_intercepts[index2]
+
+        # If the lines are parallel they couldn't have collided
+        if slope1 == slope2:
+            return None
+
+        x_coordinate = (y_intercept2 - y_intercept1) / (slope1 - slope2)
+        is_vertical1, is_vertical2 = path1.line_is_vertical[index1], path2.line_is_vertical[index2]
+
+        if is_vertical1 or is_vertical2:
+            x_coordinate = path1.x_coordinates[index1] if is_vertical1 else path2.x_coordinates[index2]
+            y_coordinate = slope2 * x_coordinate + y_intercept2 if is_vertical1 else slope1 * x_coordinate + y_intercept1
+
+        else:
+            y_coordinate = slope1 * x_coordinate + y_intercept1
+
+        # If one of the lines doesn't contain that collision point then the lines couldn't have collided
+        point_deviation_allowed = CollisionsUtilityFunctions.point_deviation_allowed
+        is_collision = (CollisionsUtilityFunctions.path_line_contains_point(path1, index1, x_coordinate, y_coordinate, point_deviation_allowed) and
+                        CollisionsUtilityFunctions.path_line_contains_point(path2, index2, x_coordinate, y_coordinate, point_deviation_allowed))
+
+        return x_coordinate if is_collision else None
+
+    def path_line_contains_point(path, index, x_coordinate, y_coordinate, amount_can_be_off_by):
+        """returns: boolean; if the path's line at the index contains the point (see Segment.contains_point())"""
+
+        x_min, x_max = path.x_coordinates[index], path.x_coordinates[index + 1]
+        y_min, y_max = path.y_coordinates[index], path.y_coordinates[index + 1]
+        x_min, x_max = (x_min, x_max) if x_min < x_max else (x_max, x_min)
+        y_min, y_max = (y_min, y_max) if y_min < y_max else (y_max, y_min)
+
+        if not x_min - amount_can_be_off_by <= x_coordinate <= x_max + amount_can_be_off_by:
+            return False
+
+        if not y_min - amount_can_be_off_by <= y_coordinate <= y_max + amount_can_be_off_by:
+            return False
+
+        if path.line_is_vertical[index] or path.line_is_horizontal[index]:
+            return True
+
+        line_y_coordinate = path.slopes[index] * x_coordinate + path.y_intercepts[index]
+        return line_y_coordinate - amount_can_be_off_by <= y_coordinate <= line_y_coordinate + amount_can_be_off_by
@@ -1,26 +1,29 @@
 from copy import deepcopy
 
+from base.dimensions import Dimensions
 from base.drawable_objects import GameObject, Ellipse
-from base.engine_utility_classes import CollisionsUtilityFunctions, CollisionData
-from base.equations import LineSegment
+from base.engine_utility_classes import CollisionsUtilityFunctions, CollisionData, CollisionCache, ContactRecord
+from base.equations import LineSegment, Point
+from base.frame_profiler import FrameProfiler
 from base.path import Path, ObjectPath
 from base.utility_classes import HistoryKeeper
 from base.utility_functions import rounded
+from base.velocity_calculator import VelocityCalculator
 
 class CollisionsFinder:
     """Gives a series of methods to find if two (or more objects) have collided"""
 
-    objects_to_data = {}
+    collision_cache = CollisionCache()
 
     # def update_data(object1, object2):
 
     def is_collision(object1, object2):
         CollisionsFinder.update_data(object1, object2)
-        return CollisionsFinder.objects_to_data.get(f"{id(object1)} {id(object2)}").is_collision
+        return CollisionsFinder.collision_cache.get(object1, object2).is_collision
 
     def is_moving_collision(object1, object2):
         CollisionsFinder.update_data(object1, object2)
-        return CollisionsFinder.objects_to_data.get(f"{id(object1)} {id(object2)}").is_moving_collision
+        return CollisionsFinder.collision_cache.get(object1, object2).is_moving_collision
 
     # VERY IMPORTANT NOTE: is moving left and right collisions count it if the object was not outside of the other last cycle
     # Meaning that if the object were to come down onto the end of the other object it would count; whereas left and right
@@ -60,7 +63,7 @@ class CollisionsFinder:
     def is_moving_right_collision(object1, object2):
         """returns: boolean; if object1 has collided with object2's right_edge because one of the objects has moved"""
         CollisionsFinder.update_data(object1, object2)
-        collision_data: CollisionData = CollisionsFinder.objects_to_data.get(f"{id(object1)} {id(object2)}")
+        collision_data: CollisionData = CollisionsFinder.collision_cache.get(object1, object2)
         return collision_data.is_moving_collision and collision_data.is_moving_right_collision
 
     def is_moving_left_collision(object1, object2):
@@ -72,7 +75,43 @@ class CollisionsFinder:
 
     def get_collision_data(object1, object2) -> CollisionData:
         """returns: CollisionData; the data for the collision for 'object1' and 'object2'"""
-        return CollisionsFinder.objects_to_data.get(f"{id(object1)} {id(object2)}")
+        return CollisionsFinder.collision_cache.get(object1, object2)
+
+    def get_contact(object1, object2) -> ContactRecord:
+        """ summary: finds which sides of object2 object1 collided with; it is only found once per frame for each pair,
+            so it can be used instead of calling is_left_collision(), is_top_collision(), etc. one by one
+
+            params:
+                object1: GameObject; the object whose perspective the ContactRecord is from
+                object2: GameObject; the other object
+
+            returns: ContactRecord; object1's ContactRecord with object2
+        """
+
+        CollisionsFinder.update_data(object1, object2)
+        contact = CollisionsFinder.collision_cache.get_contact(object1, object2)
+
+        # Only object1's perspective is found; object2's is found if it is asked for
+        if contact is None:
+            contact = CollisionsFinder.get_contact_record(object1, object2)
+            CollisionsFinder.collision_cache.set_contact(object1, object2, contact)
+
+        return contact
+
+    def get_contact_record(object1, object2):
+        """returns: ContactRecord; a new ContactRecord of object1 with object2 (uses the CollisionData of this frame)"""
+
+        collision_data = CollisionsFinder.get_collision_data(object1, object2)
+        is_collision = collision_data.is_collision
+
+        # Without the previous objects the sides can't be found (the objects didn't exist last cycle)
+        if HistoryKeeper.get_last(object1.name) is None or HistoryKeeper.get_last(object2.name) is None:
+            return ContactRecord(collision_data, False, False, False, False)
+
+        return ContactRecord(collision_data, CollisionsFinder.is_left_collision(object1, object2, is_collision),
+                             CollisionsFinder.is_right_collision(object1, object2, is_collision),
+                             CollisionsFinder.is_top_collision(object1, object2, is_collision),
+                             CollisionsFinder.is_bottom_collision(object1, object2, is_collision))
 
     def get_objects_xy(object1, object2):
         """returns: List of Point; [object1's xy, object2's xy]"""
@@ -80,16 +119,41 @@ class CollisionsFinder:
         return [CollisionsFinder.get_collision_data(object1, object2).object_xy,
                 CollisionsFinder.get_collision_data(object2, object1).object_xy]
 
-    def make_dimensions_match(prev_object, current_object):
-        """Makes the height and length of the objects match; changes prev_object to match current_object"""
+    def get_collision_layers(game_object):
+        """returns: List of int; [collision_layer, collision_mask] of the game_object (objects that aren't GameObjects,
+        like a LineSegment, are on layer 1 and can collide with everything)"""
+
+        return [getattr(game_object, "collision_layer", 1), getattr(game_object, "collision_mask", -1)]
+
+    def layers_can_collide(object1, object2):
+        """returns: boolean; if each object's collision_mask has the other object's collision_layer in it"""
+
+        object1_layer, object1_mask = CollisionsFinder.get_collision_layers(object1)
+        object2_layer, object2_mask = CollisionsFinder.get_collision_layers(object2)
+
+        return object1_layer & object2_mask != 0 and object2_layer & object1_mask != 0
+
+    def get_no_collision_data():
+        """returns: List of CollisionData; [object1 CollisionData, object2 CollisionData] for two objects that didn't collide"""
+
+        collision_data_pool = CollisionsUtilityFunctions.collision_data_pool
+        return [collision_data_pool.get(False, False, False, False, Point(0, 0)), collision_data_pool.get(False, False, False, False, Point(0, 0))]
+
+    def get_adjusted_prev_object(prev_object, current_object):
+        """ summary: finds where prev_object would have been if it had the same height and length as current_object (its
+            right_edge and bottom stay where they were); prev_object is not changed
+
+            returns: Dimensions; the adjusted prev_object (None if prev_object is None)
+        """
+
+        if prev_object is None:
+            return None
 
         height_difference = current_object.height - prev_object.height
         length_difference = current_object.length - prev_object.length
 
-        prev_object.height = current_object.height
-        prev_object.length = current_object.length
-        prev_object.x_coordinate -= length_difference
-        prev_object.y_coordinate -= height_difference
+        return Dimensions(prev_object.x_coordinate - length_difference, prev_object.y_coordinate - height_difference,
+                          current_object.length, current_object.height)
 
     def update_data(object1: GameObject, object2: GameObject):
         """ summary: uses get_x_coordinates() and get_y_coordinates_from_x_coordinate() (methods from GameObject)
@@ -102,47 +166,60 @@ class CollisionsFinder:
             returns: boolean; if the two objects provided have collided
         """
 
+        if CollisionsFinder.collision_cache.get(object1, object2) is not None:
+            return
+
+        # The objects' layers can't collide, so none of the (expensive) geometry has to be done
+        if not CollisionsFinder.layers_can_collide(object1, object2):
+            CollisionsFinder.collision_cache.set(object1, object2, *CollisionsFinder.get_no_collision_data())
+            return
+
+        start_time = FrameProfiler.start()
         prev_object1 = HistoryKeeper.get_last(object1.name)
         prev_object2 = HistoryKeeper.get_last(object2.name)
+        object1_data, object2_data = CollisionsFinder.get_pair_collision_data(object1, object2, prev_object1, prev_object2)
+        CollisionsFinder.collision_cache.set(object1, object2, object1_data, object2_data)
+        FrameProfiler.end(FrameProfiler.Sections.COLLISIONS, start_time)
 
-        # Prevents None Type Error and saving these coordinates because they have to be modified if the length or height of the object has changed
-        prev_object1_dimensions = [prev_object1.x_coordinate, prev_object1.y_coordinate, prev_object1.length, prev_object1.height] if prev_object1 is not None else [0,0,0,0]
-        prev_object2_dimensions = [prev_object2.x_coordinate, prev_object2.y_coordinate, prev_object2.length, prev_object2.height] if prev_object2 is not None else [0,0,0,0]
+    def get_pair_collision_data(object1, object2, prev_object1, prev_object2):
+        """ summary: finds the CollisionData of object1 and object2 without changing anything (not the objects, the
+            HistoryKeeper, or the collision_cache), so it can be called from multiple threads at once
 
-        object1_has_moved, object2_has_moved = False, False
+            params:
+                object1: GameObject; one of the objects that is used to see if the two objects provided have collided
+                object2: GameObject; one of the objects that is used to see if the two objects provided have collided
+                prev_object1: GameObject; object1 from last cycle (None if it didn't exist last cycle)
+                prev_object2: GameObject; object2 from last cycle (None if it didn't exist last cycle)
 
-        if prev_object1 is None or prev_object2 is None:
-            # There couldn't have been a collision since both either object1 or object2 didn't exist before this, so
-            # objects_to_data should reflect that there is no collision
-            CollisionsFinder.objects_to_data[f"{id(object2)} {id(object1)}"] = CollisionData(False, False, False, (0, 0), (0, 0))
-            CollisionsFinder.objects_to_data[f"{id(object1)} {id(object2)}"] = CollisionData(False, False, False, (0, 0), (0, 0))
-            return
+            returns: List of CollisionData; [object1 CollisionData, object2 CollisionData]
+        """
 
-        else:
-            CollisionsFinder.make_dimensions_match(prev_object1, object1)
-            CollisionsFinder.make_dimensions_match(prev_object2, object2)
-            object1_has_moved = CollisionsFinder.object_has_moved(prev_object1, object1)
-            object2_has_moved = CollisionsFinder.object_has_moved(prev_object2, object2)
-        if CollisionsFinder.objects_to_data.__contains__(f"{id(object1)} {id(object2)}"):
-            return
+        if prev_object1 is None or prev_object2 is None:
+            # There couldn't have been a collision since both either object1 or object2 didn't exist before this
+            return CollisionsFinder.get_no_collision_data()
 
+        # The previous objects have to be modified if the length or height of the object has changed
+        prev_object1 = CollisionsFinder.get_adjusted_prev_object(prev_object1, object1)
+        prev_object2 = CollisionsFinder.get_adjusted_prev_object(prev_object2, object2)
+        object1_has_moved = CollisionsFinder.object_has_moved(prev_object1, object1)
+        object2_has_moved = CollisionsFinder.object_has_moved(prev_object2, object2)
 
-        object1_path = ObjectPath(prev_object1, object1)
-        object2_path = ObjectPath(prev_object2, object2)
+        object1_box = CollisionsUtilityFunctions.get_swept_box(prev_object1, object1)
+        object2_box = CollisionsUtilityFunctions.get_swept_box(prev_object2, object2)
         collision_time = -1
         is_moving_collision = False
 
         if object2_has_moved and object1_has_moved:
-            # 4 cases because there are two paths for the objects - 2^2 possible combinations
-            collision_time = CollisionsUtilityFunctions.get_path_collision_time(object1_path, object2_path)
-            # If the time is functionally zero it can be discounted
-            # if is_within_range(0, collision_time, pow(10, -6)):
-            #     collision_time = -1
+            # Most pairs are nowhere near each other, so the LineSegments for get_path_collision_time() aren't made for them
+            if not CollisionsUtilityFunctions.swept_boxes_are_apart(object1_box, object2_box):
+                # 4 cases because there are two paths for the objects - 2^2 possible combinations
+                collision_time = CollisionsUtilityFunctions.get_path_collision_time(ObjectPath(prev_object1, object1), ObjectPath(prev_object2, object2))
+
             is_moving_collision = collision_time != -1
 
         elif object2_has_moved or object1_has_moved:
             stationary_object = object1 if not object1_has_moved else object2
-            moving_object_path = object1_path if object1_has_moved else object2_path
+            moving_object_path = ObjectPath(prev_object1, object1) if object1_has_moved else ObjectPath(prev_object2, object2)
             # 2 cases: one for the x coordinate path and the other for the right edge path
             collision_time = CollisionsUtilityFunctions.get_moving_collision_time(moving_object_path, stationary_object)
 
@@ -155,11 +232,70 @@ class CollisionsFinder:
             # The last case where neither object has moved and is checking if the objects are touching each other
             collision_time = 0
 
-        CollisionsFinder.objects_to_data[f"{id(object1)} {id(object2)}"] = CollisionsUtilityFunctions.get_collision_data(object1, object2, collision_time, is_moving_collision)
-        CollisionsFinder.objects_to_data[f"{id(object2)} {id(object1)}"] = CollisionsUtilityFunctions.get_collision_data(object2, object1, collision_time, is_moving_collision)
+        return CollisionsUtilityFunctions.get_swept_collision_data(object1_box, object2_box, collision_time, is_moving_collision)
+
+    def get_pairs_collision_data(pairs_data, time):
+        """ summary: calls get_pair_collision_data() on each of the pairs; this is what runs on each worker of an executor
+
+            params:
+                pairs_data: List of List of GameObject; [object1, object2, prev_object1, prev_object2] for each pair
+                time: double; the VelocityCalculator.time of the cycle (process pools don't share it with the main process)
+
+            returns: List of List of CollisionData; [object1 CollisionData, object2 CollisionData] for each pair
+        """
+
+        VelocityCalculator.time = time
+        return [CollisionsFinder.get_pair_collision_data(*pair_data) for pair_data in pairs_data]
+
+    def update_data_batch(object_pairs, executor=None, chunk_size=64):
+        """ summary: calls update_data() on all the pairs; if an executor is provided the pairs are split up into chunks
+            and the chunks are run on the executor's workers at the same time
+
+            params:
+                object_pairs: List of GameObject[2]; the pairs of objects that should have their collision data updated
+                executor: concurrent.futures.Executor; the thread or process pool the pairs are run on (None means they
+                are run on this thread). A process pool needs the objects to be picklable
+                chunk_size: int; the number of pairs each worker is given at a time
+
+            returns: None
+        """
+
+        start_time = FrameProfiler.start()
+        pairs_data = []
+        uncached_pairs = []
+        added_pair_keys = set()
+
+        # The HistoryKeeper and collision_cache are only used on this thread; the workers only do the math
+        for object1, object2 in object_pairs:
+            key = CollisionCache.get_key(object1, object2)
 
-        prev_object1.x_coordinate, prev_object1.y_coordinate, prev_object1.length, prev_object1.height = prev_object1_dimensions
-        prev_object2.x_coordinate, prev_object2.y_coordinate, prev_object2.length, prev_object2.height = prev_object2_dimensions
+            if added_pair_keys.__contains__(key) or CollisionsFinder.collision_cache.get(object1, object2) is not None:
+                continue
+
+            added_pair_keys.add(key)
+
+            if not CollisionsFinder.layers_can_collide(object1, object2):
+                CollisionsFinder.collision_cache.set(object1, object2, *CollisionsFinder.get_no_collision_data())
+                continue
+
+            uncached_pairs.append([object1, object2])
+            pairs_data.append([object1, object2, HistoryKeeper.get_last(object1.name), HistoryKeeper.get_last(object2.name)])
+
+        if executor is None or len(pairs_data) <= chunk_size:
+            all_collision_data = CollisionsFinder.get_pairs_collision_data(pairs_data, VelocityCalculator.time)
+
+        else:
+            chunks = [pairs_data[x:x + chunk_size] for x in range(0, len(pairs_data), chunk_size)]
+            futures = [executor.submit(CollisionsFinder.get_pairs_collision_data, chunk, VelocityCalculator.time) for chunk in chunks]
+            all_collision_data = []
+
+            for future in futures:
+                all_collision_data += future.result()
+
+        for (object1, object2), (object1_data, object2_data) in zip(uncached_pairs, all_collision_data):
+            CollisionsFinder.collision_cache.set(object1, object2, object1_data, object2_data)
+
+        FrameProfiler.end(FrameProfiler.Sections.COLLISIONS, start_time)
 
     def objects_are_touching(object1, object2):
         """returns: booolean; if the objects are touching"""
@@ -203,6 +339,45 @@ class CollisionsFinder:
 
         return CollisionsFinder.is_height_collision(object1, object2) and CollisionsFinder.is_length_collision(object1, object2)
 
+    def get_bounds_columns(game_objects):
+        """returns: List of List of double; [x_coordinates, y_coordinates, right_edges, bottoms] of the game_objects"""
+
+        x_coordinates = [game_object.x_coordinate for game_object in game_objects]
+        y_coordinates = [game_object.y_coordinate for game_object in game_objects]
+        right_edges = [x_coordinates[x] + game_objects[x].length for x in range(len(game_objects))]
+        bottoms = [y_coordinates[x] + game_objects[x].height for x in range(len(game_objects))]
+
+        return [x_coordinates, y_coordinates, right_edges, bottoms]
+
+    def is_collision_matrix(objects_a, objects_b):
+        """ summary: does CollisionsFinder.is_simple_collision() for every pair of objects in one pass; the dimensions of
+            each object are only looked up once, so it is a lot faster than calling is_simple_collision() on every pair
+
+            params:
+                objects_a: List of GameObject; the objects that are the rows of the matrix
+                objects_b: List of GameObject; the objects that are the columns of the matrix
+
+            returns: List of object; [matrix, index_pairs] --> matrix[i][j] is if objects_a[i] and objects_b[j] have
+            collided and index_pairs is the [i, j] of every pair that has collided
+        """
+
+        x_coordinates_a, y_coordinates_a, right_edges_a, bottoms_a = CollisionsFinder.get_bounds_columns(objects_a)
+        columns_b = list(zip(*CollisionsFinder.get_bounds_columns(objects_b)))
+        matrix = []
+        index_pairs = []
+
+        for i in range(len(objects_a)):
+            x_coordinate, y_coordinate, right_edge, bottom = x_coordinates_a[i], y_coordinates_a[i], right_edges_a[i], bottoms_a[i]
+
+            # Is a length collision and a height collision (the same as is_simple_collision())
+            row = [x_coordinate <= right_edge_b and right_edge >= x_coordinate_b and bottom >= y_coordinate_b and y_coordinate <= bottom_b
+                   for x_coordinate_b, y_coordinate_b, right_edge_b, bottom_b in columns_b]
+
+            matrix.append(row)
+            index_pairs += [[i, j] for j in range(len(row)) if row[j]]
+
+        return [matrix, index_pairs]
+
     def is_a_bottom_collision(object1, object2, is_collision=None):
         """returns: boolean; if either object1 or object2 collided with the other one's bottom"""
 
@@ -281,4 +456,396 @@ class CollisionsFinder:
 
         # Have to round the numbers otherwise there is a weird python rounding thing with floats
         return (rounded(prev_obect.x_coordinate - object.x_coordinate, 4) != 0 or
-                rounded(prev_obect.y_coordinate - object.y_coordinate, 4) != 0)
\ No newline at end of file
+                rounded(prev_obect.y_coordinate - object.y_coordinate, 4) != 0)
+
+class SpatialHash:
+    """A uniform grid broad phase for CollisionsFinder; only the pairs of objects whose swept bounds (last cycle -> this
+    cycle) share a grid cell can have collided, so only those pairs have to go through CollisionsFinder.update_data()"""
+
+    cell_size = 0
+    cells = {}
+    # The amount the swept bounds are expanded by, so objects that are 'touching' after rounding are not discarded
+    bounds_buffer = pow(10, -6)
+
+    def __init__(self):
+        """Initializes the object"""
+
+        self.cells = {}
+
+    def get_swept_bounds(game_object):
+        """ summary: finds the bounds that the game_object covered from last cycle to this cycle; if the length or height
+            of the object has changed, last cycle's object is also counted with the new size (its right_edge and bottom
+            staying where they were) because that is where the collisions treat it as starting from
+
+            params:
+                game_object: GameObject; the object which will have its swept bounds found
+
+            returns: List of double; [x_coordinate, y_coordinate, right_edge, bottom] (None if the object has no history)
+        """
+
+        slot = HistoryKeeper.get_slot(game_object.name, 1)
+
+        if slot is None:
+            return None
+
+        # Reading the values straight from the HistoryKeeper's columns, since this is done for every object every cycle
+        x_coordinates, y_coordinates, lengths, heights = HistoryKeeper.get_columns(1)
+        prev_x_coordinate, prev_y_coordinate = x_coordinates[slot], y_coordinates[slot]
+        prev_length, prev_height = lengths[slot], heights[slot]
+
+        buffer = SpatialHash.bounds_buffer
+        length_difference = game_object.length - prev_length
+        height_difference = game_object.height - prev_height
+
+        x_coordinate = min(prev_x_coordinate, prev_x_coordinate - length_difference, game_object.x_coordinate)
+        y_coordinate = min(prev_y_coordinate, prev_y_coordinate - height_difference, game_object.y_coordinate)
+        right_edge = max(prev_x_coordinate + prev_length, game_object.right_edge)
+        bottom = max(prev_y_coordinate + prev_height, game_object.bottom)
+
+        return [x_coordinate - buffer, y_coordinate - buffer, right_edge + buffer, bottom + buffer]
+
+    def get_cell_size(self, all_bounds):
+        """returns: double; the average of the largest side of each of the bounds (the grid is sized off of the objects)"""
+
+        total_size = 0
+        number_of_bounds = 0
+
+        for bounds in all_bounds:
+            if bounds is not None:
+                x_coordinate, y_coordinate, right_edge, bottom = bounds
+                total_size += max(right_edge - x_coordinate, bottom - y_coordinate)
+                number_of_bounds += 1
+
+        # The cell size can't be zero otherwise every object would have to be put into infinite cells
+        return max(total_size / number_of_bounds, 1) if number_of_bounds != 0 else 1
+
+    def update_cells(self, all_bounds):
+        """Puts the index of every bounds into all the cells the bounds cover"""
+
+        self.cells = {}
+        cell_size = self.cell_size
+
+        for index in range(len(all_bounds)):
+            bounds = all_bounds[index]
+
+            if bounds is None:
+                continue
+
+            x_coordinate, y_coordinate, right_edge, bottom = bounds
+
+            for column in range(int(x_coordinate // cell_size), int(right_edge // cell_size) + 1):
+                for row in range(int(y_coordinate // cell_size), int(bottom // cell_size) + 1):
+                    cell = self.cells.get((column, row))
+
+                    if cell is None:
+                        self.cells[(column, row)] = [index]
+
+                    else:
+                        cell.append(index)
+
+    def get_candidate_index_pairs(self, game_objects):
+        """returns: List of int[2]; the [smaller index, bigger index] of the game_objects that could have collided this cycle"""
+
+        all_bounds = [SpatialHash.get_swept_bounds(game_object) for game_object in game_objects]
+        self.cell_size = self.get_cell_size(all_bounds)
+        self.update_cells(all_bounds)
+
+        index_pairs = set()
+        for indexes in self.cells.values():
+            for i in range(len(indexes)):
+                for j in range(i + 1, len(indexes)):
+                    index_pairs.add((indexes[i], indexes[j]))
+
+        return_value = []
+
+        # Sharing a cell does not mean the bounds overlap, so the bounds have to be checked to get rid of those pairs
+        for index1, index2 in sorted(index_pairs):
+            x_coordinate1, y_coordinate1, right_edge1, bottom1 = all_bounds[index1]
+            x_coordinate2, y_coordinate2, right_edge2, bottom2 = all_bounds[index2]
+
+            if (x_coordinate1 <= right_edge2 and right_edge1 >= x_coordinate2 and
+                    y_coordinate1 <= bottom2 and bottom1 >= y_coordinate2):
+                return_value.append([index1, index2])
+
+        return return_value
+
+    def get_candidate_pairs(self, game_objects, is_ordered=False):
+        """ summary: finds the pairs of objects that can touch this cycle (the only ones that have to have their collisions checked)
+
+            params:
+                game_objects: List of GameObject; the objects that will be checked- each one must be in the HistoryKeeper
+                is_ordered: boolean; whether both [object1, object2] and [object2, object1] should be returned; they are
+                sorted as if it was a nested loop over game_objects
+
+            returns: List of GameObject[2]; the pairs of objects that could have collided
+        """
+
+        index_pairs = self.get_candidate_index_pairs(game_objects)
+
+        if is_ordered:
+            index_pairs = sorted(index_pairs + [[index2, index1] for index1, index2 in index_pairs])
+
+        return [[game_objects[index1], game_objects[index2]] for index1, index2 in index_pairs]
+
+
+class SweepAndPrune:
+    """A broad phase for CollisionsFinder that keeps the start and end of every registered object along the x axis sorted
+    between cycles; since objects only move a little each cycle, insertion sort puts the endpoints back in order in close
+    to linear time. Only the objects whose swept bounds overlap get their collision data updated"""
+
+    # id(game_object) -> game_object in the order the objects were registered
+    game_objects = {}
+    # Each endpoint is [x_coordinate, is_end, game_object]; is_end is 0 or 1 so starts are sorted before ends at the same x
+    endpoints = []
+    object_to_endpoints = {}
+    # id(game_object) -> the number of objects registered before it (it is never reused, so removing an object doesn't
+    # change the order of the other objects)
+    object_to_index = {}
+    objects_registered = 0
+    removed_endpoints_count = 0
+    overlapping_pairs = []
+    object_to_overlapping_objects = {}
+
+    def __init__(self):
+        """Initializes the object"""
+
+        self.game_objects, self.endpoints = {}, []
+        self.object_to_endpoints, self.object_to_index = {}, {}
+        self.objects_registered, self.removed_endpoints_count = 0, 0
+        self.overlapping_pairs, self.object_to_overlapping_objects = [], {}
+
+    def add(self, game_object):
+        """Registers the game_object, so its collisions are found when run() is called"""
+
+        if self.object_to_endpoints.__contains__(id(game_object)):
+            return
+
+        start, end = [game_object.x_coordinate, 0, game_object], [game_object.right_edge, 1, game_object]
+        self.object_to_endpoints[id(game_object)] = [start, end]
+        self.object_to_index[id(game_object)] = self.objects_registered
+        self.objects_registered += 1
+        self.game_objects[id(game_object)] = game_object
+
+        # Put at the end; the next insertion sort moves them to the right spot
+        self.endpoints += [start, end]
+
+    def remove(self, game_object):
+        """Unregisters the game_object, so its collisions are no longer found"""
+
+        if not self.object_to_endpoints.__contains__(id(game_object)):
+            return
+
+        # The endpoints are marked instead of being taken out of the list, so the next update_endpoints() can take all the
+        # removed endpoints out in the same pass that sorts them
+        for endpoint in self.object_to_endpoints.pop(id(game_object)):
+            endpoint[2] = None
+
+        self.removed_endpoints_count += 2
+        del self.object_to_index[id(game_object)]
+        del self.game_objects[id(game_object)]
+
+    def set_objects(self, game_objects):
+        """Registers the game_objects and unregisters every object not in game_objects"""
+
+        game_object_ids = set(id(game_object) for game_object in game_objects)
+
+        for game_object in list(self.game_objects.values()):
+            if not game_object_ids.__contains__(id(game_object)):
+                self.remove(game_object)
+
+        for game_object in game_objects:
+            self.add(game_object)
+
+    def update_endpoints(self):
+        """Updates the endpoints to this cycle's swept bounds and then sorts them with insertion sort"""
+
+        object_to_bounds = {}
+
+        for game_object in self.game_objects.values():
+            bounds = SpatialHash.get_swept_bounds(game_object)
+
+            # The object hasn't been added to the HistoryKeeper, so it only covers where it is now
+            if bounds is None:
+                bounds = [game_object.x_coordinate, game_object.y_coordinate, game_object.right_edge, game_object.bottom]
+
+            start, end = self.object_to_endpoints[id(game_object)]
+            start[0], end[0] = bounds[0], bounds[2]
+            object_to_bounds[id(game_object)] = bounds
+
+        if self.removed_endpoints_count != 0:
+            self.endpoints = [endpoint for endpoint in self.endpoints if endpoint[2] is not None]
+            self.removed_endpoints_count = 0
+
+        endpoints = self.endpoints
+
+        for i in range(1, len(endpoints)):
+            endpoint = endpoints[i]
+            j = i - 1
+
+            while j >= 0 and (endpoints[j][0] > endpoint[0] or (endpoints[j][0] == endpoint[0] and endpoints[j][1] > endpoint[1])):
+                endpoints[j + 1] = endpoints[j]
+                j -= 1
+
+            endpoints[j + 1] = endpoint
+
+        return object_to_bounds
+
+    def run(self):
+        """Finds the pairs of registered objects whose swept bounds overlap and calls CollisionsFinder.update_data() on them"""
+
+        object_to_bounds = self.update_endpoints()
+        active_objects = []
+        self.overlapping_pairs = []
+        self.object_to_overlapping_objects = {object_id: [] for object_id in self.game_objects.keys()}
+
+        for x_coordinate, is_end, game_object in self.endpoints:
+            if is_end:
+                active_objects.remove(game_object)
+                continue
+
+            bounds = object_to_bounds[id(game_object)]
+
+            for active_object in active_objects:
+                active_bounds = object_to_bounds[id(active_object)]
+
+                # They already overlap along the x axis because active_object hasn't ended yet
+                if bounds[1] <= active_bounds[3] and bounds[3] >= active_bounds[1]:
+                    self.add_overlapping_pair(game_object, active_object)
+
+            active_objects.append(game_object)
+
+        # So the pairs are in the order the objects were registered in- the same order a nested loop would have
+        self.overlapping_pairs.sort(key=lambda pair: [self.object_to_index[id(pair[0])], self.object_to_index[id(pair[1])]])
+
+        for object1, object2 in self.overlapping_pairs:
+            CollisionsFinder.update_data(object1, object2)
+
+    def add_overlapping_pair(self, object1, object2):
+        """Adds the pair to overlapping_pairs with the object that was registered first being first"""
+
+        if self.object_to_index[id(object1)] > self.object_to_index[id(object2)]:
+            object1, object2 = object2, object1
+
+        self.overlapping_pairs.append([object1, object2])
+        self.object_to_overlapping_objects[id(object1)].append(object2)
+        self.object_to_overlapping_objects[id(object2)].append(object1)
+
+    def could_have_collided(self, object1, object2):
+        """returns: boolean; if the swept bounds of the objects overlapped the last time run() was called"""
+
+        return self.get_overlapping_objects(object1).__contains__(object2)
+
+    def get_overlapping_objects(self, game_object):
+        """returns: List of GameObject; the objects whose swept bounds overlapped game_object's the last time run() was called"""
+
+        return self.object_to_overlapping_objects.get(id(game_object), [])
+
+
+class CollisionDispatcher:
+    """Finds all the collisions between the objects once per frame (broad phase and then narrow phase) and calls the
+    handlers registered for the objects' collision layers with what happened: the objects started touching (ENTER), are
+    still touching (STAY), or stopped touching (EXIT). A handler that needs the sides calls CollisionsFinder.get_contact()"""
+
+    class Events:
+        ENTER = "ENTER"
+        STAY = "STAY"
+        EXIT = "EXIT"
+
+    # (main object's collision_layer, other object's collision_layer) -> List of [handler, events]
+    layer_pairs_to_handlers = {}
+    # (id(main_object), id(other_object)) -> [main_object, other_object, handlers] for the pairs touching last frame
+    touching_pairs = {}
+    spatial_hash = None
+
+    def __init__(self):
+        """Initializes the object"""
+
+        self.layer_pairs_to_handlers = {}
+        self.touching_pairs = {}
+        self.spatial_hash = SpatialHash()
+
+    def add_handler(self, main_layer, other_layer, handler, events=None):
+        """ summary: makes the handler get called when an object on main_layer and an object on other_layer have one of the events
+
+            params:
+                main_layer: int; the collision_layer of the object that acts upon the other object
+                other_layer: int; the collision_layer of the object that is acted upon
+                handler: function(main_object, other_object, event); what should happen for the event
+                events: List of String; the CollisionDispatcher.Events the handler is called for (all of them by default)
+
+            returns: None
+        """
+
+        events = events if events is not None else [self.Events.ENTER, self.Events.STAY, self.Events.EXIT]
+        key = (main_layer, other_layer)
+        self.layer_pairs_to_handlers[key] = self.layer_pairs_to_handlers.get(key, []) + [[handler, events]]
+
+    def get_handlers(self, main_object, other_object):
+        """returns: List of [handler, events]; the handlers for the main_object's and other_object's collision layers"""
+
+        return self.layer_pairs_to_handlers.get((main_object.collision_layer, other_object.collision_layer), [])
+
+    def get_collision_mask(self, layer):
+        """returns: int; a bitmask of every layer that the layer has a handler with (either as the main or other layer)"""
+
+        return_value = 0
+
+        for main_layer, other_layer in self.layer_pairs_to_handlers.keys():
+            if main_layer == layer:
+                return_value |= other_layer
+
+            if other_layer == layer:
+                return_value |= main_layer
+
+        return return_value
+
+    def run(self, game_objects, executor=None):
+        """ summary: finds the collisions between all the game_objects and calls the handlers; should be called once per frame
+
+            params:
+                game_objects: List of GameObject; all the objects that could collide- each one must be in the HistoryKeeper
+                executor: concurrent.futures.Executor; if it isn't None the collision data is found on it (see
+                CollisionsFinder.update_data_batch())
+
+            returns: None
+        """
+
+        possible_pairs = []
+
+        for main_object, other_object in self.spatial_hash.get_candidate_pairs(game_objects, True):
+            handlers = self.get_handlers(main_object, other_object)
+
+            if len(handlers) != 0 and CollisionsFinder.layers_can_collide(main_object, other_object):
+                possible_pairs.append([main_object, other_object, handlers])
+
+        if executor is not None:
+            CollisionsFinder.update_data_batch([[main_object, other_object] for main_object, other_object, handlers in possible_pairs], executor)
+
+        current_touching_pairs = {}
+
+        for main_object, other_object, handlers in possible_pairs:
+            if not CollisionsFinder.is_collision(main_object, other_object):
+                continue
+
+            key = (id(main_object), id(other_object))
+            event = self.Events.STAY if self.touching_pairs.__contains__(key) else self.Events.ENTER
+            current_touching_pairs[key] = [main_object, other_object, handlers]
+            self.run_handlers(main_object, other_object, handlers, event)
+
+        for key, (main_object, other_object, handlers) in self.touching_pairs.items():
+            if not current_touching_pairs.__contains__(key):
+                self.run_handlers(main_object, other_object, handlers, self.Events.EXIT)
+
+        self.touching_pairs = current_touching_pairs
+
+    def run_handlers(self, main_object, other_object, handlers, event):
+        """Calls all the handlers that are for the event"""
+
+        for handler, events in handlers:
+            if events.__contains__(event):
+                handler(main_object, other_object, event)
+
+    def reset(self):
+        """Forgets which objects were touching, so no EXIT events happen for them"""
+
+        self.touching_pairs = {}
@@ -0,0 +1,136 @@
+import json
+from collections import deque
+from math import ceil
+from time import perf_counter
+
+
+class FrameProfiler:
+    """Times the parts (sections) of every frame; the time each section took the last number_of_frames_kept frames is
+    kept, so the percentiles of the frame times can be found, and every timed call is kept as a trace event, so the
+    frames can be exported to Chrome's trace event format (chrome://tracing or https://ui.perfetto.dev)
+
+    Nothing is timed unless is_enabled is True"""
+
+    class Sections:
+        FRAME = "frame"
+        EVENTS = "events"
+        FUNCTION_RUNNER = "function_runner"
+        CHANGER = "changer"
+        COLLISIONS = "collisions"
+        HISTORY_KEEPER = "history_keeper"
+
+    is_enabled = False
+    number_of_frames_kept = 300
+    max_trace_events = 200000
+
+    # section -> deque of float; the milliseconds the section took in each of the last number_of_frames_kept frames
+    section_to_frame_times = {}
+    # section -> float; the seconds the section has taken so far this frame
+    section_to_current_time = {}
+    # Every timed call: [section, start time, end time] (turned into Chrome's format when exported)
+    trace_events = deque()
+
+    def enable(number_of_frames_kept=300):
+        """ summary: starts timing the sections (the times from before are cleared)
+
+            params:
+                number_of_frames_kept: int; how many frames the percentiles are found from
+
+            returns: None
+        """
+
+        FrameProfiler.is_enabled = True
+        FrameProfiler.number_of_frames_kept = number_of_frames_kept
+        FrameProfiler.section_to_frame_times, FrameProfiler.section_to_current_time = {}, {}
+        FrameProfiler.trace_events = deque(maxlen=FrameProfiler.max_trace_events)
+
+    def disable():
+        """Stops timing the sections (the times are kept)"""
+
+        FrameProfiler.is_enabled = False
+
+    def start():
+        """returns: float; the time a section starts at (pass it to FrameProfiler.end()); 0 if not enabled, so the clock
+        isn't read when nothing is being timed"""
+
+        return perf_counter() if FrameProfiler.is_enabled else 0
+
+    def end(section, start_time):
+        """ summary: adds the time since start_time to the section's time this frame (does nothing if not enabled)
+
+            params:
+                section: String; the name of the section
+                start_time: float; what FrameProfiler.start() returned when the section started
+
+            returns: None
+        """
+
+        if not FrameProfiler.is_enabled:
+            return
+
+        end_time = perf_counter()
+        section_to_current_time = FrameProfiler.section_to_current_time
+        section_to_current_time[section] = section_to_current_time.get(section, 0) + end_time - start_time
+        FrameProfiler.trace_events.append((section, start_time, end_time))
+
+    def start_new_frame():
+        """Ends the current frame: every section's time this frame is added to its frame times (0 if it didn't run)"""
+
+        if not FrameProfiler.is_enabled:
+            return
+
+        section_to_frame_times = FrameProfiler.section_to_frame_times
+
+        for section in FrameProfiler.section_to_current_time.keys():
+            if section_to_frame_times.get(section) is None:
+                section_to_frame_times[section] = deque(maxlen=FrameProfiler.number_of_frames_kept)
+
+        for section, frame_times in section_to_frame_times.items():
+            frame_times.append(FrameProfiler.section_to_current_time.get(section, 0) * 1000)
+
+        FrameProfiler.section_to_current_time = {}
+
+    def get_percentiles(section, percentiles=(50, 95, 99)):
+        """ summary: finds the percentiles of the section's frame times (nearest rank)
+
+            params:
+                section: String; the name of the section
+                percentiles: tuple of int; the percentiles that should be found
+
+            returns: List of float; the frame time in milliseconds of each percentile (empty if the section has no times)
+        """
+
+        frame_times = sorted(FrameProfiler.section_to_frame_times.get(section, []))
+
+        if len(frame_times) == 0:
+            return []
+
+        # The nearest rank is the smallest frame time that at least percentile percent of the frame times are <=
+        return [frame_times[max(ceil(len(frame_times) * percentile / 100) - 1, 0)] for percentile in percentiles]
+
+    def get_sections():
+        """returns: List of String; the sections that have frame times (the frame is first and the rest are sorted)"""
+
+        sections = sorted(FrameProfiler.section_to_frame_times.keys())
+
+        if sections.__contains__(FrameProfiler.Sections.FRAME):
+            sections.remove(FrameProfiler.Sections.FRAME)
+            sections.insert(0, FrameProfiler.Sections.FRAME)
+
+        return sections
+
+    def export_chrome_trace(file_path):
+        """ summary: writes the trace events to a file in Chrome's trace event format
+
+            params:
+                file_path: String; the path to the file the trace will be written to
+
+            returns: None
+        """
+
+        # "X" events are complete events (they have a start and a duration); the times are in microseconds
+        trace_events = [{"name": section, "ph": "X", "ts": start_time * 1e6, "dur": (end_time - start_time) * 1e6, "pid": 0, "tid": 0}
+                        for section, start_time, end_time in FrameProfiler.trace_events]
+
+        with open(file_path, "w") as file:
+            json.dump({"traceEvents": trace_events, "displayTimeUnit": "ms"}, file)
@@ -1,3 +1,5 @@
+from base.frame_profiler import FrameProfiler
+from base.utility_classes import HistoryKeeper
 
 
 class FunctionRunner:
@@ -6,13 +8,14 @@ class FunctionRunner:
     events = {}
     timed_events = {}
     functions = {}
-    tracked_objects = []
+    # id(game_object) -> game_object
+    tracked_objects = {}
 
-    def __int__(self):
+    def __init__(self):
         self.events = {}
         self.timed_events = {}
         self.functions = {}
-        self.tracked_objects = []
+        self.tracked_objects = {}
 
     def add_event(self, event, function):
         """ summary: adds the event to events, so the event's run function will be run every cycle
@@ -57,10 +60,16 @@ class FunctionRunner:
 
         self.functions[function] = condition
 
-    # def track_game_object(self, game_object):
-    #     """Keeps track of the game_object so it will be added to HistoryKeeper every cycle"""
-    #
-    #     self.tracked_objects.append(game_object)
+    def track_game_object(self, game_object):
+        """Keeps track of the game_object so it will be added to HistoryKeeper every cycle (see HistoryKeeper.add_if_changed())"""
+
+        self.tracked_objects[id(game_object)] = game_object
+
+    def untrack_game_object(self, game_object):
+        """Stops keeping track of the game_object, so it won't be added to the HistoryKeeper anymore"""
+
+        if self.tracked_objects.__contains__(id(game_object)):
+            del self.tracked_objects[id(game_object)]
 
     def run(self):
         """Runs all the functions and adds all the tracked objects to the HistoryKeeper"""
@@ -82,5 +91,8 @@ class FunctionRunner:
             else:
                 function()
 
-        # for tracked_object in self.tracked_objects:
-        #     HistoryKeeper.add(tracked_object, id(tracked_object), True)
+        start_time = FrameProfiler.start()
+        for tracked_object in self.tracked_objects.values():
+            HistoryKeeper.add_if_changed(tracked_object, tracked_object.name)
+
+        FrameProfiler.end(FrameProfiler.Sections.HISTORY_KEEPER, start_time)
@@ -0,0 +1,158 @@
+"""The geometry the engine's math is done with (points, line segments, and polylines); nothing here can be rendered, so
+the collision functions can make as many of them as they need every frame without carrying any gui state. Every class
+uses __slots__ (no __dict__ for each object)"""
+
+
+class Point:
+    """Stores the x and y coordinates of point"""
+
+    __slots__ = ("x_coordinate", "y_coordinate")
+
+    def __init__(self, x_coordinate, y_coordinate):
+        """ summary: initializes the object
+
+            params:
+                x_coordinate: double; the value of the point's x coordinate
+                y_coordinate: double; the value of the point's y coordinate
+
+            returns: None
+        """
+
+        self.x_coordinate, self.y_coordinate = x_coordinate, y_coordinate
+
+    def __str__(self):
+        return f"({self.x_coordinate}, {self.y_coordinate})"
+
+
+class Segment:
+    """The part of the line y = mx + b (m is slope and b is y_intercept) from start_point to end_point; the slope and
+    y_intercept are found once when it is made, so the collision functions don't have to find them again"""
+
+    __slots__ = ("start_point", "end_point", "slope", "y_intercept", "is_vertical", "is_horizontal")
+
+    def __init__(self, start_point: Point, end_point: Point):
+        """ summary: initializes the object
+
+            params:
+                start_point: Point; a point on the line (different than end_point)
+                end_point: Point; a point on the line (different than point1)
+
+            returns: None
+        """
+
+        self.is_vertical, self.is_horizontal = False, False
+
+        # Added .01, so elsewhere when I am doing collisions I don't have to worry about straight lines :)
+        if start_point.x_coordinate == end_point.x_coordinate:
+            end_point.x_coordinate += .0000000001
+            self.is_vertical = True
+
+        if start_point.y_coordinate == end_point.y_coordinate:
+            end_point.y_coordinate += .0000000001
+            self.is_horizontal = True
+
+        self.slope = (start_point.y_coordinate - end_point.y_coordinate) / (start_point.x_coordinate - end_point.x_coordinate)
+        self.y_intercept = start_point.y_coordinate - self.slope * start_point.x_coordinate
+
+        self.start_point = start_point
+        self.end_point = end_point
+
+    def get_y_coordinate(self, x_coordinate):
+        """ summary: finds the y_coordinate using the equation y = mx + b
+
+            params:
+                x_coordinate: the x coordinate which will be used to find the y_coordinate
+
+            returns: double; the y coordinate
+        """
+
+        return self.slope * x_coordinate + self.y_intercept
+
+    def get_x_coordinate(self, y_coordinate):
+        """ summary: finds the x coordinate using the equation x = (y - b) / m
+
+            params:
+                y_coordinate: the y coordinate which will be used to find the x coordinate
+
+            returns: double; the x coordinate
+        """
+
+        return (y_coordinate - self.y_intercept) / self.slope
+
+    def slope_is_positive(self):
+        """returns: boolean; if the slope is >= 0"""
+
+        return self.slope >= 0
+
+    def get_x_min_and_max(self):
+        """returns: [min x coordinate, max x coordinate]"""
+
+        start_x_coordinate, end_x_coordinate = self.start_point.x_coordinate, self.end_point.x_coordinate
+        return [start_x_coordinate, end_x_coordinate] if start_x_coordinate < end_x_coordinate else [end_x_coordinate, start_x_coordinate]
+
+    def get_y_min_and_max(self):
+        """returns: [min y coordinate, max y coordinate]"""
+
+        start_y_coordinate, end_y_coordinate = self.start_point.y_coordinate, self.end_point.y_coordinate
+        return [start_y_coordinate, end_y_coordinate] if start_y_coordinate < end_y_coordinate else [end_y_coordinate, start_y_coordinate]
+
+    def contains_point(self, point: Point, amount_can_be_off_by):
+        """ summary: finds out if the line contains the point (the point can differ from the line by 'amount_can_be_off_by')
+
+            params:
+                point: Point; the point in question
+                amount_can_be_off_by: double; the amount the point can differ from the line
+
+            returns: boolean; if the line contains the point
+        """
+
+        x_min, x_max = self.get_x_min_and_max()
+        y_min, y_max = self.get_y_min_and_max()
+
+        x_is_on_line = x_min - amount_can_be_off_by <= point.x_coordinate <= x_max + amount_can_be_off_by
+        y_is_on_line = y_min - amount_can_be_off_by <= point.y_coordinate <= y_max + amount_can_be_off_by
+
+        if not x_is_on_line or not y_is_on_line or self.is_vertical or self.is_horizontal:
+            return x_is_on_line and y_is_on_line
+
+        y_coordinate = self.get_y_coordinate(point.x_coordinate)
+        return y_coordinate - amount_can_be_off_by <= point.y_coordinate <= y_coordinate + amount_can_be_off_by
+
+    def contains_x_coordinate(self, x_coordinate, amount_off_acceptable=1):
+        """returns: boolean; if this line contains the x_coordinate"""
+
+        x_min, x_max = self.get_x_min_and_max()
+        return x_min - amount_off_acceptable <= x_coordinate <= x_max + amount_off_acceptable
+
+    def __str__(self):
+        return f"{self.start_point} -> {self.end_point}"
+
+
+class Polyline:
+    """Points that are connected by segments (the first point to the second point, the second point to the third point, etc.)"""
+
+    __slots__ = ("points",)
+
+    def __init__(self, points=None):
+        """ summary: initializes the object
+
+            params:
+                points: List of Point; the points of the polyline in order
+
+            returns: None
+        """
+
+        self.points = points if points is not None else []
+
+    def add_point(self, point):
+        """Adds the point to the end of the polyline"""
+
+        self.points.append(point)
+
+    def get_segments(self):
+        """returns: List of Segment; the segments between each point and the next one"""
+
+        return [Segment(self.points[x], self.points[x + 1]) for x in range(len(self.points) - 1)]
+
+    def __str__(self):
+        return " -> ".join(str(point) for point in self.points)
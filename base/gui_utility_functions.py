@@ -17,6 +17,10 @@ def render_words(message, font, **kwargs):
         returns: None
     """
 
+    # Nothing is drawn when the window isn't rendering, so the text's surface doesn't have to be made
+    if not game_window.is_rendering:
+        return
+
     # Getting all the variables
     text_color = (255, 255, 255) if not kwargs.get("text_color") else kwargs.get("text_color")
     text_background = background_color if not kwargs.get("text_background") else kwargs.get("text_background")
@@ -1,12 +1,20 @@
+import os
+
 from gui_components.window import Window
 from base.function_runner import FunctionRunner
 from utillities.changer import Changer
 import pygame
 
+# Headless mode (GAMES_HEADLESS=1) runs the games without drawing anything, so they can run where there is no display
+is_headless = os.environ.get("GAMES_HEADLESS", "0") == "1"
+
+if is_headless:
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
 background_color = (70, 70, 70)
 screen_length = 1280
 screen_height = 650
-game_window = Window(screen_length, screen_height, "Pong Reloaded", background_color)
+game_window = Window(screen_length, screen_height, "Pong Reloaded", background_color, is_headless)
 function_runner = FunctionRunner()
 changer = Changer()
 pygame.init()
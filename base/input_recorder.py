@@ -0,0 +1,159 @@
+import random
+import struct
+
+import pygame
+
+from base.velocity_calculator import VelocityCalculator
+
+
+class InputRecorder:
+    """Records the keyboard and mouse input and the VelocityCalculator.time of every cycle into a binary log, so the
+    session can be replayed later; replaying gives the game the same input and times as the recording, so it plays out
+    exactly the same way (as fast as the computer can run it because the times don't come from the clock)
+
+    The log is a header (LOG_HEADER: file type, version, random seed) and then for every cycle a FRAME_HEADER (time,
+    mouse buttons, key modifiers, mouse x and y, number of pressed keys) followed by the scancode of each pressed key"""
+
+    class Modes:
+        NOT_RUNNING = "NOT_RUNNING"
+        RECORDING = "RECORDING"
+        REPLAYING = "REPLAYING"
+
+    LOG_HEADER = struct.Struct("<4sHQ")
+    FRAME_HEADER = struct.Struct("<dBHhhB")
+    FILE_TYPE = b"INPT"
+    VERSION = 1
+    # How many keys pygame.key.get_pressed() has (SDL's number of scancodes)
+    NUMBER_OF_SCANCODES = 512
+
+    mode = Modes.NOT_RUNNING
+    log_file = None
+    # The log being replayed and where the next cycle starts in it
+    log = b""
+    log_index = 0
+    number_of_frames = 0
+    # The pygame functions that the replay replaces: [module, function name, function]
+    replaced_functions = []
+    # The input of the current cycle when replaying: [pressed keys, key modifiers, mouse buttons, mouse position]
+    frame_input = None
+
+    def start_recording(file_path, seed=None):
+        """ summary: starts recording the input into the file at file_path; the random module is seeded, so the
+            replay's random numbers are the same as the recording's
+
+            params:
+                file_path: String; the path to the file the log will be written to
+                seed: int; the seed for the random module (a random seed if None)
+
+            returns: None
+        """
+
+        seed = seed if seed is not None else random.getrandbits(63)
+        random.seed(seed)
+
+        InputRecorder.log_file = open(file_path, "wb")
+        InputRecorder.log_file.write(InputRecorder.LOG_HEADER.pack(InputRecorder.FILE_TYPE, InputRecorder.VERSION, seed))
+        InputRecorder.mode, InputRecorder.number_of_frames = InputRecorder.Modes.RECORDING, 0
+
+    def start_replaying(file_path):
+        """ summary: starts replaying the log at file_path; the pygame functions for getting the keyboard and mouse
+            input are replaced by ones that give the recorded input
+
+            params:
+                file_path: String; the path to a log that start_recording() made
+
+            returns: None
+        """
+
+        with open(file_path, "rb") as log_file:
+            InputRecorder.log = log_file.read()
+
+        file_type, version, seed = InputRecorder.LOG_HEADER.unpack_from(InputRecorder.log, 0)
+
+        if file_type != InputRecorder.FILE_TYPE or version != InputRecorder.VERSION:
+            raise ValueError(f"{file_path} is not a version {InputRecorder.VERSION} input log")
+
+        random.seed(seed)
+        InputRecorder.log_index = InputRecorder.LOG_HEADER.size
+        InputRecorder.mode, InputRecorder.number_of_frames = InputRecorder.Modes.REPLAYING, 0
+
+        InputRecorder.replaced_functions = [[pygame.key, "get_pressed", pygame.key.get_pressed],
+                                            [pygame.key, "get_mods", pygame.key.get_mods],
+                                            [pygame.mouse, "get_pressed", pygame.mouse.get_pressed],
+                                            [pygame.mouse, "get_pos", pygame.mouse.get_pos]]
+
+        pygame.key.get_pressed = lambda: InputRecorder.frame_input[0]
+        pygame.key.get_mods = lambda: InputRecorder.frame_input[1]
+        pygame.mouse.get_pressed = lambda *args, **kwargs: InputRecorder.frame_input[2]
+        pygame.mouse.get_pos = lambda: InputRecorder.frame_input[3]
+
+    def run():
+        """ summary: records or replays the input of this cycle (does nothing if it isn't recording or replaying); must
+            be called at the start of every cycle after pygame's events have been gotten
+
+            params: None
+
+            returns: boolean; if the cycle should run (False once the replay has ended)
+        """
+
+        if InputRecorder.mode == InputRecorder.Modes.RECORDING:
+            InputRecorder.record_frame()
+
+        elif InputRecorder.mode == InputRecorder.Modes.REPLAYING:
+            return InputRecorder.replay_frame()
+
+        return True
+
+    def record_frame():
+        """Writes the input and VelocityCalculator.time of this cycle to the log"""
+
+        pressed_keys = pygame.key.get_pressed()
+        # Indexing pygame's ScancodeWrapper converts the index from a key code to a scancode, so it is iterated instead
+        scancodes = [scancode for scancode, is_pressed in enumerate(pressed_keys) if is_pressed][:255]
+        mouse_buttons = pygame.mouse.get_pressed()
+        mouse_x_coordinate, mouse_y_coordinate = pygame.mouse.get_pos()
+
+        # Each mouse button is a bit, so all three fit in one byte
+        mouse_buttons_bits = mouse_buttons[0] | mouse_buttons[1] << 1 | mouse_buttons[2] << 2
+
+        InputRecorder.log_file.write(InputRecorder.FRAME_HEADER.pack(VelocityCalculator.time, mouse_buttons_bits, pygame.key.get_mods(),
+                                                                     mouse_x_coordinate, mouse_y_coordinate, len(scancodes)))
+        InputRecorder.log_file.write(struct.pack(f"<{len(scancodes)}H", *scancodes))
+        InputRecorder.number_of_frames += 1
+
+    def replay_frame():
+        """returns: boolean; if there was another cycle in the log (sets the input and VelocityCalculator.time to that cycle's)"""
+
+        log, log_index = InputRecorder.log, InputRecorder.log_index
+
+        if log_index + InputRecorder.FRAME_HEADER.size > len(log):
+            InputRecorder.stop()
+            return False
+
+        time, mouse_buttons_bits, mods, mouse_x_coordinate, mouse_y_coordinate, number_of_keys = InputRecorder.FRAME_HEADER.unpack_from(log, log_index)
+        log_index += InputRecorder.FRAME_HEADER.size
+        scancodes = struct.unpack_from(f"<{number_of_keys}H", log, log_index)
+        InputRecorder.log_index = log_index + number_of_keys * 2
+
+        pressed_keys = [False] * InputRecorder.NUMBER_OF_SCANCODES
+        for scancode in scancodes:
+            pressed_keys[scancode] = True
+
+        mouse_buttons = (bool(mouse_buttons_bits & 1), bool(mouse_buttons_bits & 2), bool(mouse_buttons_bits & 4))
+        InputRecorder.frame_input = [pygame.key.ScancodeWrapper(pressed_keys), mods, mouse_buttons, (mouse_x_coordinate, mouse_y_coordinate)]
+        VelocityCalculator.time = time
+        InputRecorder.number_of_frames += 1
+        return True
+
+    def stop():
+        """Stops recording or replaying; the log is saved if it was recording and pygame's functions are put back if it was replaying"""
+
+        if InputRecorder.log_file is not None:
+            InputRecorder.log_file.close()
+            InputRecorder.log_file = None
+
+        for module, function_name, function in InputRecorder.replaced_functions:
+            setattr(module, function_name, function)
+
+        InputRecorder.replaced_functions, InputRecorder.log = [], b""
+        InputRecorder.mode = InputRecorder.Modes.NOT_RUNNING
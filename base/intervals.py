@@ -0,0 +1,133 @@
+from bisect import bisect_right
+from operator import attrgetter
+
+from base.utility_classes import Range
+
+
+class RangeSet:
+    """Sorted ranges that don't overlap (a range includes its start and end); the starts and ends are stored in flat lists,
+    so finding the union, the intersection, or the earliest common time of two range sets is one walk through both of them
+    (like a merge) instead of comparing every range with every other range"""
+
+    __slots__ = ("starts", "ends")
+
+    def __init__(self, ranges=None):
+        """ summary: initializes the object; the ranges that overlap or touch are joined into one range and the ranges
+            that are empty (their end is before their start) are left out
+
+            params:
+                ranges: List of Range; the ranges of the range set (they don't have to be sorted, but it only takes
+                linear time if they are sorted by start)
+
+            returns: None
+        """
+
+        self.starts, self.ends = [], []
+
+        if ranges is not None:
+            for sorted_range in sorted(ranges, key=attrgetter("start")):
+                self.add_range(sorted_range.start, sorted_range.end)
+
+    def add_range(self, start, end):
+        """Adds the range to the end of the range set; the start must be >= the start of the last range"""
+
+        if end < start:
+            return
+
+        starts, ends = self.starts, self.ends
+
+        # It overlaps or touches the last range, so they become one range
+        if len(ends) != 0 and start <= ends[-1]:
+            ends[-1] = end if end > ends[-1] else ends[-1]
+
+        else:
+            starts.append(start)
+            ends.append(end)
+
+    def get_union(self, other_range_set):
+        """returns: RangeSet; the times that are in this range set or the other_range_set"""
+
+        return_value = RangeSet()
+        starts1, ends1, starts2, ends2 = self.starts, self.ends, other_range_set.starts, other_range_set.ends
+        index1, index2 = 0, 0
+
+        # The ranges are added in the order of their starts, so they can be joined while they are added
+        while index1 < len(starts1) or index2 < len(starts2):
+            is_using_range1 = index2 == len(starts2) or (index1 < len(starts1) and starts1[index1] <= starts2[index2])
+
+            if is_using_range1:
+                return_value.add_range(starts1[index1], ends1[index1])
+                index1 += 1
+
+            else:
+                return_value.add_range(starts2[index2], ends2[index2])
+                index2 += 1
+
+        return return_value
+
+    def get_intersection(self, other_range_set):
+        """returns: RangeSet; the times that are in both this range set and the other_range_set"""
+
+        return_value = RangeSet()
+        starts1, ends1, starts2, ends2 = self.starts, self.ends, other_range_set.starts, other_range_set.ends
+        index1, index2 = 0, 0
+
+        while index1 < len(starts1) and index2 < len(starts2):
+            start, end = max(starts1[index1], starts2[index2]), min(ends1[index1], ends2[index2])
+
+            if start <= end:
+                return_value.starts.append(start)
+                return_value.ends.append(end)
+
+            # The range that ends first can't overlap with any more of the other range set's ranges
+            if ends1[index1] <= ends2[index2]:
+                index1 += 1
+
+            else:
+                index2 += 1
+
+        return return_value
+
+    def get_earliest_common_time(self, other_range_set):
+        """returns: double; the first time that is in both this range set and the other_range_set (None if there isn't one)"""
+
+        starts1, ends1, starts2, ends2 = self.starts, self.ends, other_range_set.starts, other_range_set.ends
+        index1, index2 = 0, 0
+
+        # The same as get_intersection(), but the first range of the intersection has the earliest time
+        while index1 < len(starts1) and index2 < len(starts2):
+            start = starts1[index1] if starts1[index1] > starts2[index2] else starts2[index2]
+
+            if start <= ends1[index1] and start <= ends2[index2]:
+                return start
+
+            if ends1[index1] <= ends2[index2]:
+                index1 += 1
+
+            else:
+                index2 += 1
+
+        return None
+
+    def get_ranges(self):
+        """returns: List of Range; the ranges of this range set"""
+
+        return [Range(self.starts[x], self.ends[x]) for x in range(len(self.starts))]
+
+    def is_empty(self):
+        """returns: boolean; if this range set has no ranges"""
+
+        return len(self.starts) == 0
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __contains__(self, number):
+        """returns: boolean; if the number is within one of the ranges"""
+
+        # The last range that starts at or before the number is the only one that could contain it
+        index = bisect_right(self.starts, number) - 1
+        return index >= 0 and number <= self.ends[index]
+
+    def __str__(self):
+        return ", ".join(f"{self.starts[x]} -> {self.ends[x]}" for x in range(len(self.starts)))
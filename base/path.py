@@ -1,6 +1,8 @@
+from bisect import bisect_left, bisect_right
 from copy import deepcopy
 
-from base.equations import LineSegment, Point
+from base.equations import LineSegment, Point, DrawnLine
+from base.utility_classes import HistoryKeeper
 from base.utility_functions import max_value, get_leftmost_object, get_distance
 from base.velocity_calculator import VelocityCalculator
 from gui_components.component import Component
@@ -66,10 +68,8 @@ class Path(Component):
             y_coordinate_line = self.path_lines[x].y_coordinate_line
             bottom_line = self.path_lines[x].bottom_line
 
-            y_coordinate_line.color = distinct_colors[x % 22]
-            bottom_line.color = distinct_colors[x % 22]
-            y_coordinate_line.render()
-            bottom_line.render()
+            DrawnLine(y_coordinate_line, distinct_colors[x % 22]).render()
+            DrawnLine(bottom_line, distinct_colors[x % 22]).render()
 
     def get_start_points(self):
         """returns: List of Point; [y_coordinate start point, bottom start point] for the first y_coordinate_line and bottom_line
@@ -141,80 +141,176 @@ class Path(Component):
             line = self.path_lines[x].__dict__[line_type]
             time = times[x]
 
-            return_value.add_point(Point(time, line.start_point.__dict__[coordinate_type]))
+            return_value.add_point(Point(time, getattr(line.start_point, coordinate_type)))
 
         last_line = self.path_lines[len(self.path_lines) - 1].__dict__[line_type]
         last_time = times[len(times) - 1]
-        return_value.add_point(Point(last_time, last_line.end_point.__dict__[coordinate_type]))
+        return_value.add_point(Point(last_time, getattr(last_line.end_point, coordinate_type)))
 
 class SimplePath:
-    """A simple path that doesn't care about length or height of the object"""
-
-    lines = []
+    """A simple path that doesn't care about length or height of the object; the points are stored in flat lists along
+    with the slope and y_intercept of the line between each point and the next one, so no LineSegments have to be made
+    unless get_lines() is called. If the x_coordinates only increase (the paths that use time as the x coordinate) finding the
+    line at an x_coordinate is a binary search"""
+
+    x_coordinates = []
+    y_coordinates = []
+    slopes = []
+    y_intercepts = []
+    # If each line was vertical or horizontal before its end point was moved (see Segment)
+    line_is_vertical = []
+    line_is_horizontal = []
+    # If every point's x_coordinate is bigger than the last point's; otherwise every line has to be checked
+    is_increasing = True
+    # The LineSegments of this path (only made when get_lines() is called)
+    lines = None
     last_point = None
 
     def __init__(self, start_point=None):
         """Initializes the object"""
 
+        self.x_coordinates = [start_point.x_coordinate] if start_point is not None else []
+        self.y_coordinates = [start_point.y_coordinate] if start_point is not None else []
+        self.slopes, self.y_intercepts = [], []
+        self.line_is_vertical, self.line_is_horizontal = [], []
         self.last_point = start_point
-        self.lines = []
 
     def add_point(self, point):
         """Adds the point to this path"""
 
+        x_coordinates, y_coordinates = self.x_coordinates, self.y_coordinates
+        end_x_coordinate, end_y_coordinate = point.x_coordinate, point.y_coordinate
+
         if self.last_point is not None:
-            self.lines.append(LineSegment(self.last_point, point))
-            self.last_point = point
+            start_x_coordinate, start_y_coordinate = x_coordinates[-1], y_coordinates[-1]
+            is_vertical, is_horizontal = start_x_coordinate == end_x_coordinate, start_y_coordinate == end_y_coordinate
 
-        else:
-            self.last_point = point
+            # The same as a LineSegment, so elsewhere when I am doing collisions I don't have to worry about straight lines
+            if is_vertical:
+                point.x_coordinate = end_x_coordinate = end_x_coordinate + .0000000001
+
+            if is_horizontal:
+                point.y_coordinate = end_y_coordinate = end_y_coordinate + .0000000001
+
+            slope = (start_y_coordinate - end_y_coordinate) / (start_x_coordinate - end_x_coordinate)
+            self.slopes.append(slope)
+            self.y_intercepts.append(start_y_coordinate - slope * start_x_coordinate)
+            self.line_is_vertical.append(is_vertical)
+            self.line_is_horizontal.append(is_horizontal)
+
+            if end_x_coordinate <= start_x_coordinate:
+                self.is_increasing = False
+
+        x_coordinates.append(end_x_coordinate)
+        y_coordinates.append(end_y_coordinate)
+        self.last_point = point
+
+        if self.lines is not None:
+            self.lines = None
+
+    def get_number_of_lines(self):
+        """returns: int; the number of lines of this simple path"""
+
+        return len(self.slopes)
+
+    def get_line(self, index):
+        """returns: LineSegment; the line from the point at the index to the next point"""
+
+        line = LineSegment(Point(self.x_coordinates[index], self.y_coordinates[index]),
+                           Point(self.x_coordinates[index + 1], self.y_coordinates[index + 1]))
+
+        # The end point was already moved if it was vertical or horizontal, so the LineSegment doesn't know it was
+        line.is_vertical, line.is_horizontal = self.line_is_vertical[index], self.line_is_horizontal[index]
+        return line
 
     def get_lines(self):
         """returns: List of LineSegment; the lines of this simple path"""
 
+        if self.lines is None:
+            self.lines = [self.get_line(x) for x in range(self.get_number_of_lines())]
+
         return self.lines
 
     def get_first_line(self):
-        """returns: Point; the first point of the simple path"""
+        """returns: LineSegment; the first line of the simple path"""
 
-        return self.get_lines()[0]
+        return self.get_line(0)
 
     def get_last_line(self):
-        """returns: Point; the last point of the simple path"""
+        """returns: LineSegment; the last line of the simple path"""
 
-        last_index = len(self.get_lines()) - 1
-        return self.get_lines()[last_index]
+        return self.get_line(self.get_number_of_lines() - 1)
 
     def get_y_coordinate(self, x_coordinate):
         """returns: double; the y_coordinate at that x_coordinate (MUST be a function though- one x to one y)"""
 
-        return_value = None
-
-        for line in self.lines:
-            if line.contains_x_coordinate(x_coordinate):
-                return_value = line.get_y_coordinate(x_coordinate)
-                break
-
-        return return_value
+        index = self.get_index_of_line(x_coordinate, True)
+        return self.slopes[index] * x_coordinate + self.y_intercepts[index] if index is not None else None
 
-    def __str__(self):
-        string = ""
-        for x in range(len(self.lines)):
-            string += f"{self.lines[x]} || "
+    def get_y_coordinates(self, x_coordinates):
+        """returns: List of double; the y_coordinate at each of the x_coordinates (None for the ones no line contains)"""
 
-        return string
+        return [self.get_y_coordinate(x_coordinate) for x_coordinate in x_coordinates]
 
     def is_moving_down(self, x_coordinate):
         """returns: boolean; if the slope is negative at this point"""
 
+        index = self.get_index_of_line(x_coordinate, False)
+        return not self.slopes[index] >= 0 if index is not None else None
+
+    def get_index_of_line(self, x_coordinate, is_first_line):
+        """ summary: finds the line that contains the x_coordinate (it can be off by 1 like LineSegment.contains_x_coordinate())
+
+            params:
+                x_coordinate: double; the x_coordinate that the line contains
+                is_first_line: boolean; if the first line that contains the x_coordinate should be found (otherwise the last)
+
+            returns: int; the index of the line (None if no line contains the x_coordinate)
+        """
+
+        if not self.is_increasing:
+            return self.find_index_of_line(x_coordinate, is_first_line)
+
+        x_coordinates, number_of_lines = self.x_coordinates, self.get_number_of_lines()
+
+        # The first line whose end is >= the x_coordinate - 1 or the last line whose start is <= the x_coordinate + 1
+        if is_first_line:
+            index = bisect_left(x_coordinates, x_coordinate, 1, number_of_lines + 1, key=lambda item: item + 1) - 1
+
+        else:
+            index = bisect_right(x_coordinates, x_coordinate, 0, number_of_lines, key=lambda item: item - 1) - 1
+
+        is_on_line = 0 <= index < number_of_lines and self.contains_x_coordinate(index, x_coordinate)
+        return index if is_on_line else None
+
+    def find_index_of_line(self, x_coordinate, is_first_line):
+        """returns: int; what get_index_of_line() returns by checking every line (used if the x_coordinates don't only increase)"""
+
         return_value = None
 
-        for line in self.lines:
-            if line.contains_x_coordinate(x_coordinate):
-                return_value = not line.slope_is_positive()
+        for x in range(self.get_number_of_lines()):
+            if self.contains_x_coordinate(x, x_coordinate):
+                return_value = x
+
+                if is_first_line:
+                    break
 
         return return_value
 
+    def contains_x_coordinate(self, index, x_coordinate, amount_off_acceptable=1):
+        """returns: boolean; if the line at the index contains the x_coordinate (see LineSegment.contains_x_coordinate())"""
+
+        start_x_coordinate, end_x_coordinate = self.x_coordinates[index], self.x_coordinates[index + 1]
+        x_min, x_max = min(start_x_coordinate, end_x_coordinate), max(start_x_coordinate, end_x_coordinate)
+        return x_min - amount_off_acceptable <= x_coordinate <= x_max + amount_off_acceptable
+
+    def __str__(self):
+        string = ""
+        for line in self.get_lines():
+            string += f"{line} || "
+
+        return string
+
 
 class VelocityPath(Path):
     """A path that takes into account velocity"""
@@ -228,7 +324,21 @@ class VelocityPath(Path):
     total_time = 0
     last_point = None
     is_unending = False
-    prev_time = 0
+    # The HistoryKeeper.get_frame_key() of the frame the path last moved forward in (it only moves forward once per frame)
+    prev_frame = None
+
+    # The start and end time of every line and the slope and y intercept of its x and y coordinate lines, so finding
+    # the coordinates at a time is a binary search and two multiplications
+    line_start_times = []
+    line_end_times = []
+    x_slopes = []
+    x_y_intercepts = []
+    y_slopes = []
+    y_y_intercepts = []
+    # If a point was added with an end time before the last one, the lines can't be binary searched
+    lines_are_sorted = True
+    # The index of the last line that was found; the time usually moves forward a little, so it is checked first
+    line_index = 0
 
     def __init__(self, start_point, other_points, velocity):
         """Initializes the object"""
@@ -238,6 +348,8 @@ class VelocityPath(Path):
         self.x_coordinate_lines = []
         self.y_coordinate_lines = []
         self.times = []
+        self.line_start_times, self.line_end_times = [], []
+        self.x_slopes, self.x_y_intercepts, self.y_slopes, self.y_y_intercepts = [], [], [], []
 
         self.last_point = start_point
 
@@ -265,6 +377,20 @@ class VelocityPath(Path):
         self.y_coordinate_lines.append(y_coordinate_line)
         self.last_end_time = end_time
 
+        # The times come from the line because LineSegment moves the end point a tiny bit if the line is vertical
+        start_time, line_end_time = y_coordinate_line.start_point.x_coordinate, y_coordinate_line.end_point.x_coordinate
+        is_before_last_line = len(self.line_start_times) != 0 and start_time < self.line_start_times[len(self.line_start_times) - 1]
+
+        if is_before_last_line or line_end_time < start_time:
+            self.lines_are_sorted = False
+
+        self.line_start_times.append(start_time)
+        self.line_end_times.append(line_end_time)
+        self.x_slopes.append(x_coordinate_line.slope)
+        self.x_y_intercepts.append(x_coordinate_line.y_intercept)
+        self.y_slopes.append(y_coordinate_line.slope)
+        self.y_y_intercepts.append(y_coordinate_line.y_intercept)
+
         # The height for the path_line doesn't matter
         path_line = PathLine(LineSegment(self.last_point, point), 0)
         self.path_lines.append(path_line)
@@ -274,9 +400,11 @@ class VelocityPath(Path):
     def get_coordinates(self):
         """returns: [x_coordinate, y_coordinate] for that time"""
 
-        if self.prev_time != VelocityCalculator.time:
+        frame_key = HistoryKeeper.get_frame_key()
+
+        if self.prev_frame != frame_key:
             self.total_time += VelocityCalculator.time
-            self.prev_time = VelocityCalculator.time
+            self.prev_frame = frame_key
 
         max_time = self.last_end_time
 
@@ -289,12 +417,50 @@ class VelocityPath(Path):
         """returns: double; the coordinates at that time"""
 
         index = self.get_index_of_line(time)
-        x_coordinate_line = self.x_coordinate_lines[index]
-        y_coordinate_line = self.y_coordinate_lines[index]
-        return [x_coordinate_line.get_y_coordinate(time), y_coordinate_line.get_y_coordinate(time)]
+        return [self.x_slopes[index] * time + self.x_y_intercepts[index], self.y_slopes[index] * time + self.y_y_intercepts[index]]
+
+    def get_coordinates_at(self, times):
+        """ summary: finds the coordinates at every time without moving the path forward (for planning); times that are
+            past the end of an unending path wrap around like get_coordinates() and sorted times are the fastest
+
+            params:
+                times: List of double; the times the coordinates are found at
+
+            returns: List of List of double; [x_coordinate, y_coordinate] at each time
+        """
+
+        max_time = self.last_end_time
+        wraps = self.is_unending and max_time > 0
+        return [self._get_coordinates(time % max_time if wraps and time > max_time else time) for time in times]
 
     def get_index_of_line(self, time):
-        """returns: int; the index of the line that the path is currently on"""
+        """returns: int; the index of the last line that contains the time (the last line if none do)"""
+
+        if not self.lines_are_sorted:
+            return self.find_index_of_line(time)
+
+        line_start_times = self.line_start_times
+        index = self.line_index
+
+        # The time usually is on the same line as last time or the next one
+        if not self.is_on_line(index, time):
+            index = index + 1 if self.is_on_line(index + 1, time) else bisect_right(line_start_times, time) - 1
+
+        if index < 0 or time > self.line_end_times[index]:
+            return len(line_start_times) - 1
+
+        self.line_index = index
+        return index
+
+    def is_on_line(self, index, time):
+        """returns: boolean; if the line at the index is the last line that starts at or before the time"""
+
+        number_of_lines = len(self.line_start_times)
+        is_after_start = index < number_of_lines and self.line_start_times[index] <= time
+        return is_after_start and (index + 1 == number_of_lines or time < self.line_start_times[index + 1])
+
+    def find_index_of_line(self, time):
+        """returns: int; what get_index_of_line() returns by checking every line (used if the lines aren't sorted)"""
 
         return_value = len(self.x_coordinate_lines) - 1
 
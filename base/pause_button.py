@@ -21,6 +21,9 @@ class PauseButton(ClickableComponent):
             returns: None
         """
 
+        if not game_window.is_rendering:
+            return
+
         # A pause button is made up of two rectangles of equal length and height
         rectangle_length = VelocityCalculator.give_measurement(screen_length, .7)
 
@@ -240,10 +240,10 @@ class PhysicsPath(PhysicsEquation):
 
         # Decides if it is just using the velocity or both velocity and acceleration
         if should_change_player_coordinates and not is_using_everything:
-            self.game_object.__dict__[self.attribute_modifying] += self.get_distance_from_velocity()
+            setattr(self.game_object, self.attribute_modifying, getattr(self.game_object, self.attribute_modifying) + self.get_distance_from_velocity())
 
         elif should_change_player_coordinates:
-            self.game_object.__dict__[self.attribute_modifying] = self.get_distance(self.current_time)
+            setattr(self.game_object, self.attribute_modifying, self.get_distance(self.current_time))
 
     def start(self):
         """Starts the physics path"""
@@ -0,0 +1,57 @@
+class SimulationClock:
+    """Turns the time that has passed into a number of fixed length simulation steps, so every step moves the game
+    forward the same amount no matter how long a frame took; slow frames run more steps (up to max_steps_per_render)
+    instead of taking bigger steps, and the time that is left over gives how far between the last two steps the game
+    should be drawn"""
+
+    timestep = 1 / 60
+    # After this many steps the time that is left is dropped, so the game slows down instead of never catching up
+    max_steps_per_render = 5
+    accumulator = 0
+    last_time = None
+
+    def __init__(self, timestep=1 / 60, max_steps_per_render=5):
+        """ summary: initializes the object
+
+            params:
+                timestep: float; the seconds that each simulation step takes
+                max_steps_per_render: int; the most steps that can be run before the game is drawn again
+
+            returns: None
+        """
+
+        self.timestep, self.max_steps_per_render = timestep, max_steps_per_render
+        self.accumulator, self.last_time = 0, None
+
+    def get_number_of_steps(self, current_time):
+        """ summary: adds the time since the last call to the accumulator and takes the steps that fit in it out of it
+
+            params:
+                current_time: float; the time in seconds (from time.time())
+
+            returns: int; how many simulation steps should be run before the game is drawn
+        """
+
+        # The first call starts the clock with one step, so the game is drawn right away
+        time_passed = current_time - self.last_time if self.last_time is not None else self.timestep
+        self.last_time = current_time
+        self.accumulator += time_passed
+
+        number_of_steps = min(int(self.accumulator // self.timestep), self.max_steps_per_render)
+        self.accumulator -= number_of_steps * self.timestep
+
+        # The time the skipped steps would have taken can't be made up, so it is dropped
+        if number_of_steps == self.max_steps_per_render:
+            self.accumulator %= self.timestep
+
+        return number_of_steps
+
+    def get_interpolation(self):
+        """returns: float; how far (0 - 1) the time left over is between the last step and the next step"""
+
+        return min(self.accumulator / self.timestep, 1)
+
+    def get_time_until_next_step(self):
+        """returns: float; the seconds until there is enough time for another step"""
+
+        return max(self.timestep - self.accumulator, 0)
@@ -0,0 +1,35 @@
+import time
+import unittest
+
+from base.background_worker import BackgroundWorker
+
+
+class BackgroundWorkerTests(unittest.TestCase):
+    def test_background_worker(self):
+        background_worker = BackgroundWorker()
+        gotten_outputs = []
+
+        background_worker.submit(lambda: sum(range(1000)))
+
+        while background_worker.is_busy():
+            time.sleep(.001)
+
+        # The result is only given once and the worker's exceptions are raised in this thread
+        gotten_outputs += [background_worker.get_result(), background_worker.get_result()]
+        background_worker.submit(lambda: 1 / 0)
+
+        while background_worker.is_busy():
+            time.sleep(.001)
+
+        self.assertRaises(ZeroDivisionError, background_worker.get_result)
+
+        BackgroundWorker.is_threaded = False
+        background_worker.submit(lambda: "not threaded")
+        gotten_outputs.append(background_worker.get_result())
+        BackgroundWorker.is_threaded = True
+
+        self.assertEqual([499500, None, "not threaded"], gotten_outputs)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,30 @@
+import unittest
+
+from base.drawable_objects import GameObject
+
+
+class GameObjectTests(unittest.TestCase):
+    def test_only_dimensions_change_the_dimensions_version(self):
+        class Block(GameObject):
+            length = 50
+
+            def __init__(self):
+                self.height = 20
+
+        block = Block()
+        gotten_outputs = [[block.x_coordinate, block.length, block.height]]
+        versions = [block.dimensions_version]
+
+        block.color, block.name = (1, 2, 3), "block"
+        versions.append(block.dimensions_version)
+        block.length = 50
+        versions.append(block.dimensions_version)
+        block.length = 60
+        versions.append(block.dimensions_version)
+        gotten_outputs.append([versions[0] == versions[1] == versions[2], versions[2] != versions[3], block.right_edge])
+
+        self.assertEqual([[0, 50, 20], [True, True, 60]], gotten_outputs)
+
+
+if __name__ == '__main__':
+    unittest.main()
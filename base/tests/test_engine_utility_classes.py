@@ -0,0 +1,103 @@
+import unittest
+from random import Random
+
+from base.drawable_objects import GameObject
+from base.engine_utility_classes import CollisionCache, CollisionsUtilityFunctions
+from base.engines import CollisionsFinder
+from base.path import ObjectPath
+from base.velocity_calculator import VelocityCalculator
+
+
+class SweptCollisionTests(unittest.TestCase):
+    def get_random_object_paths(self, random):
+        """returns: List of GameObject; [prev_object1, object1, prev_object2, object2] two objects that both moved"""
+
+        return_value = []
+
+        for x in range(2):
+            length, height = random.uniform(1, 30), random.uniform(1, 30)
+            prev_object = GameObject(random.uniform(0, 100), random.uniform(0, 100), height, length)
+            game_object = GameObject(random.uniform(0, 100), random.uniform(0, 100), height, length)
+            prev_object.name, game_object.name = f"object{x}", f"object{x}"
+            return_value += [prev_object, game_object]
+
+        return return_value
+
+    def get_grazing_object_paths(self, random):
+        """returns: List of GameObject; [prev_object1, object1, prev_object2, object2] two objects that both moved and
+        whose corners or edges touch (or almost touch) at one instant of the cycle"""
+
+        length1, height1, length2, height2 = [random.randint(1, 20) for x in range(4)]
+        x_coordinate2, y_coordinate2 = random.randint(0, 50), random.randint(0, 50)
+        time = random.choice([.25, .5, .75, 1])
+        off_by = random.choice([0, 0, pow(10, -9), -pow(10, -9), pow(10, -4)])
+
+        # Where object1 is when one of its corners or edges is touching object2
+        x_coordinate1, y_coordinate1 = random.choice([[x_coordinate2 - length1, y_coordinate2 - height1], [x_coordinate2 + length2, y_coordinate2 + height2],
+                                                      [x_coordinate2 - length1, y_coordinate2 + height2], [x_coordinate2 + length2, y_coordinate2 - height1],
+                                                      [x_coordinate2 - length1, y_coordinate2], [x_coordinate2, y_coordinate2 - height1]])
+
+        x_change1, y_change1 = random.choice([-8, -4, 4, 8]), random.choice([-8, -4, 0, 4, 8])
+        x_change2, y_change2 = random.choice([[1, 0], [0, 2], [2, 2]])
+        prev_x_coordinate1, prev_y_coordinate1 = x_coordinate1 - x_change1 * time + off_by, y_coordinate1 - y_change1 * time
+        prev_x_coordinate2, prev_y_coordinate2 = x_coordinate2 - x_change2 * time, y_coordinate2 - y_change2 * time
+
+        return [GameObject(prev_x_coordinate1, prev_y_coordinate1, height1, length1),
+                GameObject(prev_x_coordinate1 + x_change1, prev_y_coordinate1 + y_change1, height1, length1),
+                GameObject(prev_x_coordinate2, prev_y_coordinate2, height2, length2),
+                GameObject(prev_x_coordinate2 + x_change2, prev_y_coordinate2 + y_change2, height2, length2)]
+
+    def test_swept_boxes_that_are_apart_never_collide(self):
+        VelocityCalculator.time = 1
+        random = Random(6)
+
+        for x in range(4000):
+            get_object_paths = self.get_grazing_object_paths if x % 2 == 0 else self.get_random_object_paths
+            prev_object1, object1, prev_object2, object2 = get_object_paths(random)
+
+            object1_box = CollisionsUtilityFunctions.get_swept_box(prev_object1, object1)
+            object2_box = CollisionsUtilityFunctions.get_swept_box(prev_object2, object2)
+
+            if CollisionsUtilityFunctions.swept_boxes_are_apart(object1_box, object2_box):
+                collision_time = CollisionsUtilityFunctions.get_path_collision_time(ObjectPath(prev_object1, object1), ObjectPath(prev_object2, object2))
+                self.assertEqual(-1, collision_time, f"Case {x} Failed")
+
+    def test_grazing_pair_collision_data_matches_path_collision_time(self):
+        VelocityCalculator.time = 1
+        random = Random(7)
+
+        for x in range(2000):
+            prev_object1, object1, prev_object2, object2 = self.get_grazing_object_paths(random)
+
+            collision_time = CollisionsUtilityFunctions.get_path_collision_time(ObjectPath(prev_object1, object1), ObjectPath(prev_object2, object2))
+            want = collision_time != -1 or CollisionsFinder.objects_are_touching(object1, object2)
+            got = CollisionsFinder.get_pair_collision_data(object1, object2, prev_object1, prev_object2)[0].is_collision
+
+            self.assertEqual(want, got, f"Case {x} Failed")
+
+    def test_swept_collision_data_when_no_time_has_passed(self):
+        box = [0, 0, 10, 10, 0, 0, 10, 10]
+        object1_data, object2_data = CollisionsUtilityFunctions.get_swept_collision_data(box, box, 0, False, 0)
+
+        wanted_outputs = [True, 0, 0]
+        gotten_outputs = [object1_data.is_collision, object1_data.object_xy.x_coordinate, object1_data.object_xy.y_coordinate]
+        self.assertEqual(wanted_outputs, gotten_outputs)
+
+class CollisionCacheTests(unittest.TestCase):
+    def test_collision_cache(self):
+        cache = CollisionCache()
+        object1, object2 = GameObject(0, 0, 10, 10), GameObject(5, 5, 10, 10)
+
+        cache.set(object2, object1, "object2 data", "object1 data")
+        gotten_outputs = [cache.get(object1, object2), cache.get(object2, object1)]
+        cache.start_new_frame()
+        gotten_outputs += [cache.get(object1, object2), cache.get_counters()]
+
+        wanted_outputs = ["object1 data", "object2 data", None, {"hits": 2, "misses": 1, "inserts": 1, "hit_rate": 2 / 3}]
+
+        for x in range(len(wanted_outputs)):
+            self.assertEqual(wanted_outputs[x], gotten_outputs[x], f"Test Case number {x + 1} out of {len(wanted_outputs)} is Failed")
+
+
+if __name__ == '__main__':
+    unittest.main()
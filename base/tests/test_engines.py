@@ -0,0 +1,207 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from random import Random
+
+from base.drawable_objects import GameObject
+from base.engines import CollisionsFinder, SpatialHash, SweepAndPrune, CollisionDispatcher
+from base.utility_classes import HistoryKeeper
+from base.velocity_calculator import VelocityCalculator
+
+
+def get_random_scene(number_of_objects, seed):
+    """returns: List of GameObject[]; [prev_objects, objects] the objects from last cycle and this cycle"""
+
+    random = Random(seed)
+    prev_objects, objects = [], []
+
+    for x in range(number_of_objects):
+        x_coordinate, y_coordinate = random.uniform(0, 600), random.uniform(0, 400)
+        length, height = random.uniform(5, 60), random.uniform(5, 60)
+        prev_object = GameObject(x_coordinate, y_coordinate, height, length)
+
+        # Some of the objects are stationary like the platforms are
+        x_change = random.uniform(-40, 40) if x % 3 != 0 else 0
+        y_change = random.uniform(-40, 40) if x % 3 != 0 else 0
+        game_object = GameObject(x_coordinate + x_change, y_coordinate + y_change, height, length)
+
+        prev_object.name = f"object{x}"
+        game_object.name = prev_object.name
+        prev_objects.append(prev_object)
+        objects.append(game_object)
+
+    return [prev_objects, objects]
+
+
+def simulate_game(prev_objects):
+    """Makes the prev_objects the objects from last cycle, so the collisions of this cycle can be found"""
+
+    CollisionsFinder.collision_cache.start_new_frame()
+    HistoryKeeper.reset()
+    VelocityCalculator.time = 1
+
+    for prev_object in prev_objects:
+        HistoryKeeper.add(prev_object, prev_object.name, True)
+
+    HistoryKeeper.start_new_frame()
+    VelocityCalculator.time = 2
+
+
+def get_colliding_pairs(objects):
+    """returns: Set of tuple; the (index1, index2) of every pair that collided using the nested loop"""
+
+    return_value = set()
+    for i in range(len(objects)):
+        for j in range(i + 1, len(objects)):
+            if CollisionsFinder.is_collision(objects[i], objects[j]):
+                return_value.add((i, j))
+
+    return return_value
+
+
+def get_all_collision_data(objects):
+    """returns: List of List of object; the is_collision, is_moving_collision, and object_xy of every pair of objects"""
+
+    return_value = []
+    for object1 in objects:
+        for object2 in objects:
+            if object1 is object2:
+                continue
+
+            collision_data = CollisionsFinder.get_collision_data(object1, object2)
+            object_xy = collision_data.object_xy
+            return_value.append([collision_data.is_collision, collision_data.is_moving_collision,
+                                 object_xy.x_coordinate, object_xy.y_coordinate])
+    return return_value
+
+
+class BroadPhaseTests(unittest.TestCase):
+    def test_spatial_hash_has_all_collisions(self):
+        for seed in range(5):
+            prev_objects, objects = get_random_scene(60, seed)
+            simulate_game(prev_objects)
+
+            want = get_colliding_pairs(objects)
+            candidate_pairs = SpatialHash().get_candidate_index_pairs(objects)
+            got = set(tuple(index_pair) for index_pair in candidate_pairs)
+
+            self.assertTrue(want.issubset(got), f"Seed {seed} Failed | missing pairs {want - got}")
+            self.assertTrue(len(got) < len(objects) * (len(objects) - 1) / 2, f"Seed {seed} Failed | every pair was a candidate")
+
+    def test_spatial_hash_ordered_pairs(self):
+        prev_objects, objects = get_random_scene(30, 10)
+        simulate_game(prev_objects)
+
+        index_of_object = {id(objects[x]): x for x in range(len(objects))}
+        ordered_pairs = SpatialHash().get_candidate_pairs(objects, True)
+        gotten_indexes = [(index_of_object[id(object1)], index_of_object[id(object2)]) for object1, object2 in ordered_pairs]
+
+        self.assertEqual(sorted(gotten_indexes), gotten_indexes, "The ordered pairs must be in nested loop order")
+        for index1, index2 in gotten_indexes:
+            self.assertTrue((index2, index1) in gotten_indexes, f"Missing the reverse of pair {index1, index2}")
+
+    def test_sweep_and_prune_has_all_collisions(self):
+        sweep_and_prune = SweepAndPrune()
+
+        # The same sweep and prune is used for every seed, so the endpoints from the last 'cycle' are reused
+        for seed in range(5):
+            prev_objects, objects = get_random_scene(60, seed)
+            simulate_game(prev_objects)
+
+            want = get_colliding_pairs(objects)
+            sweep_and_prune.set_objects(objects)
+            sweep_and_prune.run()
+            got = set((objects.index(object1), objects.index(object2)) for object1, object2 in sweep_and_prune.overlapping_pairs)
+
+            self.assertTrue(want.issubset(got), f"Seed {seed} Failed | missing pairs {want - got}")
+            self.assertEqual(sorted(got), [tuple(index_pair) for index_pair in SpatialHash().get_candidate_index_pairs(objects)])
+
+            endpoint_x_coordinates = [endpoint[0] for endpoint in sweep_and_prune.endpoints]
+            self.assertEqual(sorted(endpoint_x_coordinates), endpoint_x_coordinates, f"Seed {seed} Failed | endpoints aren't sorted")
+
+    def test_is_collision_matrix(self):
+        objects_a = get_random_scene(40, 20)[1]
+        objects_b = get_random_scene(25, 21)[1] + [objects_a[0]]
+
+        matrix, index_pairs = CollisionsFinder.is_collision_matrix(objects_a, objects_b)
+
+        for i in range(len(objects_a)):
+            for j in range(len(objects_b)):
+                want = CollisionsFinder.is_simple_collision(objects_a[i], objects_b[j])
+                self.assertEqual(want, matrix[i][j], f"Pair {i, j} Failed")
+                self.assertEqual(want, index_pairs.__contains__([i, j]), f"Pair {i, j} Failed | index pairs")
+
+
+class CollisionsFinderTests(unittest.TestCase):
+    def test_update_data_batch(self):
+        prev_objects, objects = get_random_scene(40, 30)
+
+        # Changing the size of some objects; the prev objects should not be changed by finding the collisions
+        for game_object in objects[::4]:
+            game_object.length += 7
+            game_object.height -= 3
+
+        simulate_game(prev_objects)
+        prev_dimensions = [[prev_object.x_coordinate, prev_object.y_coordinate, prev_object.length, prev_object.height]
+                           for prev_object in [HistoryKeeper.get_last(game_object.name) for game_object in objects]]
+        object_pairs = [[object1, object2] for object1 in objects for object2 in objects if object1 is not object2]
+
+        for object1, object2 in object_pairs:
+            CollisionsFinder.update_data(object1, object2)
+
+        wanted_outputs = get_all_collision_data(objects)
+
+        for executor in [None, ThreadPoolExecutor(4)]:
+            CollisionsFinder.collision_cache.start_new_frame()
+            CollisionsFinder.update_data_batch(object_pairs, executor, 16)
+            gotten_outputs = get_all_collision_data(objects)
+            self.assertEqual(wanted_outputs, gotten_outputs, f"Executor {executor} Failed")
+
+        gotten_prev_dimensions = [[prev_object.x_coordinate, prev_object.y_coordinate, prev_object.length, prev_object.height]
+                                  for prev_object in [HistoryKeeper.get_last(game_object.name) for game_object in objects]]
+        self.assertEqual(prev_dimensions, gotten_prev_dimensions, "The HistoryKeeper's objects were changed")
+
+
+class CollisionDispatcherTests(unittest.TestCase):
+    def test_collision_dispatcher_events(self):
+        player, wall = GameObject(0, 0, 10, 10), GameObject(25, 0, 10, 10)
+        player.name, wall.name = "player", "wall"
+        player.collision_layer, wall.collision_layer = 1, 2
+
+        gotten_events = []
+        collision_dispatcher = CollisionDispatcher()
+        collision_dispatcher.add_handler(1, 2, lambda main_object, other_object, event:
+                                         gotten_events.append([main_object.name, event, CollisionsFinder.get_contact(main_object, other_object).is_left_collision]))
+
+        # The player moves into the wall, keeps pushing through it, and then moves away from it
+        for player_x_coordinate in [0, 20, 22, 60, 100]:
+            prev_player = GameObject(player.x_coordinate, player.y_coordinate, player.height, player.length)
+            prev_player.name = player.name
+            simulate_game([prev_player, wall])
+            player.x_coordinate = player_x_coordinate
+            collision_dispatcher.run([player, wall])
+
+            if CollisionsFinder.is_collision(player, wall):
+                # Only the perspective that was asked for is found
+                self.assertIsNone(CollisionsFinder.collision_cache.get_contact(wall, player))
+                contact = CollisionsFinder.get_contact(player, wall)
+                self.assertEqual([CollisionsFinder.is_left_collision(player, wall), CollisionsFinder.is_right_collision(player, wall),
+                                  CollisionsFinder.is_top_collision(player, wall), CollisionsFinder.is_bottom_collision(player, wall)],
+                                 [contact.is_left_collision, contact.is_right_collision, contact.is_top_collision, contact.is_bottom_collision])
+
+        wanted_events = [["player", CollisionDispatcher.Events.ENTER, True], ["player", CollisionDispatcher.Events.STAY, False],
+                         ["player", CollisionDispatcher.Events.STAY, False], ["player", CollisionDispatcher.Events.EXIT, False]]
+        self.assertEqual(wanted_events, gotten_events)
+
+    def test_collision_dispatcher_collision_masks(self):
+        collision_dispatcher = CollisionDispatcher()
+        collision_dispatcher.add_handler(1, 4, lambda main_object, other_object, event: None)
+        collision_dispatcher.add_handler(2, 4, lambda main_object, other_object, event: None)
+        collision_dispatcher.add_handler(2, 1, lambda main_object, other_object, event: None)
+
+        wanted_outputs = [4 | 2, 4 | 1, 1 | 2, 0]
+        gotten_outputs = [collision_dispatcher.get_collision_mask(layer) for layer in [1, 2, 4, 8]]
+        self.assertEqual(wanted_outputs, gotten_outputs)
+
+
+if __name__ == '__main__':
+    unittest.main()
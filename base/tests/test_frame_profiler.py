@@ -0,0 +1,33 @@
+import json
+import os
+import tempfile
+import unittest
+
+from base.frame_profiler import FrameProfiler
+
+
+class FrameProfilerTests(unittest.TestCase):
+    def test_frame_profiler(self):
+        FrameProfiler.enable(number_of_frames_kept=100)
+
+        # The section takes 1 - 100 milliseconds (the first 50 frames are dropped because only 100 are kept)
+        for x in range(-49, 101):
+            start_time = FrameProfiler.start()
+            FrameProfiler.end("section", start_time - max(x, 0) / 1000)
+            FrameProfiler.start_new_frame()
+
+        FrameProfiler.disable()
+        trace_path = os.path.join(tempfile.mkdtemp(), "trace.json")
+        FrameProfiler.export_chrome_trace(trace_path)
+
+        with open(trace_path) as file:
+            trace_events = json.load(file)["traceEvents"]
+
+        self.assertEqual([50, 95, 99], [round(frame_time) for frame_time in FrameProfiler.get_percentiles("section")])
+        self.assertEqual(0, FrameProfiler.start(), "The clock was read while the FrameProfiler was disabled")
+        self.assertEqual([150, "X"], [len(trace_events), trace_events[-1]["ph"]])
+        self.assertAlmostEqual(100000, trace_events[-1]["dur"], delta=100)
+
+
+if __name__ == '__main__':
+    unittest.main()
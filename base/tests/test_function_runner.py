@@ -0,0 +1,39 @@
+import unittest
+
+from base.drawable_objects import GameObject
+from base.function_runner import FunctionRunner
+from base.utility_classes import HistoryKeeper
+
+
+class FunctionRunnerTests(unittest.TestCase):
+    def test_tracked_objects_are_only_copied_if_changed(self):
+        HistoryKeeper.reset()
+        function_runner = FunctionRunner()
+        platform, player = GameObject(0, 0, 10, 10), GameObject(0, 0, 10, 10)
+        function_runner.track_game_object(platform)
+        function_runner.track_game_object(player)
+
+        gotten_outputs = []
+        for x in range(3):
+            platform_version = platform.dimensions_version
+            platform.x_coordinate = 0
+            player.x_coordinate = x * 5
+            function_runner.run()
+            HistoryKeeper.start_new_frame()
+
+            gotten_outputs.append([platform.dimensions_version == platform_version, HistoryKeeper.get_last(platform.name).x_coordinate,
+                                   HistoryKeeper.get_last(player.name).x_coordinate])
+
+        function_runner.untrack_game_object(player)
+        function_runner.run()
+        HistoryKeeper.start_new_frame()
+        gotten_outputs.append([HistoryKeeper.get_last(platform.name) is not None, HistoryKeeper.get_last(player.name)])
+
+        wanted_outputs = [[True, 0, 0], [True, 0, 5], [True, 0, 10], [True, None]]
+
+        for x in range(len(wanted_outputs)):
+            self.assertEqual(wanted_outputs[x], gotten_outputs[x], f"Test Case number {x + 1} out of {len(wanted_outputs)} is Failed")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,26 @@
+import unittest
+
+from base.geometry import Point, Segment, Polyline
+
+
+class GeometryTests(unittest.TestCase):
+    def test_geometry_segments(self):
+        polyline = Polyline([Point(0, 0), Point(10, 20), Point(10, 40), Point(30, 40)])
+        slanted_segment, vertical_segment, horizontal_segment = polyline.get_segments()
+
+        wanted_outputs = [[2, 0, False, False], [True, False], [False, True], True, False, True]
+        gotten_outputs = [[slanted_segment.slope, slanted_segment.y_intercept, slanted_segment.is_vertical, slanted_segment.is_horizontal],
+                          [vertical_segment.is_vertical, vertical_segment.is_horizontal],
+                          [horizontal_segment.is_vertical, horizontal_segment.is_horizontal],
+                          slanted_segment.contains_point(Point(5, 10), .001), slanted_segment.contains_point(Point(5, 12), .001),
+                          vertical_segment.contains_point(Point(10, 30), .001)]
+
+        self.assertEqual(wanted_outputs, gotten_outputs)
+
+        # The geometry is made many times every frame, so it can't carry a __dict__ (or any gui state)
+        self.assertFalse(hasattr(Segment(Point(0, 0), Point(1, 1)), "__dict__"))
+        self.assertFalse(hasattr(Point(0, 0), "__dict__"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+import os
+import random
+import tempfile
+import unittest
+from random import Random
+
+import pygame
+
+from base.input_recorder import InputRecorder
+from base.velocity_calculator import VelocityCalculator
+
+
+class InputRecorderTests(unittest.TestCase):
+    def test_input_recorder_replays_the_recording(self):
+        # The mouse's buttons can't be read until pygame is initialized (the games do it in important_variables)
+        pygame.init()
+        log_path = os.path.join(tempfile.mkdtemp(), "input.log")
+        real_get_pressed, real_get_pos = pygame.key.get_pressed, pygame.mouse.get_pos
+        wanted_outputs, gotten_outputs = [], []
+
+        InputRecorder.start_recording(log_path, 7)
+        wanted_random_number = Random(7).random()
+
+        for x in range(20):
+            scancodes = [x, x + 100]
+            pygame.key.get_pressed = lambda: pygame.key.ScancodeWrapper([scancode in scancodes for scancode in range(512)])
+            pygame.mouse.get_pos = lambda: (x * 3, -x)
+            VelocityCalculator.time = 1 / 60 + x * 1e-3
+            InputRecorder.run()
+            wanted_outputs.append([scancodes, (x * 3, -x), VelocityCalculator.time])
+
+        InputRecorder.stop()
+        pygame.key.get_pressed, pygame.mouse.get_pos = real_get_pressed, real_get_pos
+
+        InputRecorder.start_replaying(log_path)
+        gotten_random_number = random.random()
+
+        while InputRecorder.run():
+            pressed_keys = pygame.key.get_pressed()
+            gotten_outputs.append([[scancode for scancode, is_pressed in enumerate(pressed_keys) if is_pressed],
+                                   pygame.mouse.get_pos(), VelocityCalculator.time])
+
+        self.assertEqual(wanted_outputs, gotten_outputs)
+        self.assertEqual(wanted_random_number, gotten_random_number)
+        # The replay puts pygame's functions back once it ends
+        self.assertIs(real_get_pressed, pygame.key.get_pressed)
+
+
+if __name__ == '__main__':
+    unittest.main()
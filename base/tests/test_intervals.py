@@ -0,0 +1,44 @@
+import unittest
+from random import Random
+
+from base.intervals import RangeSet
+from base.utility_classes import Range
+
+
+class RangeSetTests(unittest.TestCase):
+    def test_range_set(self):
+        random = Random(4)
+
+        for x in range(500):
+            all_ranges = []
+
+            for y in range(2):
+                # Whole numbers make ranges that touch or start at the same time
+                all_ranges.append([Range(*sorted([random.choice([0, 1, 2, random.uniform(0, 3)]) for z in range(2)]))
+                                   for z in range(random.randint(0, 5))])
+
+            ranges1, ranges2 = all_ranges
+            range_set1, range_set2 = RangeSet(ranges1), RangeSet(ranges2)
+            union, intersection = range_set1.get_union(range_set2), range_set1.get_intersection(range_set2)
+
+            common_times = [max(range1.start, range2.start) for range1 in ranges1 for range2 in ranges2
+                            if max(range1.start, range2.start) <= min(range1.end, range2.end)]
+
+            wanted_outputs = min(common_times) if len(common_times) != 0 else None
+            self.assertEqual(wanted_outputs, range_set1.get_earliest_common_time(range_set2))
+
+            for time in [random.uniform(-.5, 3.5) for y in range(5)] + [0, 1, 2]:
+                is_in_ranges1 = any(time in range1 for range1 in ranges1)
+                is_in_ranges2 = any(time in range2 for range2 in ranges2)
+
+                wanted_outputs = [is_in_ranges1, is_in_ranges1 or is_in_ranges2, is_in_ranges1 and is_in_ranges2]
+                gotten_outputs = [time in range_set1, time in union, time in intersection]
+                self.assertEqual(wanted_outputs, gotten_outputs)
+
+            # The ranges are sorted and none of them overlap or touch
+            for y in range(len(union) - 1):
+                self.assertLess(union.ends[y], union.starts[y + 1])
+
+
+if __name__ == '__main__':
+    unittest.main()
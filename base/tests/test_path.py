@@ -0,0 +1,84 @@
+import unittest
+from random import Random
+
+from base.engine_utility_classes import CollisionsUtilityFunctions
+from base.equations import Point
+from base.path import VelocityPath, SimplePath
+
+
+class VelocityPathTests(unittest.TestCase):
+    def test_velocity_path_line_lookup(self):
+        random = Random(2)
+
+        for x in range(100):
+            path = VelocityPath(Point(random.uniform(0, 500), random.uniform(0, 500)), [], random.uniform(50, 500))
+
+            for y in range(random.randint(1, 12)):
+                point = Point(random.uniform(0, 500), random.uniform(0, 500))
+                kind_of_point = random.random()
+
+                # Points that take no time and points that end before the last one are the tricky cases
+                if kind_of_point < .15:
+                    path.add_time_point(Point(path.last_point.x_coordinate, path.last_point.y_coordinate), path.last_end_time)
+
+                elif kind_of_point < .2:
+                    path.add_time_point(point, path.last_end_time - random.uniform(0, 1))
+
+                else:
+                    path.add_point(point)
+
+            times = sorted([random.uniform(-1, path.last_end_time + 1) for y in range(30)]) + path.line_start_times
+
+            for time in times + [random.uniform(-1, path.last_end_time + 1) for y in range(30)]:
+                index = path.find_index_of_line(time)
+                wanted_outputs = [index, [path.x_coordinate_lines[index].get_y_coordinate(time), path.y_coordinate_lines[index].get_y_coordinate(time)]]
+                gotten_outputs = [path.get_index_of_line(time), path.get_coordinates_at([time])[0]]
+
+                self.assertEqual(wanted_outputs, gotten_outputs)
+
+    def test_velocity_path_get_coordinates_at_wraps_unending_paths(self):
+        path = VelocityPath(Point(0, 0), [Point(100, 0), Point(0, 0)], 100)
+        path.is_unending = True
+
+        gotten_outputs = [[round(x_coordinate), round(y_coordinate)] for x_coordinate, y_coordinate in path.get_coordinates_at([.5, 1.5, 2.5, 4.25])]
+        self.assertEqual([[50, 0], [50, 0], [50, 0], [25, 0]], gotten_outputs)
+
+
+class SimplePathTests(unittest.TestCase):
+    def test_simple_path_collision_times(self):
+        random = Random(3)
+
+        for x in range(300):
+            paths = []
+
+            for y in range(2):
+                path = SimplePath(Point(0, random.choice([random.uniform(0, 10), 5])))
+                time = 0
+
+                # Points at the same time, at the same y_coordinate, and going back in time are the tricky cases
+                for z in range(random.randint(0, 8)):
+                    time += random.choice([0, random.uniform(0, .3)]) if random.random() < .9 else -random.uniform(0, .2)
+                    path.add_point(Point(time, random.choice([random.uniform(0, 10), 5, path.y_coordinates[-1]])))
+
+                paths.append(path)
+
+            path1, path2 = paths
+            wanted_outputs = []
+
+            for line1 in path1.get_lines():
+                for line2 in path2.get_lines():
+                    collision_point = CollisionsUtilityFunctions.get_line_collision_point(line1, line2)
+                    wanted_outputs += [collision_point.x_coordinate] if collision_point is not None else []
+
+            self.assertEqual(wanted_outputs, CollisionsUtilityFunctions.get_path_collision_times(path1, path2))
+
+            for time in [random.uniform(-2, 4) for y in range(10)]:
+                first_index, last_index = path1.find_index_of_line(time, True), path1.find_index_of_line(time, False)
+                wanted_outputs = [path1.get_lines()[first_index].get_y_coordinate(time) if first_index is not None else None,
+                                  not path1.get_lines()[last_index].slope_is_positive() if last_index is not None else None]
+
+                self.assertEqual(wanted_outputs, [path1.get_y_coordinate(time), path1.is_moving_down(time)])
+
+
+if __name__ == '__main__':
+    unittest.main()
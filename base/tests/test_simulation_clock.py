@@ -0,0 +1,21 @@
+import unittest
+
+from base.simulation_clock import SimulationClock
+
+
+class SimulationClockTests(unittest.TestCase):
+    def test_simulation_clock(self):
+        simulation_clock = SimulationClock(.25, 5)
+        wanted_outputs = [[1, 0], [0, .5], [2, 0], [5, .5], [1, .5]]
+        gotten_outputs = []
+
+        # A normal frame, a short frame, a slow frame and then a very slow frame (steps past the 5th are dropped)
+        for current_time in [100, 100.125, 100.5, 102.625, 102.875]:
+            number_of_steps = simulation_clock.get_number_of_steps(current_time)
+            gotten_outputs.append([number_of_steps, round(simulation_clock.get_interpolation(), 6)])
+
+        self.assertEqual(wanted_outputs, gotten_outputs)
+
+
+if __name__ == '__main__':
+    unittest.main()
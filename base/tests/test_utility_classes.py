@@ -0,0 +1,78 @@
+import unittest
+
+from base.drawable_objects import GameObject
+from base.equations import Point
+from base.path import VelocityPath
+from base.utility_classes import HistoryKeeper, RecordPool, Range
+from base.velocity_calculator import VelocityCalculator
+
+
+class RecordPoolTests(unittest.TestCase):
+    def test_record_pool(self):
+        record_pool = RecordPool(Range, 2)
+        first_ranges = [record_pool.get(0, 1), record_pool.get(2, 3), record_pool.get(4, 5)]
+        record_pool.start_new_frame()
+        second_ranges = [record_pool.get(6, 7), record_pool.get(8, 9), record_pool.get(10, 11)]
+
+        # Only two records can be pooled, so the third record is allocated every frame
+        wanted_outputs = [True, True, False, [6, 7, 8, 9, 10, 11], 4]
+        gotten_outputs = [second_ranges[0] is first_ranges[1], second_ranges[1] is first_ranges[0], second_ranges[2] is first_ranges[2],
+                          [number for time_range in second_ranges for number in [time_range.start, time_range.end]], record_pool.allocations]
+
+        for x in range(len(wanted_outputs)):
+            self.assertEqual(wanted_outputs[x], gotten_outputs[x], f"Test Case number {x + 1} out of {len(wanted_outputs)} is Failed")
+
+
+class HistoryKeeperTests(unittest.TestCase):
+    def test_history_keeper_ring_buffer(self):
+        HistoryKeeper.reset()
+        game_object = GameObject(0, 0, 10, 10)
+
+        # On the first frame there is no last frame even though the unused slots have a frame of -1
+        HistoryKeeper.add(game_object, "game_object", True)
+        self.assertIsNone(HistoryKeeper.get_last("game_object"), "An object was found before the first frame")
+
+        for x in range(6):
+            game_object.x_coordinate = x
+            HistoryKeeper.add(game_object, "game_object", True)
+            HistoryKeeper.start_new_frame()
+
+        # Only depth - 1 frames back can be gotten, since the current frame uses the last spot in the ring buffer
+        wanted_outputs = [5, 5, 4, 3, None, None]
+        gotten_outputs = [HistoryKeeper.get_last("game_object").x_coordinate] + [HistoryKeeper.get_n_back("game_object", x).x_coordinate for x in range(1, 4)]
+        gotten_outputs += [HistoryKeeper.get_n_back("game_object", 4), HistoryKeeper.get_n_back("game_object", 0)]
+        wanted_outputs.append(5)
+        gotten_outputs.append(HistoryKeeper.get_columns(1)[0][HistoryKeeper.get_slot("game_object", 1)])
+
+        for x in range(len(wanted_outputs)):
+            self.assertEqual(wanted_outputs[x], gotten_outputs[x], f"Test Case number {x + 1} out of {len(wanted_outputs)} is Failed")
+
+        max_objects = HistoryKeeper.max_objects
+        HistoryKeeper.max_objects = 10
+        for x in range(25):
+            HistoryKeeper.add(game_object, f"object{x}", True)
+
+        self.assertTrue(len(HistoryKeeper.name_to_slot) <= 10, "The HistoryKeeper stored more than max_objects")
+        self.assertTrue(HistoryKeeper.get_n_back("object24", 0) is not None, "The newest object was removed")
+        HistoryKeeper.max_objects = max_objects
+
+    def test_history_keeper_reset_starts_the_frames_over(self):
+        HistoryKeeper.reset()
+        VelocityCalculator.time = 1
+        path = VelocityPath(Point(0, 0), [Point(100, 0)], 10)
+
+        # The path moves forward once per frame, so it has to know that frame 0 after a reset is a new frame
+        gotten_outputs = []
+
+        for x in range(3):
+            gotten_outputs.append(path.get_coordinates()[0])
+            HistoryKeeper.start_new_frame()
+
+        HistoryKeeper.reset()
+        gotten_outputs += [HistoryKeeper.frame, path.get_coordinates()[0]]
+
+        self.assertEqual([10, 20, 30, 0, 40], [round(x_coordinate) for x_coordinate in gotten_outputs])
+
+
+if __name__ == '__main__':
+    unittest.main()
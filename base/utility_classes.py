@@ -1,4 +1,5 @@
-from base.drawable_objects import GameObject
+from array import array
+
 from base.velocity_calculator import VelocityCalculator
 
 
@@ -19,11 +20,90 @@ class HistoryKeeperObject:
         self.time = VelocityCalculator.time
 
 
-class HistoryKeeper:
-    """Stores the values of past objects"""
+class Snapshot:
+    """A read only view of a GameObject's x_coordinate, y_coordinate, length, and height from a past frame; the values
+    are read from HistoryKeeper's columns, so it is only valid until its spot in the ring buffer is used again"""
+
+    __slots__ = ("columns", "slot", "name")
+
+    def __init__(self, columns, slot):
+        """Initializes the object"""
+
+        self.columns, self.slot, self.name = columns, slot, ""
+
+    @property
+    def x_coordinate(self):
+        return self.columns[0][self.slot]
+
+    @property
+    def y_coordinate(self):
+        return self.columns[1][self.slot]
+
+    @property
+    def length(self):
+        return self.columns[2][self.slot]
+
+    @property
+    def height(self):
+        return self.columns[3][self.slot]
+
+    @property
+    def right_edge(self):
+        """The x_coordinate + length is what constitutes the object's right_edge"""
+
+        return self.columns[0][self.slot] + self.columns[2][self.slot]
 
-    last_objects = {}
-    times = []
+    @property
+    def bottom(self):
+        """The y_coordinate + height is what constitutes the object's bottom"""
+
+        return self.columns[1][self.slot] + self.columns[3][self.slot]
+
+    @property
+    def x_midpoint(self):
+        """The x_coordinate + length / 2 is what constitutes the object's x_midpoint"""
+
+        return self.columns[0][self.slot] + self.columns[2][self.slot] / 2
+
+    @property
+    def y_midpoint(self):
+        """The y_coordinate + height / 2 is what constitutes the object's y_midpoint"""
+
+        return self.columns[1][self.slot] + self.columns[3][self.slot] / 2
+
+    def __str__(self):
+        return f"name {self.name} x {self.x_coordinate} y {self.y_coordinate} length {self.length} height {self.height} bottom {self.bottom} right_edge {self.right_edge}\n"
+
+
+class HistoryKeeper:
+    """Stores the values of past objects for the last 'depth' frames, so the memory it uses is bounded. GameObjects are
+    stored in columns (an array for the x_coordinates, y_coordinates, lengths, and heights) where each object has
+    its own slot, so adding them doesn't allocate anything; other objects are stored in a ring buffer for each object"""
+
+    # One item for each spot in the ring buffer (frame % depth): [x_coordinates, y_coordinates, lengths, heights, frames]
+    # where frames is the frame each slot's values were added in
+    columns = []
+    # One item for each spot in the ring buffer: the Snapshot of each slot (they are reused every time the spot is)
+    snapshots = []
+    name_to_slot = {}
+    # slot -> the name of the object in that slot (None if no object is in that slot)
+    slot_names = []
+    # slot -> the dimensions_version the GameObject had when it was last added (see add_if_changed())
+    slot_versions = array("q")
+    free_slots = []
+    # name -> [frames, objects] for objects that aren't GameObjects; index is frame % depth
+    name_to_objects = {}
+    # The frame that objects are being added to; start_new_frame() increases it by 1 and reset() sets it back to 0
+    frame = 0
+    # How many times reset() has been called; frame starts over after a reset, so anything remembered for a frame should
+    # use get_frame_key() to know which frame it was from
+    times_reset = 0
+    # How many frames are stored for each object (the current frame and depth - 1 past frames)
+    depth = 4
+    # Once this many objects (GameObjects or other objects) are stored the ones that haven't been added in 'depth'
+    # frames are removed and if that isn't enough the ones that were least recently stored are removed
+    max_objects = 5000
+    # The VelocityCalculator.time of the last frame
     last_time = 0
 
     def reset():
@@ -32,8 +112,27 @@ class HistoryKeeper:
             returns: None
         """
 
-        HistoryKeeper.last_objects = {}
-        HistoryKeeper.times = []
+        HistoryKeeper.columns = [[array("d"), array("d"), array("d"), array("d"), array("q")] for x in range(HistoryKeeper.depth)]
+        HistoryKeeper.snapshots = [[] for x in range(HistoryKeeper.depth)]
+        HistoryKeeper.name_to_slot, HistoryKeeper.slot_names, HistoryKeeper.free_slots = {}, [], []
+        HistoryKeeper.slot_versions = array("q")
+        HistoryKeeper.name_to_objects = {}
+        HistoryKeeper.frame = 0
+        HistoryKeeper.times_reset += 1
+
+    def get_frame_key():
+        """returns: tuple of int; (times_reset, frame) which is different for every frame even if the HistoryKeeper was reset"""
+
+        return (HistoryKeeper.times_reset, HistoryKeeper.frame)
+
+    def start_new_frame():
+        """ summary: makes the objects added this frame be the 'last' objects; should be called once every frame
+            params: None
+            returns: None
+        """
+
+        HistoryKeeper.frame += 1
+        HistoryKeeper.last_time = VelocityCalculator.time
 
     def add(object, name, is_game_object):
         """ summary: adds the object to the HistoryKeeper; IMPORTANT: make sure to provide a unique name for each unique object!
@@ -44,15 +143,164 @@ class HistoryKeeper:
             returns: None
         """
 
-        added_object = object
+        index = HistoryKeeper.frame % HistoryKeeper.depth
 
-        # Have to deepcopy the object if it is a GameObject so it is in a different place in memory
-        # So if the GameObject's values change the HistoryKeeper's one doesn't also change
+        # The GameObject's values are copied into the columns, so if the GameObject's values change the HistoryKeeper's don't
         if is_game_object:
-            added_object = GameObject(object.x_coordinate, object.y_coordinate, object.height, object.length)
-            added_object.name = object.name
+            slot = HistoryKeeper.name_to_slot.get(name)
+            slot = slot if slot is not None else HistoryKeeper.add_slot(name)
+
+            x_coordinates, y_coordinates, lengths, heights, frames = HistoryKeeper.columns[index]
+            x_coordinates[slot], y_coordinates[slot] = object.x_coordinate, object.y_coordinate
+            lengths[slot], heights[slot], frames[slot] = object.length, object.height, HistoryKeeper.frame
+            HistoryKeeper.snapshots[index][slot].name = object.name
+            HistoryKeeper.slot_versions[slot] = getattr(object, "dimensions_version", -1)
+            return
+
+        objects = HistoryKeeper.name_to_objects.get(name)
+
+        if objects is None:
+            if len(HistoryKeeper.name_to_objects) >= HistoryKeeper.max_objects:
+                HistoryKeeper.remove_old_objects()
+
+            objects = [[-1] * HistoryKeeper.depth, [None] * HistoryKeeper.depth]
+            HistoryKeeper.name_to_objects[name] = objects
+
+        objects[0][index], objects[1][index] = HistoryKeeper.frame, object
+
+    def add_if_changed(game_object, name):
+        """ summary: adds the GameObject to the HistoryKeeper like add() does, but if the GameObject hasn't changed since it
+            was added last frame the values from last frame are reused instead of being copied from the GameObject
+            params:
+                game_object: GameObject; the object that is going to be added to the HistoryKeeper
+                name: String; the unique name (identifier) for the object
+            returns: None
+        """
+
+        slot = HistoryKeeper.name_to_slot.get(name)
+        frame = HistoryKeeper.frame
+
+        if slot is None or HistoryKeeper.slot_versions[slot] != game_object.dimensions_version:
+            HistoryKeeper.add(game_object, name, True)
+            return
+
+        index, last_index = frame % HistoryKeeper.depth, (frame - 1) % HistoryKeeper.depth
+        columns, last_columns = HistoryKeeper.columns[index], HistoryKeeper.columns[last_index]
+
+        # If it was already added this frame there is nothing to do and if it wasn't added last frame there is nothing to reuse
+        if columns[4][slot] == frame:
+            return
+
+        if frame == 0 or last_columns[4][slot] != frame - 1:
+            HistoryKeeper.add(game_object, name, True)
+            return
+
+        for x in range(4):
+            columns[x][slot] = last_columns[x][slot]
+
+        columns[4][slot] = frame
+        HistoryKeeper.snapshots[index][slot].name = HistoryKeeper.snapshots[last_index][slot].name
+
+    def add_slot(name):
+        """returns: int; the slot in the columns that the GameObject with that name will use"""
+
+        if len(HistoryKeeper.name_to_slot) >= HistoryKeeper.max_objects:
+            HistoryKeeper.remove_old_objects()
 
-        HistoryKeeper.last_objects[f"{name}{VelocityCalculator.time}"] = added_object
+        if len(HistoryKeeper.free_slots) != 0:
+            slot = HistoryKeeper.free_slots.pop()
+            HistoryKeeper.slot_names[slot], HistoryKeeper.slot_versions[slot] = name, -1
+
+        else:
+            slot = len(HistoryKeeper.slot_names)
+            HistoryKeeper.slot_names.append(name)
+            HistoryKeeper.slot_versions.append(-1)
+
+            for x in range(HistoryKeeper.depth):
+                for column in HistoryKeeper.columns[x][:4]:
+                    column.append(0)
+
+                HistoryKeeper.columns[x][4].append(-1)
+                HistoryKeeper.snapshots[x].append(Snapshot(HistoryKeeper.columns[x], slot))
+
+        HistoryKeeper.name_to_slot[name] = slot
+        return slot
+
+    def remove_old_objects():
+        """Removes the objects that can't be gotten anymore and, if there are still too many, the least recently stored ones"""
+
+        oldest_frame = HistoryKeeper.frame - HistoryKeeper.depth + 1
+        all_frames = [columns[4] for columns in HistoryKeeper.columns]
+        get_last_frame = lambda slot: max(frames[slot] for frames in all_frames)
+
+        names_to_remove = [name for name, slot in HistoryKeeper.name_to_slot.items() if get_last_frame(slot) < oldest_frame]
+        HistoryKeeper.name_to_objects = {name: objects for name, objects in HistoryKeeper.name_to_objects.items()
+                                         if max(objects[0]) >= oldest_frame}
+
+        # Removing half of the objects, so this doesn't have to happen again for every object that is added
+        if len(HistoryKeeper.name_to_slot) - len(names_to_remove) >= HistoryKeeper.max_objects:
+            names_by_last_frame = sorted(HistoryKeeper.name_to_slot.keys(), key=lambda name: get_last_frame(HistoryKeeper.name_to_slot[name]))
+            names_to_remove = names_by_last_frame[:len(names_by_last_frame) - HistoryKeeper.max_objects // 2]
+
+        if len(HistoryKeeper.name_to_objects) >= HistoryKeeper.max_objects:
+            names_by_last_frame = sorted(HistoryKeeper.name_to_objects.keys(), key=lambda name: max(HistoryKeeper.name_to_objects[name][0]))
+
+            for name in names_by_last_frame[:len(names_by_last_frame) - HistoryKeeper.max_objects // 2]:
+                del HistoryKeeper.name_to_objects[name]
+
+        for name in names_to_remove:
+            slot = HistoryKeeper.name_to_slot.pop(name)
+            HistoryKeeper.slot_names[slot] = None
+            HistoryKeeper.free_slots.append(slot)
+
+            for frames in all_frames:
+                frames[slot] = -1
+
+    def get_slot(name, number_of_frames_back):
+        """returns: int; the slot of the GameObject if it was added 'number_of_frames_back' frames ago (None if it wasn't)"""
+
+        slot = HistoryKeeper.name_to_slot.get(name)
+        frame = HistoryKeeper.frame - number_of_frames_back
+
+        # The slots that haven't been used have a frame of -1, so there can't be any frame before 0
+        if slot is None or number_of_frames_back >= HistoryKeeper.depth or frame < 0:
+            return None
+
+        return slot if HistoryKeeper.columns[frame % HistoryKeeper.depth][4][slot] == frame else None
+
+    def get_columns(number_of_frames_back):
+        """ summary: gets the values of all the GameObjects from 'number_of_frames_back' frames ago (use get_slot() to
+            find where an object's values are); the columns must not be changed
+            params:
+                number_of_frames_back: int; how many frames ago the objects were added (0 is this frame); must be less than depth
+            returns: List of array; [x_coordinates, y_coordinates, lengths, heights]
+        """
+
+        return HistoryKeeper.columns[(HistoryKeeper.frame - number_of_frames_back) % HistoryKeeper.depth][:4]
+
+    def get_n_back(name, number_of_frames_back):
+        """ summary: gets the version of that object from 'number_of_frames_back' frames ago
+            params:
+                name: String; the unique name (identifier) given for the object in HistoryKeeper.add()
+                number_of_frames_back: int; how many frames ago the object was added (0 is this frame); must be less than depth
+            returns: the version of the object from that frame (None if it wasn't added that frame); GameObjects are
+            returned as a Snapshot
+        """
+
+        frame = HistoryKeeper.frame - number_of_frames_back
+
+        # The slots that haven't been used have a frame of -1, so there can't be any frame before 0
+        if number_of_frames_back >= HistoryKeeper.depth or frame < 0:
+            return None
+
+        index = frame % HistoryKeeper.depth
+        slot = HistoryKeeper.name_to_slot.get(name)
+
+        if slot is not None:
+            return HistoryKeeper.snapshots[index][slot] if HistoryKeeper.columns[index][4][slot] == frame else None
+
+        objects = HistoryKeeper.name_to_objects.get(name)
+        return objects[1][index] if objects is not None and objects[0][index] == frame else None
 
     def get_last(name):
         """ summary: gets the version of that object from the last cycle
@@ -61,7 +309,7 @@ class HistoryKeeper:
             returns: the version of the object from the last cycle
         """
 
-        return HistoryKeeper.last_objects.get(f"{name}{HistoryKeeper.last_time}")
+        return HistoryKeeper.get_n_back(name, 1)
 
     def is_populated(all_objects):
         """returns: boolean; if the History Keeper has these objects in it NOTE: each object in object must have the attribute name"""
@@ -74,6 +322,9 @@ class HistoryKeeper:
 
         return return_value
 
+
+HistoryKeeper.reset()
+
 class StateChange:
     """Stores the information for changing between states"""
 
@@ -90,8 +341,8 @@ class StateChange:
 class Range:
     """Stores the information for a start and end of a range"""
 
-    start = 0
-    end = 0
+    # The path collision functions make many Ranges every frame, so it uses __slots__ (no __dict__ for each Range)
+    __slots__ = ("start", "end")
 
     def __init__(self, start, end):
         self.start = start
@@ -115,3 +366,53 @@ class Range:
 
         return number >= self.start and number <= self.end
 
+
+class RecordPool:
+    """Reuses records (small objects like Range) that are made many times a frame; instead of allocating a new record
+    each time a record that was used in a previous frame is changed to have the new values. All the records that were
+    gotten from the pool are given back to it when start_new_frame() is called, so they must not be kept past a frame"""
+
+    record_class = None
+    free_records = []
+    used_records = []
+    # Once this many records are used in a frame the rest are not pooled, so the pool can't grow forever if start_new_frame() isn't called
+    max_size = 5000
+    allocations = 0
+
+    def __init__(self, record_class, max_size=5000):
+        """ summary: initializes the object
+
+            params:
+                record_class: class; the class of the records- its __init__() must set every attribute, so a used record
+                can be given new values by calling __init__() again
+                max_size: int; the most records that can be pooled each frame
+
+            returns: None
+        """
+
+        self.record_class, self.max_size = record_class, max_size
+        self.free_records, self.used_records = [], []
+        self.allocations = 0
+
+    def get(self, *args):
+        """returns: record_class; a record made with the args that is only valid until the next frame"""
+
+        # Doing pop() in a try block instead of checking the length, so two threads can't pop the same last record
+        try:
+            record = self.free_records.pop()
+            record.__init__(*args)
+
+        except IndexError:
+            record = self.record_class(*args)
+            self.allocations += 1
+
+        if len(self.used_records) < self.max_size:
+            self.used_records.append(record)
+
+        return record
+
+    def start_new_frame(self):
+        """Gives all the records that were used back to the pool; should be called once every frame"""
+
+        self.free_records += self.used_records
+        self.used_records = []
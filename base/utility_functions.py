@@ -17,7 +17,7 @@ def change_attributes(modified_object, object, attributes):
         returns: None
     """
     for attribute in attributes:
-        modified_object.__dict__[attribute] = object.__dict__[attribute]
+        setattr(modified_object, attribute, object.__dict__[attribute])
 
     return modified_object
 
@@ -416,12 +416,12 @@ def get_index_of_min_item(items):
 
 
 def get_converted_list(items, variable_name):
-    """returns: Object[]; For each item in items it appends the item's variable (item.__dict__[variable_name])"""
+    """returns: Object[]; For each item in items it appends the item's variable (getattr(item, variable_name))"""
 
     return_value = []
 
     for item in items:
-        return_value.append(item.__dict__[variable_name])
+        return_value.append(getattr(item, variable_name))
 
     return return_value
 
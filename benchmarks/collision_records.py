@@ -0,0 +1,96 @@
+"""Measures how many allocations and garbage collections finding the collisions of a 500 object scene causes with the
+CollisionData and Range pools and without them; run it from the root of the repository:
+python -m benchmarks.collision_records"""
+
+import gc
+import time
+import tracemalloc
+
+from base.drawable_objects import GameObject
+from base.engine_utility_classes import CollisionsUtilityFunctions, CollisionData
+from base.engines import CollisionsFinder, SpatialHash
+from base.utility_classes import HistoryKeeper, RecordPool, Range
+from base.velocity_calculator import VelocityCalculator
+from benchmarks.scenes import get_scene
+
+number_of_objects = 500
+number_of_frames = 30
+
+
+def run_frames(scene, is_pooled):
+    """ summary: moves the objects and finds the collisions between them for number_of_frames frames
+
+        params:
+            scene: List of List of float; what get_scene() returns
+            is_pooled: boolean; if the CollisionData and Ranges are recycled every frame
+
+        returns: List of float; [blocks still allocated after each frame, KiB still allocated after each frame,
+        garbage collections, seconds per frame] (the averages of the frames except for the garbage collections)
+    """
+
+    # A pool with a max_size of 0 never keeps any records, so every record is allocated like before there were pools
+    max_size = 5000 if is_pooled else 0
+    CollisionsUtilityFunctions.collision_data_pool = RecordPool(CollisionData, max_size)
+    CollisionsUtilityFunctions.range_pool = RecordPool(Range, max_size)
+
+    game_objects = []
+    for x in range(len(scene)):
+        x_coordinate, y_coordinate, x_velocity, y_velocity, length, height = scene[x]
+        game_object = GameObject(x_coordinate, y_coordinate, height, length)
+        game_object.name = f"object{x}"
+        game_objects.append(game_object)
+
+    spatial_hash = SpatialHash()
+    HistoryKeeper.reset()
+    VelocityCalculator.time = 1 / 60
+
+    garbage_collections = []
+
+    def gc_callback(phase, info):
+        if phase == "start":
+            garbage_collections.append(info["generation"])
+
+    gc.callbacks.append(gc_callback)
+    total_blocks, total_size, total_time = 0, 0, 0
+
+    for frame in range(number_of_frames):
+        for x in range(len(game_objects)):
+            HistoryKeeper.add(game_objects[x], game_objects[x].name, True)
+            game_objects[x].x_coordinate += scene[x][2] * VelocityCalculator.time
+            game_objects[x].y_coordinate += scene[x][3] * VelocityCalculator.time
+
+        HistoryKeeper.start_new_frame()
+        CollisionsFinder.collision_cache.start_new_frame()
+        CollisionsUtilityFunctions.start_new_frame()
+        object_pairs = spatial_hash.get_candidate_pairs(game_objects, False)
+
+        tracemalloc.start()
+        start_time = time.perf_counter()
+        CollisionsFinder.update_data_batch(object_pairs)
+        total_time += time.perf_counter() - start_time
+        snapshot = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+
+        statistics = snapshot.statistics("filename")
+        total_blocks += sum(statistic.count for statistic in statistics)
+        total_size += sum(statistic.size for statistic in statistics)
+
+    gc.callbacks.remove(gc_callback)
+    return [total_blocks / number_of_frames, total_size / number_of_frames / 1024, len(garbage_collections), total_time / number_of_frames]
+
+
+def run_benchmark():
+    """Prints the allocations and garbage collections with and without the pools"""
+
+    scene = get_scene(number_of_objects, 0)
+
+    for is_pooled in [False, True]:
+        blocks, size, garbage_collections, frame_time = run_frames(scene, is_pooled)
+        print(f"{'pooled' if is_pooled else 'not pooled':<12} live blocks per frame {blocks:>10.0f} | KiB per frame {size:>9.1f}"
+              f" | garbage collections {garbage_collections:>4} | ms per frame {frame_time * 1000:>8.2f}")
+
+    print(f"CollisionData size with __slots__: {CollisionData(False, False, False, False, None).__sizeof__()} bytes (no __dict__)")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,439 @@
+"""Times the engine's hot paths on synthetic scenes of 10 - 5000 objects and compares the times to a baseline; run it
+from the root of the repository:
+python -m benchmarks.engine_benchmarks                      (compares to benchmarks/baseline.json)
+python -m benchmarks.engine_benchmarks --save-baseline      (makes the current times the baseline)
+python -m benchmarks.engine_benchmarks --output results.json --threshold .5
+
+The exit code is 1 if a benchmark took longer than the baseline's time * (1 + threshold); the threshold is 1 by default
+because the same code can take up to about 1.8x the baseline's time from run to run"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import time
+from random import Random
+
+# Nothing has to be drawn, so the games' window is headless (it has to be set before the window is made)
+os.environ.setdefault("GAMES_HEADLESS", "1")
+
+from base.engine_utility_classes import CollisionsUtilityFunctions
+from base.engines import CollisionsFinder
+from base.important_variables import screen_length, screen_height
+from base.geometry import Point
+from base.path import ObjectPath, VelocityPath, SimplePath
+from base.utility_classes import HistoryKeeper
+from base.velocity_calculator import VelocityCalculator
+from benchmarks.scenes import get_moved_objects, get_random_walk, get_letter_hands
+from games.minigames.card_games.word_finder import WordFinder
+from games.pong.base_pong.ball import Ball
+from games.pong.base_pong.players import Paddle
+from games.pong.pong_types.normal_pong import NormalPong
+from games.pong.pong_types.portal_pong import PortalPong
+
+default_sizes = [10, 100, 1000, 5000]
+default_baseline_path = os.path.join(os.path.dirname(__file__), "baseline.json")
+frame_time = 1 / 60
+seed = 0
+
+
+def start_collision_frame(prev_objects):
+    """Puts the prev_objects into the HistoryKeeper as last frame's objects and clears this frame's collision data"""
+
+    HistoryKeeper.reset()
+
+    for prev_object in prev_objects:
+        HistoryKeeper.add(prev_object, prev_object.name, True)
+
+    HistoryKeeper.start_new_frame()
+    CollisionsFinder.collision_cache.start_new_frame()
+    CollisionsUtilityFunctions.start_new_frame()
+
+
+def setup_is_collision(number_of_objects):
+    """returns: Function; finds if each object collided with the next one"""
+
+    prev_objects, objects = get_moved_objects(number_of_objects, seed, frame_time)
+    object_pairs = [[objects[x], objects[(x + 1) % number_of_objects]] for x in range(number_of_objects)]
+
+    def run():
+        start_collision_frame(prev_objects)
+
+        for object1, object2 in object_pairs:
+            CollisionsFinder.is_collision(object1, object2)
+
+    return run
+
+
+def setup_get_path_collision_time(number_of_objects):
+    """returns: Function; finds when each object's path collides with the next object's path"""
+
+    prev_objects, objects = get_moved_objects(number_of_objects, seed, frame_time)
+    paths = [ObjectPath(prev_objects[x], objects[x]) for x in range(number_of_objects)]
+    path_pairs = [[paths[x], paths[(x + 1) % number_of_objects]] for x in range(number_of_objects)]
+
+    def run():
+        CollisionsUtilityFunctions.start_new_frame()
+
+        for path1, path2 in path_pairs:
+            CollisionsUtilityFunctions.get_path_collision_time(path1, path2)
+
+    return run
+
+
+def setup_get_path_collision_times(number_of_objects):
+    """returns: Function; makes the time paths of each object's y_coordinate and the next object's bottom (like
+    get_ranges_between() does) and finds when they cross"""
+
+    prev_objects, objects = get_moved_objects(number_of_objects, seed, frame_time)
+    coordinates = [[prev_objects[x].y_coordinate, objects[x].y_coordinate, prev_objects[x].bottom, objects[x].bottom]
+                   for x in range(number_of_objects)]
+
+    def run():
+        for x in range(number_of_objects):
+            prev_y_coordinate, y_coordinate = coordinates[x][0], coordinates[x][1]
+            prev_bottom, bottom = coordinates[(x + 1) % number_of_objects][2], coordinates[(x + 1) % number_of_objects][3]
+
+            path = SimplePath(Point(0, prev_y_coordinate))
+            path.add_point(Point(frame_time / 2, (prev_y_coordinate + y_coordinate) / 2))
+            path.add_point(Point(frame_time, y_coordinate))
+
+            bottom_path = SimplePath(Point(0, prev_bottom))
+            bottom_path.add_point(Point(frame_time, bottom))
+
+            CollisionsUtilityFunctions.get_path_collision_times(path, bottom_path)
+
+    return run
+
+
+def setup_get_path_collision_times_long_paths(number_of_points):
+    """returns: Function; finds where two number_of_points point time paths cross (like the omnidirectional ai's paths)"""
+
+    paths = []
+
+    for walk_seed in [seed, seed + 1]:
+        points = get_random_walk(number_of_points, walk_seed)
+        path = SimplePath()
+
+        for x in range(number_of_points):
+            path.add_point(Point(x * frame_time, points[x].y_coordinate))
+
+        paths.append(path)
+
+    def run():
+        CollisionsUtilityFunctions.get_path_collision_times(paths[0], paths[1])
+
+    return run
+
+
+def setup_get_big_path_collision_time(number_of_points):
+    """returns: Function; finds when two objects that each move along a number_of_points point path first collide"""
+
+    points = get_random_walk(number_of_points, seed)
+    all_paths = [VelocityPath.get_paths_list(), VelocityPath.get_paths_list()]
+
+    # The second object weaves around the first one, so they start and stop overlapping many times
+    for x in range(number_of_points):
+        offset = 40 if x % 2 == 0 else -40
+        VelocityPath.add_point_to_paths(all_paths[0], x * frame_time, points[x], 30, 30)
+        VelocityPath.add_point_to_paths(all_paths[1], x * frame_time, Point(points[x].x_coordinate + offset, points[x].y_coordinate - offset), 30, 30)
+
+    def run():
+        CollisionsUtilityFunctions.start_new_frame()
+        CollisionsUtilityFunctions.get_big_path_collision_time(all_paths[0], all_paths[1])
+
+    return run
+
+
+def setup_get_moving_collision_time(number_of_objects):
+    """returns: Function; finds when each moving object's path collides with a stationary object (rectangles and ellipses)"""
+
+    prev_objects, objects = get_moved_objects(number_of_objects, seed, frame_time)
+    # Every fourth object is stationary (see get_moved_objects())
+    stationary_objects = objects[::4]
+    path_and_objects = [[ObjectPath(prev_objects[x], objects[x]), stationary_objects[x // 4 - 1]]
+                        for x in range(number_of_objects) if x % 4 != 0]
+
+    def run():
+        CollisionsUtilityFunctions.start_new_frame()
+
+        for path, stationary_object in path_and_objects:
+            CollisionsUtilityFunctions.get_moving_collision_time(path, stationary_object)
+
+    return run
+
+
+def setup_get_ball_path_data(number_of_balls):
+    """returns: Function; finds the ball's path across one to five screens for number_of_balls starting places"""
+
+    random = Random(seed)
+    pong_type = NormalPong(Paddle(), Paddle(), Ball())
+    ball_height = pong_type.ball.height
+    starts = [[random.uniform(0, screen_height - ball_height), random.uniform(0, screen_length),
+               random.uniform(1, 5) * screen_length, random.random() < .5] for x in range(number_of_balls)]
+
+    def run():
+        for ball_y_coordinate, ball_x_coordinate, distance, ball_is_moving_down in starts:
+            pong_type.get_ball_path_data(ball_y_coordinate, ball_x_coordinate, ball_x_coordinate + distance, ball_is_moving_down)
+
+    return run
+
+
+def setup_get_ball_prediction(number_of_balls):
+    """returns: Function; does the same as setup_get_ball_path_data() with PongType.get_ball_prediction()"""
+
+    random = Random(seed)
+    pong_type = NormalPong(Paddle(), Paddle(), Ball())
+    ball_height = pong_type.ball.height
+    starts = [[random.uniform(0, screen_height - ball_height), random.uniform(0, screen_length),
+               random.uniform(1, 5) * screen_length, random.random() < .5] for x in range(number_of_balls)]
+
+    def run():
+        # The predictions from the last run are forgotten, so they are found again
+        HistoryKeeper.start_new_frame()
+
+        for ball_y_coordinate, ball_x_coordinate, distance, ball_is_moving_down in starts:
+            pong_type.get_ball_prediction(ball_y_coordinate, ball_x_coordinate, ball_x_coordinate + distance, ball_is_moving_down)
+
+    return run
+
+
+def setup_get_portal_ball_trajectory(number_of_balls):
+    """returns: Function; finds the ball's trajectory through every portal to the right side for number_of_balls starting places"""
+
+    random = Random(seed)
+    portal_pong = PortalPong(Paddle(), Paddle(), Ball())
+    ball = portal_pong.ball
+    end_x_coordinate = screen_length - ball.length
+    starts = [[random.uniform(0, screen_length / 2), random.uniform(0, screen_height - ball.height), random.random() < .5]
+              for x in range(number_of_balls)]
+
+    def run():
+        for portal in portal_pong.portals:
+            portal.enable()
+
+        for ball_x_coordinate, ball_y_coordinate, ball_is_moving_down in starts:
+            ball.x_coordinate, ball.y_coordinate, ball.is_moving_down = ball_x_coordinate, ball_y_coordinate, ball_is_moving_down
+            portal_pong.get_ball_trajectory(end_x_coordinate)
+
+    return run
+
+
+def setup_velocity_path_get_coordinates(number_of_points):
+    """returns: Function; moves an object along a number_of_points point path (one point per frame)"""
+
+    points = get_random_walk(number_of_points + 1, seed)
+    path = VelocityPath(points[0], points[1:], 300)
+
+    def run():
+        path.total_time = 0
+        VelocityCalculator.time = path.last_end_time / number_of_points
+
+        for x in range(number_of_points):
+            HistoryKeeper.start_new_frame()
+            path.get_coordinates()
+
+        VelocityCalculator.time = frame_time
+
+    return run
+
+
+def setup_game_object_frame(number_of_objects):
+    """returns: Function; one frame of number_of_objects objects moving (setting their dimensions and other attributes,
+    reading their edges) and being added to the HistoryKeeper with add_if_changed()"""
+
+    objects = get_moved_objects(number_of_objects, seed, frame_time)[1]
+    # Like in get_moved_objects() every fourth object is stationary, so only its other attributes are set
+    velocities = [[(x % 7) - 3, (x % 5) - 2, x % 4 != 0] for x in range(number_of_objects)]
+
+    def run():
+        HistoryKeeper.start_new_frame()
+
+        for game_object, (x_velocity, y_velocity, is_moving) in zip(objects, velocities):
+            if is_moving:
+                game_object.x_coordinate += x_velocity
+                game_object.y_coordinate += y_velocity
+
+            game_object.color = (0, 0, 250)
+            game_object.is_addable = game_object.right_edge > 0 and game_object.bottom > 0
+            HistoryKeeper.add_if_changed(game_object, game_object.name)
+
+    return run
+
+
+word_finder = None
+
+
+def setup_word_finder_get_all_words(number_of_hands):
+    """returns: Function; finds all the words that can be made from number_of_hands hands of seven letters"""
+
+    global word_finder
+
+    # Making the WordFinder's trie takes a while, so it is only made once
+    if word_finder is None:
+        word_finder = WordFinder()
+
+    hands = get_letter_hands(number_of_hands, seed)
+
+    def run():
+        for hand in hands:
+            word_finder.get_all_words(hand)
+
+    return run
+
+
+# name -> Function; setup(number_of_objects) returns the function that is timed
+benchmarks = {
+    "CollisionsFinder.is_collision": setup_is_collision,
+    "get_path_collision_time": setup_get_path_collision_time,
+    "get_path_collision_times": setup_get_path_collision_times,
+    "get_path_collision_times_long_paths": setup_get_path_collision_times_long_paths,
+    "get_big_path_collision_time": setup_get_big_path_collision_time,
+    "get_moving_collision_time": setup_get_moving_collision_time,
+    "PongType.get_ball_path_data": setup_get_ball_path_data,
+    "PongType.get_ball_prediction": setup_get_ball_prediction,
+    "PortalPong.get_ball_trajectory": setup_get_portal_ball_trajectory,
+    "VelocityPath.get_coordinates": setup_velocity_path_get_coordinates,
+    "GameObject frame": setup_game_object_frame,
+    "WordFinder.get_all_words": setup_word_finder_get_all_words,
+}
+
+
+def time_function(function, repeats, min_time=.05):
+    """ summary: times the function; fast functions are ran multiple times per repeat, so each repeat takes at least
+        min_time seconds (otherwise the time would mostly be noise)
+
+        params:
+            function: Function; the function that is timed
+            repeats: int; how many times the function is timed
+            min_time: float; the least amount of seconds each repeat should take
+
+        returns: float; the fewest seconds the function took out of all the repeats (the least noisy time)
+    """
+
+    # The first run is a warm up and it shows how many times the function has to be ran to take min_time seconds
+    start_time = time.perf_counter()
+    function()
+    number_of_runs = max(int(min_time / max(time.perf_counter() - start_time, 1e-9)), 1)
+    times = []
+
+    # Like timeit, the garbage collector is turned off, so its pauses don't end up in the times
+    gc.collect()
+    gc.disable()
+
+    for x in range(repeats):
+        start_time = time.perf_counter()
+
+        for y in range(number_of_runs):
+            function()
+
+        times.append((time.perf_counter() - start_time) / number_of_runs)
+
+    gc.enable()
+    return min(times)
+
+
+def run_benchmarks(names, sizes, repeats):
+    """ summary: times every benchmark for every size
+
+        params:
+            names: List of String; the names of the benchmarks that should be run (keys of benchmarks)
+            sizes: List of int; the number of objects in each scene
+            repeats: int; how many times each benchmark is timed (the fastest time is used)
+
+        returns: Dictionary; the results in the format that is written to the JSON file
+    """
+
+    VelocityCalculator.time = frame_time
+    results = {}
+
+    for name in names:
+        results[name] = {}
+
+        for size in sizes:
+            seconds = time_function(benchmarks[name](size), repeats)
+            results[name][str(size)] = seconds
+            print(f"{name:<32} {size:>6} {seconds * 1000:>12.3f} ms {seconds / size * 1e6:>10.2f} us each")
+
+    return {"python": platform.python_version(), "machine": platform.machine(), "repeats": repeats, "results": results}
+
+
+def get_regressions(results, baseline, threshold):
+    """ summary: compares the results to the baseline (only the benchmarks and sizes that are in both)
+
+        params:
+            results: Dictionary; what run_benchmarks() returned
+            baseline: Dictionary; what run_benchmarks() returned for the baseline
+            threshold: float; how much slower (as a fraction of the baseline time) a benchmark can be before it is a regression
+
+        returns: List of String; a description of each regression
+    """
+
+    regressions = []
+
+    for name, size_to_seconds in results["results"].items():
+        for size, seconds in size_to_seconds.items():
+            baseline_seconds = baseline["results"].get(name, {}).get(size)
+
+            if baseline_seconds is None:
+                continue
+
+            ratio = seconds / baseline_seconds
+            print(f"{name:<32} {size:>6} {ratio:>8.2f}x baseline")
+
+            if ratio > 1 + threshold:
+                regressions.append(f"{name} with {size} objects took {ratio:.2f}x the baseline's time")
+
+    return regressions
+
+
+def main(arguments):
+    """Runs the benchmarks and compares them to the baseline; returns: int; the exit code"""
+
+    argument_parser = argparse.ArgumentParser(description="Times the engine's hot paths")
+    argument_parser.add_argument("--sizes", type=int, nargs="+", default=default_sizes, help="the number of objects in each scene")
+    argument_parser.add_argument("--benchmarks", nargs="+", default=list(benchmarks.keys()), choices=list(benchmarks.keys()))
+    argument_parser.add_argument("--repeats", type=int, default=3, help="how many times each benchmark is timed")
+    argument_parser.add_argument("--output", metavar="PATH", help="writes the results to PATH as JSON")
+    argument_parser.add_argument("--baseline", metavar="PATH", default=default_baseline_path, help="the results to compare to")
+    argument_parser.add_argument("--threshold", type=float, default=1, help="how much slower than the baseline is a regression (1 is twice as slow)")
+    argument_parser.add_argument("--save-baseline", action="store_true", help="writes the results to the baseline instead of comparing")
+    arguments = argument_parser.parse_args(arguments)
+
+    results = run_benchmarks(arguments.benchmarks, arguments.sizes, arguments.repeats)
+
+    if arguments.output is not None:
+        with open(arguments.output, "w") as file:
+            json.dump(results, file, indent=4)
+
+    # The benchmarks and sizes that weren't ran keep their baseline times
+    if arguments.save_baseline and os.path.exists(arguments.baseline):
+        with open(arguments.baseline) as file:
+            baseline_results = json.load(file)["results"]
+
+        for name, size_to_seconds in baseline_results.items():
+            results["results"][name] = {**size_to_seconds, **results["results"].get(name, {})}
+
+    if arguments.save_baseline:
+        with open(arguments.baseline, "w") as file:
+            json.dump(results, file, indent=4)
+
+        return 0
+
+    if not os.path.exists(arguments.baseline):
+        print(f"There is no baseline at {arguments.baseline}; use --save-baseline to make one")
+        return 0
+
+    with open(arguments.baseline) as file:
+        regressions = get_regressions(results, json.load(file), arguments.threshold)
+
+    for regression in regressions:
+        print(f"REGRESSION: {regression}")
+
+    return 1 if len(regressions) > 0 else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,68 @@
+"""Builds the synthetic scenes that the benchmarks are run on; every scene is made from a seed, so the same scene is
+made every time"""
+
+from random import Random
+
+from base.drawable_objects import GameObject, Ellipse
+from base.equations import Point
+
+
+def get_scene(number_of_objects, seed):
+    """returns: List of List of float; [x_coordinate, y_coordinate, x_velocity, y_velocity, length, height] of each object"""
+
+    random = Random(seed)
+    return [[random.uniform(0, 1500), random.uniform(0, 1000), random.uniform(-300, 300), random.uniform(-300, 300),
+             random.uniform(5, 40), random.uniform(5, 40)] for x in range(number_of_objects)]
+
+
+def get_moved_objects(number_of_objects, seed, time):
+    """ summary: makes the objects of a scene where they were and where they are after moving for time seconds; every
+        third object is an Ellipse and every fourth object is stationary
+
+        params:
+            number_of_objects: int; the number of objects in the scene
+            seed: int; the seed the scene is made from
+            time: float; how many seconds the objects moved for
+
+        returns: List of GameObject[]; [prev_objects, objects]
+    """
+
+    prev_objects, objects = [], []
+
+    for x, (x_coordinate, y_coordinate, x_velocity, y_velocity, length, height) in enumerate(get_scene(number_of_objects, seed)):
+        object_class = Ellipse if x % 3 == 0 else GameObject
+        is_moving = x % 4 != 0
+
+        prev_object = object_class(x_coordinate, y_coordinate, height, length)
+        game_object = object_class(x_coordinate + x_velocity * time * is_moving, y_coordinate + y_velocity * time * is_moving, height, length)
+        prev_object.name = game_object.name = f"object{x}"
+
+        prev_objects.append(prev_object)
+        objects.append(game_object)
+
+    return [prev_objects, objects]
+
+
+def get_random_walk(number_of_points, seed):
+    """returns: List of Point; number_of_points points that each are a random step away from the last one"""
+
+    random = Random(seed)
+    x_coordinate, y_coordinate = 600, 300
+    points = []
+
+    for x in range(number_of_points):
+        x_coordinate += random.uniform(-50, 50)
+        y_coordinate += random.uniform(-50, 50)
+        points.append(Point(x_coordinate, y_coordinate))
+
+    return points
+
+
+def get_letter_hands(number_of_hands, seed, hand_size=7):
+    """returns: List of String; number_of_hands random sets of letters (weighted like Scrabble tiles)"""
+
+    random = Random(seed)
+    tiles = ("e" * 12 + "a" * 9 + "i" * 9 + "o" * 8 + "n" * 6 + "r" * 6 + "t" * 6 + "l" * 4 + "s" * 4 + "u" * 4 + "d" * 4 +
+             "g" * 3 + "bcmpfhvwy" * 2 + "kjxqz")
+
+    return ["".join(random.sample(tiles, hand_size)) for x in range(number_of_hands)]
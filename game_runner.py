@@ -1,28 +1,126 @@
-import cProfile
+import argparse
+import os
+
+argument_parser = argparse.ArgumentParser(description="Runs the games")
+argument_parser.add_argument("--record", metavar="PATH", help="records the input of the session into the log at PATH")
+argument_parser.add_argument("--replay", metavar="PATH", help="replays the log at PATH (headless) as fast as possible")
+argument_parser.add_argument("--headless", action="store_true", help="runs without drawing anything as fast as possible")
+argument_parser.add_argument("--timestep", type=float, default=1 / 60, help="the seconds each simulation frame takes")
+argument_parser.add_argument("--frames", type=int, help="stops after this many frames")
+argument_parser.add_argument("--profile", action="store_true", help="times every frame and shows the times (F3 hides them)")
+argument_parser.add_argument("--trace", metavar="PATH", help="profiles and writes a Chrome trace of the frames to PATH when done")
+arguments = argument_parser.parse_args()
+
+# Headless mode is picked when base.important_variables is imported, so it has to be set before the imports below
+if arguments.headless:
+    os.environ["GAMES_HEADLESS"] = "1"
+
+# Replays don't need to be drawn unless asked to be
+if arguments.replay is not None:
+    os.environ.setdefault("GAMES_HEADLESS", "1")
 
 import pygame.display
 
+from base.background_worker import BackgroundWorker
+from base.engine_utility_classes import CollisionsUtilityFunctions
 from base.engines import CollisionsFinder
+from base.frame_profiler import FrameProfiler
+from base.input_recorder import InputRecorder
 from base.path import *
+from base.simulation_clock import SimulationClock
 from base.utility_classes import HistoryKeeper
 from base.important_variables import *
 import time
 from base.velocity_calculator import VelocityCalculator
 from gui.main_screen import MainScreen
+from gui_components.frame_profiler_overlay import FrameProfilerOverlay
 
 game_window.add_screen(MainScreen())
 
-while True:
-    start_time = time.time()
+# The AI's plans have to come in the same frames when the recording is replayed, so they aren't made on another thread
+if arguments.record is not None or arguments.replay is not None:
+    BackgroundWorker.is_threaded = False
+
+if arguments.record is not None:
+    InputRecorder.start_recording(arguments.record)
+
+if arguments.replay is not None:
+    InputRecorder.start_replaying(arguments.replay)
+
+if arguments.profile or arguments.trace is not None:
+    FrameProfiler.enable()
+    game_window.add_overlay(FrameProfilerOverlay())
+
+
+def print_frames_per_second(number_of_frames, total_time):
+    """Prints how many frames were run and how fast they were run"""
+
+    print(f"Ran {number_of_frames} frames in {total_time:.2f} seconds ({number_of_frames / max(total_time, 1e-9):.0f} frames per second)")
+
+
+simulation_clock = SimulationClock(arguments.timestep)
+# Every frame of the simulation is as long as the timestep (except when replaying because the log has the times)
+VelocityCalculator.time = arguments.timestep
+runner_start_time = time.time()
+number_of_frames = 0
+is_running = True
+
+while is_running:
+    start_time = FrameProfiler.start()
     for event in pygame.event.get():
         if event.type == pygame.QUIT:
-            pygame.quit()
+            is_running = False
+
+    FrameProfiler.end(FrameProfiler.Sections.EVENTS, start_time)
+
+    # The window was closed, so no more frames are ran; the shutdown after the loop stops the recording and pygame
+    if not is_running:
+        break
+
+    # Headless runs the frames one after another as fast as possible; otherwise there is a frame every timestep
+    number_of_steps = simulation_clock.get_number_of_steps(time.time()) if not game_window.is_headless else 1
+
+    if number_of_steps == 0:
+        time.sleep(simulation_clock.get_time_until_next_step())
+
+    for step in range(number_of_steps):
+        # The replay has ended or all the frames that should be ran have been ran
+        if number_of_frames == arguments.frames or not InputRecorder.run():
+            is_running = False
+            break
+
+        # Only the last frame is drawn, so when the game is running slowly it catches up by not drawing the others
+        # Instead of by making the frames longer
+        is_last_step = step == number_of_steps - 1
+        game_window.is_rendering = is_last_step and not game_window.is_headless
+        game_window.interpolation = simulation_clock.get_interpolation() if is_last_step else 1
+
+        frame_start_time = FrameProfiler.start()
+        game_window.run()
+
+        CollisionsFinder.collision_cache.start_new_frame()
+        CollisionsUtilityFunctions.start_new_frame()
+
+        start_time = FrameProfiler.start()
+        function_runner.run()
+        FrameProfiler.end(FrameProfiler.Sections.FUNCTION_RUNNER, start_time)
+
+        start_time = FrameProfiler.start()
+        changer.run_changes()
+        FrameProfiler.end(FrameProfiler.Sections.CHANGER, start_time)
+
+        start_time = FrameProfiler.start()
+        HistoryKeeper.start_new_frame()
+        FrameProfiler.end(FrameProfiler.Sections.HISTORY_KEEPER, start_time)
+
+        FrameProfiler.end(FrameProfiler.Sections.FRAME, frame_start_time)
+        FrameProfiler.start_new_frame()
+        number_of_frames += 1
 
-    game_window.run()
+InputRecorder.stop()
 
-    CollisionsFinder.objects_to_data = {}
-    function_runner.run()
-    changer.run_changes()
-    HistoryKeeper.last_time = VelocityCalculator.time
-    VelocityCalculator.time = time.time() - start_time
+if arguments.trace is not None:
+    FrameProfiler.export_chrome_trace(arguments.trace)
 
+print_frames_per_second(number_of_frames, time.time() - runner_start_time)
+pygame.quit()
@@ -5,6 +5,7 @@ from base.important_variables import (
 )
 
 from base.velocity_calculator import VelocityCalculator
+from games.platformers.base.platformer_variables import platform_layer
 
 
 class Platform(GameObject):
@@ -12,6 +13,7 @@ class Platform(GameObject):
 
     color = (150, 75, 0)
     object_type = "Platform"
+    collision_layer = platform_layer
 
     def __init__(self, x_coordinate=0, y_coordinate=0, length=0, height=0, has_supplied_values=False):
         """Initializes the object"""
@@ -2,3 +2,11 @@ from base.important_variables import *
 
 displacement = screen_height * .4
 time = .5
+
+# The collision layers (each one is a different bit); what each kind of object can collide with comes from the
+# PlatformerScreen's collision handlers
+player_layer = 1
+player_weapon_layer = 2
+enemy_layer = 4
+enemy_weapon_layer = 8
+platform_layer = 16
@@ -27,6 +27,8 @@ class Player(WeaponUser):
     total_hit_points = 20
     hit_points_left = total_hit_points
     object_type = "Player"
+    collision_layer = player_layer
+    weapon_collision_layer = player_weapon_layer
 
     # Miscellaneous
     jumping_path = None
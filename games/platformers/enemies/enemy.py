@@ -1,6 +1,7 @@
 import abc
 
 from base.drawable_objects import GameObject
+from games.platformers.base.platformer_variables import enemy_layer, enemy_weapon_layer
 from games.platformers.weapons.weapon_user import WeaponUser
 from gui_components.health_bar import HealthBar
 
@@ -15,6 +16,8 @@ class Enemy(WeaponUser, abc.ABC):
     damage = 10
     health_bar = None
     object_type = "Enemy"
+    collision_layer = enemy_layer
+    weapon_collision_layer = enemy_weapon_layer
 
     def __init__(self, damage, hit_points, platform, players, x_coordinate, y_coordinate, length, height, is_gone):
         """Initializes the object"""
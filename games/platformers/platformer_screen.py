@@ -1,10 +1,11 @@
 from base.dimensions import Dimensions
-from base.engines import CollisionsFinder
+from base.engines import CollisionDispatcher
 from base.utility_classes import HistoryKeeper
 from games.platformers.base.gravity_engine import GravityEngine
 from games.platformers.base.platform import Platform
 from games.platformers.base.player import Player
 from games.platformers.enemies.charging_bull import ChargingBull
+from games.platformers.enemies.enemy import Enemy
 from games.platformers.enemies.straight_ninja import StraightNinja
 from games.platformers.enemies.bouncy_ninja import BouncyNinja
 from gui_components.grid import Grid
@@ -22,10 +23,16 @@ class PlatformerScreen(Screen):
     platforms = []
     game_objects = []
     gravity_engine = None
+    collision_dispatcher = None
+    # A concurrent.futures executor; if it isn't None the collision data for all the pairs is found on it before the
+    # Collisions are run (the pairs' data is found at the start of the cycle instead of right before each collision)
+    collision_executor = None
 
     def __init__(self):
         """Initializes the object"""
 
+        self.collision_dispatcher = self.get_collision_dispatcher()
+        self.set_collision_masks()
         health_grid = Grid(Dimensions(0, 0, screen_length * .25, screen_height * .1), 2, 2, True)
         self.players = [Player(pygame.K_a, pygame.K_d, pygame.K_w, pygame.K_s, pygame.K_f, self.is_gone)]
         self.setup_enemies_and_platforms()
@@ -44,6 +51,9 @@ class PlatformerScreen(Screen):
     def setup_enemies_and_platforms(self):
         """Creates the enemies and platforms of the game for starting out"""
 
+        for platform in self.platforms:
+            function_runner.untrack_game_object(platform)
+
         # Platform above you
         # self.platforms = [Platform(), Platform(Platform().x_coordinate, Platform().y_coordinate - self.players[0].max_jump_height * 1/2 - 200 - self.players[0].height, screen_length, 200, True)]
 
@@ -56,6 +66,10 @@ class PlatformerScreen(Screen):
         # Sandwich Platform
         self.platforms = [Platform(100, 300, 800, 100, True), Platform(0, 200, 100, 100, True), Platform(910, 200, 100, 100, True)]
 
+        # The platforms never move, so the function_runner adds them to the HistoryKeeper without copying them each cycle
+        for platform in self.platforms:
+            function_runner.track_game_object(platform)
+
         # One Medium Platform
         # self.platforms = [Platform(100, 300, 800, 100, True)]
 
@@ -108,71 +122,79 @@ class PlatformerScreen(Screen):
 
         self.setup_enemies_and_platforms()
         self.gravity_engine.reset()
-        HistoryKeeper.last_objects = {}
+        self.collision_dispatcher.reset()
+        HistoryKeeper.reset()
 
-    def run_all_collisions(self):
-        """Runs all the collisions between the player, projectiles, and enemies"""
+    def get_collision_dispatcher(self):
+        """returns: CollisionDispatcher; the dispatcher that has what should happen for each type of collision"""
 
-        # TODO maybe could make this quicker, but not sure if it is worth it
-        for i in range(len(self.game_objects)):
-            object1 = self.game_objects[i]
-            # Only the objects that can be added to the History Keeper should be checked for a collision; also
-            # The platforms don't need to check to see if they collided with other objects because if something
-            # Collides with the platform it won't do anything in reaction
-            if not object1.is_addable or self.is_platform(object1):
-                continue
+        collision_dispatcher = CollisionDispatcher()
+        # The objects act upon each other every frame they are touching
+        events = [CollisionDispatcher.Events.ENTER, CollisionDispatcher.Events.STAY]
 
-            for j in range(len(self.game_objects)):
-                object2 = self.game_objects[j]
+        # The users and the users' weapons being stopped by platforms
+        collision_dispatcher.add_handler(player_layer, platform_layer, self.run_user_inanimate_collision, events)
+        collision_dispatcher.add_handler(enemy_layer, platform_layer, self.run_user_inanimate_collision, events)
+        collision_dispatcher.add_handler(player_weapon_layer, platform_layer, self.run_weapon_inanimate_collision, events)
+        collision_dispatcher.add_handler(enemy_weapon_layer, platform_layer, self.run_weapon_inanimate_collision, events)
 
-                collision_is_possible = object2.is_addable and len(object1.object_type) != len(object2.object_type)
-                if collision_is_possible and CollisionsFinder.is_collision(object1, object2):
-                    self.run_object_collisions(object1, object2)
+        # The enemy (and its weapon) hurting the player
+        collision_dispatcher.add_handler(enemy_layer, player_layer, self.run_user_enemy_collision, events)
+        collision_dispatcher.add_handler(enemy_weapon_layer, player_layer, self.run_weapon_enemy_collision, events)
 
-    def run_object_collisions(self, main_object, other_object):
-        """Runs the collisions between the 'main_object' and the 'other_object;' the main_object acts upon the other_object.
-        By act upon I mean damages the other_object, moves the other_object, etc."""
+        # Only the player's weapon hits the enemy's weapon, so a collision does not happen twice - once when the
+        # player_weapon is the main_object and the other where the enemy_weapon is the main_object
+        collision_dispatcher.add_handler(player_weapon_layer, enemy_layer, self.run_weapon_enemy_collision, events)
+        collision_dispatcher.add_handler(player_weapon_layer, enemy_weapon_layer, self.run_weapon_enemy_collision, events)
 
-        self.run_user_weapon_inanimate_collisions(self.is_player_weapon(main_object), self.is_player(main_object), main_object, other_object)
-        self.run_user_weapon_inanimate_collisions(self.is_enemy_weapon(main_object), self.is_enemy(main_object), main_object, other_object)
+        return collision_dispatcher
 
-        if self.is_enemy(main_object) and self.is_player(other_object):
-            main_object.run_enemy_collision(other_object, main_object.index)
+    def set_collision_masks(self):
+        """Makes each kind of object only collide with the layers it has a handler with, so the collision masks always
+        match the collision dispatcher's handlers"""
 
-        if self.is_enemy_weapon(main_object) and self.is_player(other_object):
-            main_object.user.run_enemy_collision(other_object, main_object.index)
+        get_collision_mask = self.collision_dispatcher.get_collision_mask
+
+        Player.collision_mask = get_collision_mask(player_layer)
+        Player.weapon_collision_mask = get_collision_mask(player_weapon_layer)
+        Enemy.collision_mask = get_collision_mask(enemy_layer)
+        Enemy.weapon_collision_mask = get_collision_mask(enemy_weapon_layer)
+        Platform.collision_mask = get_collision_mask(platform_layer)
+
+    def run_all_collisions(self):
+        """Runs all the collisions between the player, projectiles, and enemies"""
 
-        if self.is_enemy_weapon(main_object) and self.is_platform(other_object):
-            main_object.user.run_inanimate_object_collision(other_object, main_object.index)
+        # Only the objects that can be added to the History Keeper should be checked for a collision; the dispatcher
+        # Skips the pairs that don't have anything happen when they collide (like platforms colliding with other objects)
+        game_objects = [game_object for game_object in self.game_objects if game_object.is_addable]
+        self.collision_dispatcher.run(game_objects, self.collision_executor)
 
-        if self.is_player_weapon(main_object) and self.is_enemy(other_object):
-            main_object.user.run_enemy_collision(other_object, main_object.index)
+    def run_user_inanimate_collision(self, user, inanimate_object, event):
+        """Runs the collision between a weapon user and an inanimate object (the user is stopped by the object)"""
 
-        # Doing it this way, so a collision does not happen twice - once when the player_weapon is the main_object
-        # And the other where the enemy_weapon is the main_object.
-        if self.is_player_weapon(main_object) and self.is_enemy_weapon(other_object):
-            main_object.user.run_enemy_collision(other_object, main_object.index)
+        user.run_inanimate_object_collision(inanimate_object, user.index)
 
-        if self.is_enemy_weapon(main_object) and self.is_enemy_weapon(other_object):
-            main_object.user.run_enemy_collision(other_object, main_object.index)
+    def run_weapon_inanimate_collision(self, weapon, inanimate_object, event):
+        """Runs the collision between a user's weapon and an inanimate object"""
 
-    def run_user_weapon_inanimate_collisions(self, is_weapon, is_user, user_or_weapon, other_object):
-        """Runs the collisions between the user + the user's weapon and inanimate objects"""
+        weapon.user.run_inanimate_object_collision(inanimate_object, weapon.index)
 
-        if is_user and self.is_platform(other_object):
-            user_or_weapon.run_inanimate_object_collision(other_object, user_or_weapon.index)
+    def run_user_enemy_collision(self, user, enemy, event):
+        """Runs the collision between a weapon user and its 'enemy' (the user would be the enemy's 'enemy')"""
 
-        if is_weapon and self.is_platform(other_object):
-            user_or_weapon.user.run_inanimate_object_collision(other_object, user_or_weapon.index)
+        user.run_enemy_collision(enemy, user.index)
+
+    def run_weapon_enemy_collision(self, weapon, enemy, event):
+        """Runs the collision between a user's weapon and the user's 'enemy' (which can also be the enemy's weapon)"""
+
+        weapon.user.run_enemy_collision(enemy, weapon.index)
 
     def add_game_objects(self):
-        """Adds all the game objects to the HistoryKeeper"""
+        """Adds all the game objects to the HistoryKeeper (the platforms are added by the function_runner)"""
 
         for player in self.players:
             self.add_sub_components(player.get_sub_components())
 
-        self.add_sub_components(self.platforms)
-
         for enemy in self.enemies:
             self.add_sub_components(enemy.get_sub_components())
 
@@ -182,7 +204,7 @@ class PlatformerScreen(Screen):
         for component in component_list:
             if component.is_addable:
                 component.name = id(component)
-                HistoryKeeper.add(component, component.name, True)
+                HistoryKeeper.add_if_changed(component, component.name)
 
     def get_components(self):
         """returns: Component[]; all the components that should be rendered"""
@@ -203,37 +225,3 @@ class PlatformerScreen(Screen):
         """returns: boolean; if the game_object should stop being ran and rendered onto the screen"""
 
         return game_object.hit_points_left <= 0 or not self.within_screen(game_object)
-
-    # HELPER METHODS FOR COLLISIONS; Since they all have a unique length I can just use the lengths here
-    def is_enemy(self, game_object):
-        """returns: boolean; if the game_object is just an enemy (not a weapon) --> object type would be 'Enemy'"""
-
-        return len(game_object.object_type) == 5
-
-    def is_enemy_weapon(self, game_object):
-        """returns: boolean; if the game_object is an enemy's weapon --> object type would be 'Enemy Weapon'"""
-
-        return len(game_object.object_type) == 12
-
-    def is_player(self, game_object):
-        """returns: boolean; if the game_object is the player --> object type would be 'Player'"""
-
-        return len(game_object.object_type) == 6
-
-    def is_player_weapon(self, game_object):
-        """returns: boolean; if the game_object is the player's weapon --> object type would be 'Player Weapon'"""
-
-        return len(game_object.object_type) == 13
-
-    def is_platform(self, game_object):
-        """returns: boolean; if the game_object is a platform --> object type would be 'Platform'"""
-
-        return len(game_object.object_type) == 8
-
-
-
-
-
-
-
-
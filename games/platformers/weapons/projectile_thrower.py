@@ -28,6 +28,7 @@ class Projectile(Ellipse):
         self.is_moving_right = is_moving_right
         self.velocity = user_max_velocity + VelocityCalculator.give_measurement(screen_height, 50)
         self.object_type, self.user = object_type, user
+        self.collision_layer, self.collision_mask = user.weapon_collision_layer, user.weapon_collision_mask
 
     def run(self):
         """Runs all the code for the projectile to move across the screen and other necessary things"""
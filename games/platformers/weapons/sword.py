@@ -1,15 +1,17 @@
 import math
 
 from base.drawable_objects import GameObject
-from base.equations import Point, LineSegment
+from base.colors import purple
+from base.equations import Point, LineSegment, DrawnLine
 from base.events import TimedEvent
 from base.important_variables import screen_length
 from base.velocity_calculator import VelocityCalculator
+from gui_components.component import Component
 from games.platformers.weapons.weapon import Weapon
 
 
 # TODO do collision logic for the sword
-class Sword(Weapon, LineSegment):
+class Sword(Weapon, LineSegment, Component):
     """Something the user can use to hit enemies with"""
 
     full_extension_time = 2
@@ -19,6 +21,7 @@ class Sword(Weapon, LineSegment):
     length = VelocityCalculator.give_measurement(screen_length, 10)
     is_moving_right = False
     index = 0
+    color = purple
 
     def __init__(self, use_action, user):
         """Initializes the object"""
@@ -43,6 +46,11 @@ class Sword(Weapon, LineSegment):
         else:
             self.start_point, self.end_point = Point(0, 0), Point(0, 0)
 
+    def render(self):
+        """Renders the sword (LineSegments can't render themselves)"""
+
+        DrawnLine(self, self.color).render()
+
     def run_enemy_collision(self, user, index_of_sub_component):
         """Runs what should happen when the user and the weapon collide"""
 
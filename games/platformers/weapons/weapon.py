@@ -21,6 +21,8 @@ class Weapon(abc.ABC):
     is_runnable = False
     wait_event = None
     object_type = ""
+    collision_layer = 1
+    collision_mask = -1
     index = 0
     is_gone = None
 
@@ -35,6 +37,7 @@ class Weapon(abc.ABC):
         self.wait_event = TimedEvent(cool_down_time, False)
         self.sub_components = [self]
         self.object_type = f"{self.user.user_type} Weapon"
+        self.collision_layer, self.collision_mask = self.user.weapon_collision_layer, self.user.weapon_collision_mask
         self.is_gone = is_gone
 
     def run(self):
@@ -14,6 +14,9 @@ class WeaponUser(GameObject):
     weapon = None
     weapon_index_offset = 1
     index_of_user = 0
+    # The collision layer and mask that the user's weapon (and its projectiles) have
+    weapon_collision_layer = 1
+    weapon_collision_mask = -1
     index = 0
     is_on_platform = True
     sub_components = []
@@ -81,16 +84,17 @@ class WeaponUser(GameObject):
 
         self.left_collision_data, self.right_collision_data, self.top_collision_data, self.bottom_collision_data = [False, None], [False, None], [False, None], [False, None]
 
-    def get_collision_data(self, inanimate_object, is_collision):
+    def get_collision_data(self, inanimate_object):
         """returns: Boolean[4]; [is_left_collision, is_right_collision, is_top_collision, is_bottom_collision] --> the
            collision data gotten from the inanimate_object and is by the perspective of the user (has the user collided with the inanimate_object's right_edge)"""
 
         is_same_coordinates = self.right_edge == inanimate_object.x_coordinate or self.x_coordinate == inanimate_object.right_edge
 
-        return [CollisionsFinder.is_left_collision(self, inanimate_object, is_collision),
-                CollisionsFinder.is_right_collision(self, inanimate_object, is_collision),
-                CollisionsFinder.is_top_collision(self, inanimate_object, is_collision) and not is_same_coordinates,
-                CollisionsFinder.is_bottom_collision(self, inanimate_object, is_collision)]
+        # The contact is only found once per frame, so all the sides don't have to be found one at a time
+        contact = CollisionsFinder.get_contact(self, inanimate_object)
+
+        return [contact.is_left_collision, contact.is_right_collision,
+                contact.is_top_collision and not is_same_coordinates, contact.is_bottom_collision]
 
     def update_collision_data(self, inanimate_object, current_collision_data, is_collision):
         """Updates the values of the 'current_collision_data' to reflect 'is_collision' and 'inanimate_object'"""
@@ -103,7 +107,7 @@ class WeaponUser(GameObject):
 
         # NOTE: From here own down *_collision_data[0] is if a user and a inanimate_object have collided
         # and *_collision_data[1] is the inanimate_object the user collided with
-        left_collision, right_collision, top_collision, bottom_collision = self.get_collision_data(inanimate_object, True)
+        left_collision, right_collision, top_collision, bottom_collision = self.get_collision_data(inanimate_object)
 
         self.update_collision_data(inanimate_object, self.left_collision_data, left_collision)
         self.update_collision_data(inanimate_object, self.right_collision_data, right_collision)
@@ -4,6 +4,7 @@ from base.velocity_calculator import VelocityCalculator
 from base.important_variables import *
 from base.colors import *
 from base.fraction import Fraction
+from games.pong.logic.ball_predictor import BallPredictor
 
 
 class Ball(Ellipse):
@@ -53,6 +54,7 @@ class Ball(Ellipse):
         self.normal_forwards_velocity = self.base_forwards_velocity
         self.normal_upwards_velocity = self.base_forwards_velocity
         self.color = white
+        BallPredictor.invalidate(self)
 
     def movement(self):
         """ summary: moves the ball x_coordinate based upon the ball's forwards_velocity and the time that has
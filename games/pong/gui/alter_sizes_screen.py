@@ -118,10 +118,10 @@ class AlterSizesScreen(SubScreen):
         # Alters the attributes for the objects that will change the attributes down below
         for menu in self.menus:
             object_modifying = self.paddle if menu.label.__contains__("Paddle") else self.ball
-            object_modifying.__dict__[menu.properties_modifying[0]] = menu.values[0]
+            setattr(object_modifying, menu.properties_modifying[0], menu.values[0])
 
             if menu.properties_modifying.__len__() == 2:
-                object_modifying.__dict__[menu.properties_modifying[1]] = menu.values[1]
+                setattr(object_modifying, menu.properties_modifying[1], menu.values[1])
 
         # Changes all the attributes to reflect what was stored in the objects above
         change_attributes(self.game_screen.player1, self.paddle, ["length", "height", "power"])
@@ -0,0 +1,82 @@
+class BallIntercept:
+    """Where a ball reaches an x coordinate and the state of the ball the intercept was found from"""
+
+    ball_state = None
+    start_x_coordinate = 0
+    end_y_coordinate = 0
+    time = 0
+
+    def __init__(self, ball_state, start_x_coordinate, end_y_coordinate, time):
+        """ summary: initializes the object
+
+            params:
+                ball_state: tuple; everything about the ball that changes its path (see PongType.get_ball_state())
+                start_x_coordinate: double; the ball's x_coordinate when the intercept was found
+                end_y_coordinate: double; the ball's y_coordinate when it reaches the x_coordinate
+                time: double; the time it took the ball to reach the x_coordinate from start_x_coordinate
+
+            returns: None
+        """
+
+        self.ball_state, self.start_x_coordinate = ball_state, start_x_coordinate
+        self.end_y_coordinate, self.time = end_y_coordinate, time
+
+
+class BallPredictor:
+    """Remembers where the balls will reach an x coordinate (the ai's x coordinate usually), so the ai can look it up
+    every frame instead of finding the ball's path again; the ball's path only changes when it collides with something
+    other than the top and bottom of the screen or its velocity changes, so that is when an intercept is found again"""
+
+    # Ball -> {end_x_coordinate -> BallIntercept}
+    ball_to_intercepts = {}
+
+    def get_intercept(ball, end_x_coordinate, ball_state, find_intercept):
+        """ summary: finds where the ball will be when it reaches the end_x_coordinate; the remembered intercept is used if
+            the ball_state is the same as when it was found and the ball hasn't gone past the end_x_coordinate
+
+            params:
+                ball: Ball; the ball the intercept is for
+                end_x_coordinate: double; the x_coordinate the intercept is for
+                ball_state: tuple; everything about the ball that changes its path (see PongType.get_ball_state())
+                find_intercept: Function; returns [end_y_coordinate, time to reach end_x_coordinate] from where the ball is now
+
+            returns: List of double; [end_y_coordinate, time until the ball reaches the end_x_coordinate]
+        """
+
+        intercepts = BallPredictor.ball_to_intercepts.get(ball)
+
+        if intercepts is None:
+            intercepts = {}
+            BallPredictor.ball_to_intercepts[ball] = intercepts
+
+        intercept = intercepts.get(end_x_coordinate)
+
+        if intercept is None or not BallPredictor.is_valid(intercept, ball, end_x_coordinate, ball_state):
+            end_y_coordinate, time = find_intercept()
+            intercept = BallIntercept(ball_state, ball.x_coordinate, end_y_coordinate, time)
+            intercepts[end_x_coordinate] = intercept
+
+        # The ball moves forwards at a constant velocity, so the time it has already traveled comes from its x_coordinate
+        time_traveled = abs(ball.x_coordinate - intercept.start_x_coordinate) / ball.forwards_velocity
+        return [intercept.end_y_coordinate, intercept.time - time_traveled]
+
+    def is_valid(intercept, ball, end_x_coordinate, ball_state):
+        """returns: boolean; if the intercept is still where the ball will reach the end_x_coordinate"""
+
+        distance_left = end_x_coordinate - ball.x_coordinate
+        start_distance = end_x_coordinate - intercept.start_x_coordinate
+
+        # If the ball has gone past the end_x_coordinate it can't reach it anymore (without its path changing)
+        has_gone_past_end = distance_left * start_distance < 0
+        return intercept.ball_state == ball_state and not has_gone_past_end
+
+    def invalidate(ball):
+        """Forgets the ball's intercepts; call it when the ball's path changes without its state changing (teleporting)"""
+
+        if BallPredictor.ball_to_intercepts.__contains__(ball):
+            BallPredictor.ball_to_intercepts.pop(ball)
+
+    def reset():
+        """Forgets every ball's intercepts"""
+
+        BallPredictor.ball_to_intercepts = {}
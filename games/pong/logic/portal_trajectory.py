@@ -0,0 +1,295 @@
+from bisect import bisect_right
+
+from base.important_variables import screen_height
+
+
+class TeleportEvent:
+    """When and where the ball goes through a portal on its way to the end x coordinate"""
+
+    time = 0
+    portal_opening = None
+    exit_portal_opening = None
+    x_coordinate = 0
+    y_coordinate = 0
+    ball_is_moving_down = False
+
+    def __init__(self, time, portal_opening, exit_portal_opening, x_coordinate, y_coordinate, ball_is_moving_down):
+        """ summary: initializes the object
+
+            params:
+                time: double; the time from the start of the trajectory that the ball touches the portal_opening
+                portal_opening: PortalOpening; the portal opening the ball goes into
+                exit_portal_opening: PortalOpening; the portal opening the ball comes out of
+                x_coordinate: double; the ball's x_coordinate after it comes out of the exit_portal_opening
+                y_coordinate: double; the ball's y_coordinate after it comes out of the exit_portal_opening
+                ball_is_moving_down: boolean; if the ball is moving down when it comes out
+
+            returns: None
+        """
+
+        self.time, self.portal_opening, self.exit_portal_opening = time, portal_opening, exit_portal_opening
+        self.x_coordinate, self.y_coordinate, self.ball_is_moving_down = x_coordinate, y_coordinate, ball_is_moving_down
+
+
+class PortalTrajectory:
+    """Finds where the ball reaches an x coordinate when there are moving portals in the way. The ball and the portal
+    openings move in straight lines between bounces (ball) and between path points (portal openings), so the trajectory
+    is split into pieces where both move in a straight line and the first time their bounding boxes touch is solved for
+    on each piece; the portal openings' coordinates come straight from their paths' lines at the needed time, so the
+    paths are never copied or moved
+
+    The portal openings are drawn as ellipses, but PortalPong teleports the ball when CollisionsFinder.is_collision() says
+    it collided with an opening and that compares bounding boxes; so bounding boxes are used here too (an ellipse test
+    would miss the teleports where the ball only touches the corner of an opening's box, which the game still makes)"""
+
+    def get_trajectory(ball, end_x_coordinate, portals, portal_paths):
+        """ summary: finds the ball's y_coordinate when it reaches the end_x_coordinate and every teleport on the way there;
+            a portal can only be gone through once (it is disabled after that until a paddle hits the ball)
+
+            params:
+                ball: Ball; the ball (its coordinates, velocities, and size are used)
+                end_x_coordinate: double; the x_coordinate the trajectory ends at
+                portals: List of Portal; the portals of the game (only the enabled ones can be gone through)
+                portal_paths: List of VelocityPath; the unending paths of the portal openings (two per portal, in order)
+
+            returns: List; [end_y_coordinate, time to reach the end_x_coordinate, List of TeleportEvent]
+        """
+
+        x_coordinate, y_coordinate, is_moving_down = ball.x_coordinate, ball.y_coordinate, ball.is_moving_down
+        enabled_portal_indexes = [x for x in range(len(portals)) if portals[x].is_enabled]
+        teleport_events = []
+        total_time = 0
+
+        while True:
+            leg_time = abs(end_x_coordinate - x_coordinate) / ball.forwards_velocity
+            ball_pieces = PortalTrajectory.get_ball_pieces(ball, y_coordinate, is_moving_down, leg_time)
+            x_velocity = ball.forwards_velocity if end_x_coordinate > x_coordinate else -ball.forwards_velocity
+
+            collision_time, collision_index = float("inf"), None
+
+            for portal_index in enabled_portal_indexes:
+                for opening_index in [portal_index * 2, portal_index * 2 + 1]:
+                    portal_opening = PortalTrajectory.get_portal_opening(portals[portal_index], opening_index)
+                    portal_pieces = PortalTrajectory.get_portal_pieces(portal_paths[opening_index], total_time, leg_time)
+                    time = PortalTrajectory.get_collision_time(ball, x_coordinate, x_velocity, ball_pieces,
+                                                               portal_opening, portal_pieces)
+
+                    if time is not None and time < collision_time:
+                        collision_time, collision_index = time, opening_index
+
+            if collision_index is None:
+                end_y_coordinate = ball_pieces[len(ball_pieces) - 1][3] if len(ball_pieces) != 0 else y_coordinate
+                return [end_y_coordinate, total_time + leg_time, teleport_events]
+
+            # The ball comes out of the portal's other opening (its index is the other one of the pair)
+            exit_index = collision_index + 1 if collision_index % 2 == 0 else collision_index - 1
+            portal = portals[collision_index // 2]
+            portal_opening = PortalTrajectory.get_portal_opening(portal, collision_index)
+            exit_portal_opening = PortalTrajectory.get_portal_opening(portal, exit_index)
+
+            is_moving_down = PortalTrajectory.get_ball_direction(ball_pieces, collision_time, is_moving_down)
+            total_time += collision_time
+            exit_x_coordinate, exit_y_coordinate = PortalTrajectory.get_path_coordinates(portal_paths[exit_index], total_time)
+
+            # The ball teleports to the middle of the exit portal opening
+            x_coordinate = exit_x_coordinate + exit_portal_opening.length / 2
+            y_coordinate = exit_y_coordinate + exit_portal_opening.height / 2
+
+            teleport_events.append(TeleportEvent(total_time, portal_opening, exit_portal_opening, x_coordinate,
+                                                 y_coordinate, is_moving_down))
+            enabled_portal_indexes.remove(collision_index // 2)
+
+    def get_portal_opening(portal, opening_index):
+        """returns: PortalOpening; the portal's first opening if the opening_index is even otherwise its second one"""
+
+        return portal.portal_opening1 if opening_index % 2 == 0 else portal.portal_opening2
+
+    def get_ball_pieces(ball, y_coordinate, is_moving_down, total_time):
+        """ summary: splits the ball's vertical movement into the straight lines between its bounces (the same bounces as
+            PongType.get_ball_path_data())
+
+            params:
+                ball: Ball; the ball (its upwards_velocity and height are used)
+                y_coordinate: double; the ball's y_coordinate at the start
+                is_moving_down: boolean; if the ball is moving down at the start
+                total_time: double; how long the ball moves for
+
+            returns: List of tuple; (start_time, end_time, start_y_coordinate, end_y_coordinate, is_moving_down) of each piece
+        """
+
+        pieces = []
+        current_time = 0
+        time_left = total_time
+
+        while time_left > 0:
+            displacement = screen_height - (y_coordinate + ball.height) if is_moving_down else -y_coordinate
+            time = abs(displacement / ball.upwards_velocity)
+            piece_is_moving_down = is_moving_down
+
+            if time_left - time < 0:
+                distance = ball.upwards_velocity * time_left
+                displacement = distance if is_moving_down else -distance
+                time = time_left
+
+            else:
+                is_moving_down = not is_moving_down
+
+            pieces.append((current_time, current_time + time, y_coordinate, y_coordinate + displacement, piece_is_moving_down))
+
+            y_coordinate += displacement
+            current_time += time
+            time_left -= time
+
+        return pieces
+
+    def get_ball_direction(ball_pieces, time, is_moving_down):
+        """returns: boolean; if the ball is moving down at that time (is_moving_down if there are no pieces)"""
+
+        for start_time, end_time, start_y_coordinate, end_y_coordinate, piece_is_moving_down in ball_pieces:
+            if time < end_time:
+                return piece_is_moving_down
+
+            # Like get_ball_path_data(), once it reaches the top or bottom it has already bounced
+            is_moving_down = not piece_is_moving_down if time == end_time else piece_is_moving_down
+
+        return is_moving_down
+
+    def get_path_coordinates(portal_path, time):
+        """returns: List of double; [x_coordinate, y_coordinate] of the unending portal_path at time after its total_time"""
+
+        path_time = (portal_path.total_time + time) % portal_path.last_end_time
+        index = PortalTrajectory.get_line_at(portal_path, path_time)[0]
+        return [portal_path.x_coordinate_lines[index].get_y_coordinate(path_time),
+                portal_path.y_coordinate_lines[index].get_y_coordinate(path_time)]
+
+    def get_line_at(portal_path, path_time, index=0):
+        """ summary: finds the line of the unending portal_path at the path_time; the line at the index is checked first
+            (the next line is usually the one after the last one) and otherwise the lines' end times are binary searched
+
+            params:
+                portal_path: VelocityPath; the portal opening's path
+                path_time: double; the time on the path (it wraps around the path's last_end_time)
+                index: int; the index of the line that is checked first
+
+            returns: List; [index, start time, end time] of the first line that ends after the path_time
+        """
+
+        path_time %= portal_path.last_end_time
+        line_start_times, line_end_times = portal_path.line_start_times, portal_path.line_end_times
+        last_index = len(line_end_times) - 1
+
+        is_at_index = (index <= last_index and path_time < line_end_times[index]
+                       and (index == 0 or line_end_times[index - 1] <= path_time))
+
+        if not portal_path.lines_are_sorted:
+            index = PortalTrajectory.find_line_at(portal_path, path_time)
+
+        elif not is_at_index:
+            index = bisect_right(line_end_times, path_time)
+
+        if index > last_index:
+            return [last_index, line_start_times[last_index], portal_path.last_end_time]
+
+        return [index, line_start_times[index], line_end_times[index]]
+
+    def find_line_at(portal_path, path_time):
+        """returns: int; the index get_line_at() finds by checking every line (used if the lines aren't sorted)"""
+
+        line_end_times = portal_path.line_end_times
+
+        for x in range(len(line_end_times)):
+            if path_time < line_end_times[x]:
+                return x
+
+        return len(line_end_times)
+
+    def get_portal_pieces(portal_path, start_time, total_time):
+        """ summary: splits the portal opening's movement into the straight lines of its unending path
+
+            params:
+                portal_path: VelocityPath; the portal opening's path
+                start_time: double; the time after the path's total_time the pieces start at
+                total_time: double; how long the portal opening moves for
+
+            returns: List of tuple; (start_time, end_time, start_x_coordinate, x_velocity, start_y_coordinate, y_velocity)
+            of each piece (the times start at 0)
+        """
+
+        pieces = []
+        current_time, index = 0, 0
+        path_time = (portal_path.total_time + start_time) % portal_path.last_end_time
+
+        while current_time < total_time:
+            index, line_start_time, line_end_time = PortalTrajectory.get_line_at(portal_path, path_time, index)
+            x_coordinate_line, y_coordinate_line = portal_path.x_coordinate_lines[index], portal_path.y_coordinate_lines[index]
+            piece_time = min(line_end_time - path_time, total_time - current_time)
+
+            pieces.append((current_time, current_time + piece_time, x_coordinate_line.get_y_coordinate(path_time), x_coordinate_line.slope,
+                           y_coordinate_line.get_y_coordinate(path_time), y_coordinate_line.slope))
+
+            current_time += piece_time
+            path_time = line_end_time % portal_path.last_end_time
+            # The next piece is on the next line (or the first line after the path wraps around)
+            index = (index + 1) % len(portal_path.line_end_times)
+
+        return pieces
+
+    def get_collision_time(ball, x_coordinate, x_velocity, ball_pieces, portal_opening, portal_pieces):
+        """ summary: finds the first time the ball's and the portal opening's bounding boxes touch (the same test the game
+            uses for portal collisions); both move in a straight line while a ball piece and a portal piece overlap, so the
+            gap between them is a linear function of time there
+
+            params:
+                ball: Ball; the ball (its length and height are used)
+                x_coordinate: double; the ball's x_coordinate at the start
+                x_velocity: double; the ball's horizontal velocity (negative if it moves left)
+                ball_pieces: List of tuple; what get_ball_pieces() returned
+                portal_opening: PortalOpening; the portal opening (its length and height are used)
+                portal_pieces: List of tuple; what get_portal_pieces() returned
+
+            returns: double; the first time they touch (None if they don't)
+        """
+
+        ball_index, portal_index = 0, 0
+
+        while ball_index < len(ball_pieces) and portal_index < len(portal_pieces):
+            ball_start_time, ball_end_time, ball_start_y_coordinate, ball_end_y_coordinate, unused = ball_pieces[ball_index]
+            portal_start_time, portal_end_time, portal_x_coordinate, portal_x_velocity, portal_y_coordinate, portal_y_velocity = portal_pieces[portal_index]
+
+            start_time, end_time = max(ball_start_time, portal_start_time), min(ball_end_time, portal_end_time)
+            ball_piece_time = ball_end_time - ball_start_time
+            ball_y_velocity = (ball_end_y_coordinate - ball_start_y_coordinate) / ball_piece_time if ball_piece_time != 0 else 0
+
+            # The gaps (ball - portal opening) at the start_time and how fast they change
+            x_gap = (x_coordinate + x_velocity * start_time) - (portal_x_coordinate + portal_x_velocity * (start_time - portal_start_time))
+            y_gap = ((ball_start_y_coordinate + ball_y_velocity * (start_time - ball_start_time)) -
+                     (portal_y_coordinate + portal_y_velocity * (start_time - portal_start_time)))
+
+            # The bounding boxes touch while -ball.length <= x_gap <= portal length (and the same for the y_gap)
+            x_times = PortalTrajectory.get_times_between(x_gap, x_velocity - portal_x_velocity, -ball.length, portal_opening.length)
+            y_times = PortalTrajectory.get_times_between(y_gap, ball_y_velocity - portal_y_velocity, -ball.height, portal_opening.height)
+
+            if x_times is not None and y_times is not None:
+                first_time = max(x_times[0], y_times[0], 0)
+                last_time = min(x_times[1], y_times[1], end_time - start_time)
+
+                if first_time <= last_time:
+                    return start_time + first_time
+
+            if ball_end_time <= portal_end_time:
+                ball_index += 1
+
+            else:
+                portal_index += 1
+
+        return None
+
+    def get_times_between(gap, gap_velocity, min_gap, max_gap):
+        """returns: List of double; [start, end] the times the gap (which changes by gap_velocity) is between min_gap and
+        max_gap (None if it never is)"""
+
+        if gap_velocity == 0:
+            return [float("-inf"), float("inf")] if min_gap <= gap <= max_gap else None
+
+        times = [(min_gap - gap) / gap_velocity, (max_gap - gap) / gap_velocity]
+        return [min(times), max(times)]
@@ -148,6 +148,13 @@ class GravityPong(PongType):
 
         return return_value
 
+    def get_ball_state(self, ball):
+        """returns: tuple; everything about the ball that changes its path (its physics equation does too)"""
+
+        equation = self.physics_equation
+        return super().get_ball_state(ball) + (equation.acceleration, equation.initial_velocity, equation.initial_distance,
+                                               self.needed_vertex_increase)
+
     def get_ball_end_y_coordinate(self, ai_x_coordinate):
         """returns: double; the ball's y_coordinate when it reaches the ai"""
 
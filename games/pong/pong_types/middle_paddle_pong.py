@@ -77,7 +77,7 @@ class MiddlePaddlePong(PongType):
         """
 
         super().add_needed_objects()
-        HistoryKeeper.add(self.middle_paddle, self.middle_paddle.name, True)
+        HistoryKeeper.add_if_changed(self.middle_paddle, self.middle_paddle.name)
 
     def reset(self):
         """ summary: resets everything necessary after each time someone scores
@@ -3,6 +3,7 @@ from base.velocity_calculator import VelocityCalculator
 from base.engines import CollisionsFinder
 from games.pong.pong_types.pong_type import PongType
 from games.pong.base_pong.players import Paddle, AI
+from games.pong.logic.ball_predictor import BallPredictor
 
 
 class NormalPong(PongType):
@@ -74,6 +75,9 @@ class NormalPong(PongType):
         elif is_collision:
             ball.middle_hit(paddle.power / 10)
 
+        if is_collision:
+            BallPredictor.invalidate(ball)
+
     def ball_movement(self):
         """ summary: does the horizontal and vertical movement of the ball by calling _ball_movement()
             params: None
@@ -1,4 +1,6 @@
-from copy import deepcopy
+from copy import copy, deepcopy
+from base.background_worker import BackgroundWorker
+from base.dimensions import Dimensions
 from base.engine_utility_classes import CollisionsUtilityFunctions
 from base.engines import CollisionsFinder
 from base.equations import Point, LineSegment
@@ -14,6 +16,31 @@ from games.pong.pong_types.normal_pong import NormalPong
 from base.utility_functions import get_min_list_item, get_index_of_min_item, get_converted_list
 
 
+class PlannedObject(Dimensions):
+    """The values of the ball or the AI that the AI's planner uses; they are copied from the real object when the plan is
+    started, so the planner only reads numbers the frame can't change while it runs"""
+
+    velocity = 0
+    forwards_velocity = 0
+    upwards_velocity = 0
+    is_moving_right = False
+    is_moving_down = False
+    path = None
+
+    def __init__(self, game_object):
+        """ summary: Initializes the object with the game_object's dimensions and forwards_velocity (the other values are
+            set by whatever needs them)
+
+            params:
+                game_object: Ball or AI; the object whose values are copied
+
+            returns: None
+        """
+
+        super().__init__(game_object.x_coordinate, game_object.y_coordinate, game_object.length, game_object.height)
+        self.forwards_velocity = game_object.forwards_velocity
+
+
 # TODO fix code so you don't have to assume player2 is the ai
 # TODO write the code so it takes into account both vertical and horizontal time
 class OmnidirectionalPong(NormalPong):
@@ -49,6 +76,8 @@ class OmnidirectionalPong(NormalPong):
     player_who_hit_ball_key = "player who hit ball"
     player_path = None
     is_top_or_bottom_collision = False
+    # Makes the AI's plans (run_state_changes()) on another thread, so the frame doesn't wait for them
+    planner = None
 
     def __init__(self, player1, player2, ball):
         """ summary: Initializes the PongType with the needed objects to run its methods
@@ -63,6 +92,7 @@ class OmnidirectionalPong(NormalPong):
 
         super().__init__(player1, player2, ball)
         self.last_ball = self.ball
+        self.planner = BackgroundWorker("OmnidirectionalPong AI planner")
         self.player1.can_move_left, self.player2.can_move_left = False, False
         self.player1.can_move_right, self.player2.can_move_right = False, False
 
@@ -136,8 +166,9 @@ class OmnidirectionalPong(NormalPong):
     def set_is_top_or_bottom_collision(self):
         """Stores whether the players have collided with each other's top or bottom in a variable, which can be accessed by the code"""
 
-        is_moving_top_or_bottom_collision = (CollisionsFinder.is_a_top_collision(self.player1, self.player2)
-                                             or CollisionsFinder.is_a_bottom_collision(self.player1, self.player2))
+        # Player1 hitting player2's top is the same as player2 hitting player1's bottom, so only player1's contact is needed
+        contact = CollisionsFinder.get_contact(self.player1, self.player2)
+        is_moving_top_or_bottom_collision = contact.is_top_collision or contact.is_bottom_collision
 
         # Prevents a weird rounding error by casting them to integers
         players_top_and_bottoms_are_touching = (int(self.player1.bottom) == int(self.player2.y_coordinate) or
@@ -318,9 +349,13 @@ class OmnidirectionalPong(NormalPong):
 
     # AI CODE
     def run_ai(self):
-        # So when it is first initialized there is a player path
-        if self.next_state != self.current_state or self.player_path is None:
-            self.run_state_changes()
+        # The newest plan has to be used first, so a plan isn't made again for a state change the planner already made
+        self.use_new_plan()
+
+        # So when it is first initialized there is a player path; while a plan is being made the AI keeps following the last one
+        if (self.next_state != self.current_state or self.player_path is None) and not self.planner.is_busy():
+            snapshot = self.get_snapshot()
+            self.planner.submit(lambda: snapshot.get_plan())
 
         # BACKING_UP
         self.run_state_change(self.States.BACKING_UP, [
@@ -359,6 +394,39 @@ class OmnidirectionalPong(NormalPong):
         # Done using this variable, so it should be False again
         self.a_player_has_scored = False
 
+    def get_snapshot(self):
+        """returns: OmnidirectionalPong; a copy of this that only has the values the AI plans with (PlannedObjects instead of
+        the ball and AI and its own ball_predictions), so the planner never uses what the frame is changing"""
+
+        snapshot = copy(self)
+        snapshot.ball, snapshot.player2 = PlannedObject(self.ball), PlannedObject(self.player2)
+        snapshot.ball.upwards_velocity = self.ball.upwards_velocity
+        snapshot.ball.is_moving_right, snapshot.ball.is_moving_down = self.ball.is_moving_right, self.ball.is_moving_down
+        # The planner adds points to the AI's path, so it needs its own copy
+        snapshot.player2.velocity, snapshot.player2.path = self.player2.velocity, deepcopy(self.player2.path)
+        # The planner doesn't use them; None makes sure it can't use the real ones by accident
+        snapshot.player1, snapshot.last_ball = None, None
+        snapshot.ball_predictions, snapshot.ball_predictions_frame = {}, None
+        return snapshot
+
+    def get_plan(self):
+        """returns: OmnidirectionalPong; this (a snapshot) after the state changes were ran, so it has the AI's new plan"""
+
+        self.run_state_changes()
+        return self
+
+    def use_new_plan(self):
+        """Makes the AI follow the newest plan the planner made (if there is a new one)"""
+
+        plan = self.planner.get_result()
+
+        if plan is None:
+            return
+
+        self.player_path, self.player2.path, self.current_state = plan.player_path, plan.player2.path, plan.current_state
+        self.ball_data, self.ball_x_path, self.ball_y_path = plan.ball_data, plan.ball_x_path, plan.ball_y_path
+        self.ball_right_edge_path, self.ball_bottom_path = plan.ball_right_edge_path, plan.ball_bottom_path
+
     def can_intercept_object(self, intercepted_object_velocity, intercepted_object):
         """returns: boolean; if the AI can intercept that object (assumes the object is going rightwards); only takes into account x coordinate"""
         return_value = True
@@ -382,6 +450,10 @@ class OmnidirectionalPong(NormalPong):
         """returns: boolean; if the AI is done backing away from the ball"""
         return_value = False
 
+        # The planner hasn't made the first path yet
+        if self.player_path is None:
+            return return_value
+
         # Assumes the backing up path is one singular line
         start_x_coordinate: Point = self.player_path.x_coordinate_lines[0].start_point.y_coordinate
         end_x_coordinate: Point = self.player_path.x_coordinate_lines[0].end_point.y_coordinate
@@ -4,6 +4,7 @@ from base.important_variables import screen_height
 from base.path import Path, PathLine
 from base.utility_classes import HistoryKeeper
 from games.pong.base_pong.score_keeper import ScoreKeeper
+from games.pong.logic.ball_predictor import BallPredictor
 import abc
 
 
@@ -12,6 +13,10 @@ class PongType(abc.ABC):
     player2 = None
     ball = None
     is_single_player = False
+    # (ball_y_coordinate, ball_x_coordinate, end_x_coordinate, ball_is_moving_down, forwards velocity, upwards velocity,
+    # ball height) -> [end_y_coordinate, ball_is_moving_down, time]; only has the predictions from this frame
+    ball_predictions = {}
+    ball_predictions_frame = None
 
     def __init__(self, player1, player2, ball):
         """ summary: Initializes the PongType with the needed objects to run its methods
@@ -51,9 +56,9 @@ class PongType(abc.ABC):
             returns: None
         """
 
-        HistoryKeeper.add(self.player1, self.player1.name, True)
-        HistoryKeeper.add(self.player2, self.player2.name, True)
-        HistoryKeeper.add(self.ball, self.ball.name, True)
+        HistoryKeeper.add_if_changed(self.player1, self.player1.name)
+        HistoryKeeper.add_if_changed(self.player2, self.player2.name)
+        HistoryKeeper.add_if_changed(self.ball, self.ball.name)
     
     def player1_has_scored(self):
         """ summary: finds out if the ball has gone beyond the screens right boundary
@@ -95,10 +100,22 @@ class PongType(abc.ABC):
     def get_ball_end_y_coordinate(self, ai_x_coordinate):
         """returns: double; the ball's y_coordinate when it reaches the ai"""
 
-        return self.get_ball_path(ai_x_coordinate).get_end_points()[0].y_coordinate
+        return self.get_ball_prediction(self.ball.y_coordinate, self.ball.x_coordinate, ai_x_coordinate, self.ball.is_moving_down)[0]
 
     def get_ai_data(self, ai_x_coordinate):
-        """ summary: calls get_ball_path() to get the ball's path and then just calculates the time for the ball to reach the ai
+        """ summary: looks up where the ball will reach the ai in the BallPredictor (find_ai_data() is only called if the
+            ball's path has changed since it was last found)
+
+            params:
+                ai_x_coordinate: double; the x coordinate of the ai
+
+            returns: [ball_y_coordinate, ball_time_to_ai]"""
+
+        return BallPredictor.get_intercept(self.ball, ai_x_coordinate, self.get_ball_state(self.ball),
+                                           lambda: self.find_ai_data(ai_x_coordinate))
+
+    def find_ai_data(self, ai_x_coordinate):
+        """ summary: calls get_ball_end_y_coordinate() to get where the ball ends and then just calculates the time for the ball to reach the ai
 
             params:
                 ai_x_coordinate: double; the x coordinate of the ai
@@ -108,8 +125,77 @@ class PongType(abc.ABC):
 
         return [self.get_ball_end_y_coordinate(ai_x_coordinate), time_to_travel_distance]
 
+    def get_ball_state(self, ball):
+        """returns: tuple; everything about the ball that changes its path (if it changes, the ball's path is found again)"""
+
+        return (ball.forwards_velocity, ball.upwards_velocity, ball.is_moving_right, ball.length, ball.height)
+
+    def get_ball_prediction(self, ball_y_coordinate, ball_x_coordinate, end_x_coordinate, ball_is_moving_down, ball_forwards_velocity=None):
+        """ summary: finds where the ball will be when it reaches the end_x_coordinate without going through every bounce
+            like get_ball_path_data() does: the ball's vertical movement is "unfolded" (as if there were no walls) and then
+            folded back between the top of the screen and the lowest the ball can go; the predictions are remembered for the
+            rest of the frame, so asking again is free
+
+            params:
+                ball_y_coordinate: double; the ball's y_coordinate
+                ball_x_coordinate: double; the ball's x_coordinate
+                end_x_coordinate: double; the x_coordinate the prediction is for
+                ball_is_moving_down: boolean; if the ball is moving down
+                ball_forwards_velocity: double; the ball's forwards velocity (self.ball's if None)
+
+            returns: List; [end_y_coordinate, ball is moving down at the end, time to reach the end_x_coordinate]
+        """
+
+        ball_forwards_velocity = ball_forwards_velocity if ball_forwards_velocity is not None else self.ball.forwards_velocity
+
+        frame_key = HistoryKeeper.get_frame_key()
+
+        if self.ball_predictions_frame != frame_key:
+            self.ball_predictions, self.ball_predictions_frame = {}, frame_key
+
+        key = (ball_y_coordinate, ball_x_coordinate, end_x_coordinate, ball_is_moving_down, ball_forwards_velocity,
+               self.ball.upwards_velocity, self.ball.height)
+        prediction = self.ball_predictions.get(key)
+
+        if prediction is None:
+            prediction = self._get_ball_prediction(ball_y_coordinate, ball_x_coordinate, end_x_coordinate, ball_is_moving_down, ball_forwards_velocity)
+            self.ball_predictions[key] = prediction
+
+        return prediction
+
+    def _get_ball_prediction(self, ball_y_coordinate, ball_x_coordinate, end_x_coordinate, ball_is_moving_down, ball_forwards_velocity):
+        """returns: List; what get_ball_prediction() returns (without remembering it)"""
+
+        time = abs(end_x_coordinate - ball_x_coordinate) / ball_forwards_velocity
+        # The ball's y_coordinate can be anywhere from 0 to lowest_y_coordinate
+        lowest_y_coordinate = screen_height - self.ball.height
+
+        if time == 0:
+            return [ball_y_coordinate, ball_is_moving_down, 0]
+
+        # The ball's path has to be followed bounce by bounce if it starts outside the screen (the bounces are strange then)
+        if ball_y_coordinate < 0 or ball_y_coordinate > lowest_y_coordinate or lowest_y_coordinate <= 0:
+            ball_path, ball_is_moving_down, times = self.get_ball_path_data(ball_y_coordinate, ball_x_coordinate, end_x_coordinate,
+                                                                            ball_is_moving_down, ball_forwards_velocity)
+            return [ball_path.get_end_points()[0].y_coordinate, ball_is_moving_down, times[len(times) - 1]]
+
+        y_distance = self.ball.upwards_velocity * time
+        unfolded_y_coordinate = ball_y_coordinate + y_distance if ball_is_moving_down else ball_y_coordinate - y_distance
+
+        # Going down and back up is one period; in the first half it moves the same way it started and in the second half
+        # It moves the other way
+        period_position = unfolded_y_coordinate % (2 * lowest_y_coordinate)
+        is_in_first_half = period_position < lowest_y_coordinate
+
+        # The ball ends right at the top or bottom, so (like get_ball_path_data()) it has already bounced off of it
+        if period_position == 0 or period_position == lowest_y_coordinate:
+            return [period_position, period_position == 0, time]
+
+        end_y_coordinate = period_position if is_in_first_half else 2 * lowest_y_coordinate - period_position
+        return [end_y_coordinate, ball_is_moving_down == is_in_first_half, time]
+
     def get_ball_path_data(self, ball_y_coordinate, ball_x_coordinate, end_x_coordinate, ball_is_moving_down, ball_forwards_velocity=None):
-        """returns: [ball_path, ball is moving down at the end, times]"""
+        """returns: [ball_path, ball is moving down at the end, times]; use get_ball_prediction() if the path isn't needed"""
 
         ball_forwards_velocity = ball_forwards_velocity if ball_forwards_velocity is not None else self.ball.forwards_velocity
         path = Path(Point(ball_x_coordinate, ball_y_coordinate), self.ball.height, self.ball.length)
@@ -160,4 +246,4 @@ class PongType(abc.ABC):
     def ball_direction_is_down(self, ball_y_coordinate, ball_x_coordinate, end_x_coordinate, ball_is_moving_down):
         """returns: boolean; if the ball's movement direction is down"""
 
-        return self.get_ball_path_data(ball_y_coordinate, ball_x_coordinate, end_x_coordinate, ball_is_moving_down)[1]
+        return self.get_ball_prediction(ball_y_coordinate, ball_x_coordinate, end_x_coordinate, ball_is_moving_down)[1]
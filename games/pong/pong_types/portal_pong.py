@@ -1,15 +1,15 @@
 import random
-from copy import deepcopy
 
-from base.engine_utility_classes import CollisionsUtilityFunctions
 from base.equations import Point
 from base.path import VelocityPath
 from base.utility_classes import HistoryKeeper
-from base.utility_functions import percentage_to_number, get_min_list_item
+from base.utility_functions import percentage_to_number
 from base.engines import CollisionsFinder
 from base.velocity_calculator import VelocityCalculator
 from games.pong.pong_types.pong_type import PongType
 from games.pong.pong_types.normal_pong import NormalPong
+from games.pong.logic.ball_predictor import BallPredictor
+from games.pong.logic.portal_trajectory import PortalTrajectory
 from base.important_variables import *
 from base.drawable_objects import Ellipse
 from base.colors import *
@@ -104,6 +104,9 @@ class Portal:
         object.x_coordinate = portal_end.x_midpoint
         object.y_coordinate = portal_end.y_midpoint
 
+        # The object's velocity didn't change, but its path did
+        BallPredictor.invalidate(object)
+
     def run(self, ball):
         """ summary: runs all the logic for teleporting the ball
 
@@ -316,130 +319,18 @@ class PortalPong(PongType):
             HistoryKeeper.add(portal.portal_opening1, portal.portal_opening1.name, False)
             HistoryKeeper.add(portal.portal_opening2, portal.portal_opening2.name, False)
 
-    def get_ai_data(self, ai_x_coordinate):
-        """returns: [ball_y_coordinate, ball_time_to_ai]"""
-        enabled_portals = []
-
-        for portal in self.portals:
-            if portal.is_enabled:
-                enabled_portals.append(portal)
-
-        portal_paths = deepcopy(self.portal_paths)
-
-        ball_x_coordinate = self.ball.x_coordinate
-        ball_y_coordinate = self.ball.y_coordinate
-        ball_is_moving_down = self.ball.is_moving_down
-        total_time = 0
-
-        while True:
-            hit_a_portal = False
-            collision_times = []
-            portal_openings = []
-            portal_opening_paths = []
-
-            ball_path_data = self.get_ball_path_data(ball_y_coordinate, ball_x_coordinate, ai_x_coordinate,
-                                                      ball_is_moving_down)
-            ball_path = ball_path_data[0]
-            times = ball_path_data[2]
-            ball_paths = VelocityPath.get_paths_from_path(ball_path, times)
-
-            self.add_to_lists(collision_times, ai_x_coordinate, enabled_portals, ball_paths,
-                              ball_x_coordinate, portal_opening_paths, portal_paths, portal_openings)
-
-            filtered_collision_times = list(filter(lambda item: item != -1, collision_times))
-
-            index_of_min_time, collision_time = 0, 0
-
-            if len(filtered_collision_times) == 0:
-                collision_time = -1
-
-            else:
-                index_of_min_time = collision_times.index(get_min_list_item(filtered_collision_times))
-                collision_time = collision_times[index_of_min_time]
-
-            if collision_time != -1:
-                path_of_portal = portal_opening_paths[index_of_min_time]
-                portal_opening = portal_openings[index_of_min_time]
-                # Have to divide by two because there are two portal openings (collision_times, etc.) to every portal
-                portal = enabled_portals[index_of_min_time // 2]
-
-                coordinates = self.get_ball_coordinates(ball_paths[0], path_of_portal, portal_opening, collision_time)
-                new_ball_x_coordinate, new_ball_y_coordinate, ball_collision_x_coordinate = coordinates
-
-                self._set_portal_path_times(collision_time, portal_paths)
-
-                total_time += collision_time
-
-                enabled_portals.remove(portal)
-                ball_is_moving_down = self.ball_direction_is_down(ball_y_coordinate, ball_x_coordinate,
-                                                                  ball_collision_x_coordinate, ball_is_moving_down)
-                ball_x_coordinate, ball_y_coordinate = new_ball_x_coordinate, new_ball_y_coordinate
-                hit_a_portal = True
-
-            if not hit_a_portal:
-                ball_path_data = self.get_ball_path_data(ball_y_coordinate, ball_x_coordinate, ai_x_coordinate,
-                                                          ball_is_moving_down)
-
-                ball_path, times = ball_path_data[0], ball_path_data[2]
-                # The last time in this list is the total time
-                total_time += times[len(times) - 1]
-
-                ball_y_coordinate = ball_path.get_end_points()[0].y_coordinate
-
-                break
-
-        return [ball_y_coordinate, total_time]
-
-    def _set_portal_path_times(self, time_to_collision, portal_paths):
-        """Sets the portal paths time to the time for the collision; allows for accurate predictions of where the portals will be"""
-
-        for portal_path in portal_paths:
-            portal_path.set_time(portal_path.total_time + time_to_collision)
-
-    def get_ball_coordinates(self, ball_x_path, path_of_portal: VelocityPath, portal_opening, collision_time):
-        """ summary: finds the necessary ball coordinates for figuring out the time and y coordinate of the ball for the ai
-
-            params:
-                ball_x_path: SimplePath; the ball's x coordinate path in relation to time (time being x and x_coordinate being y)
-                path_of_portal: VelocityPath; the path of the portal which the ball will teleport to
-                collision_time: double; the time of the ball's collision with the portal
-                portal_opening: PortalOpening; the portal which the ball will be teleported to
-
-            returns: Double[3]; [new_ball_x_coordinate, new_ball_y_coordinate, ball_collision_x_coordinate]
-        """
-
-        portal_x_coordinate, portal_y_coordinate = path_of_portal._get_coordinates(collision_time + path_of_portal.total_time)
-        # Have to add length / 2 and height / 2 because the ball teleports to the middle of the portal
-        new_ball_x_coordinate = portal_x_coordinate + portal_opening.length / 2
-        new_ball_y_coordinate = portal_y_coordinate + portal_opening.height / 2
-
-        ball_collision_x_coordinate = ball_x_path.get_y_coordinate(collision_time)
-
-        return [new_ball_x_coordinate, new_ball_y_coordinate, ball_collision_x_coordinate]
-
-    def add_to_lists(self, collision_times, ai_x_coordinate, enabled_portals, ball_paths, ball_x_coordinate, portal_opening_paths, portal_paths, portal_openings):
-        """Adds all the necessary data to the lists provided for figuring out where the ball is going to end up"""
-
-        for portal in enabled_portals:
-            total_time = (ai_x_coordinate - ball_x_coordinate) / self.ball.forwards_velocity
-            portal_opening1 = portal.portal_opening1
-            portal_opening2 = portal.portal_opening2
+    def get_ball_state(self, ball):
+        """returns: tuple; everything about the ball that changes its path (which portals are enabled does too)"""
 
-            index = self.portals.index(portal)
+        return super().get_ball_state(ball) + tuple(portal.is_enabled for portal in self.portals)
 
-            # Portal paths list is twice as big because it is for the portal openings not just the portal
-            portal_opening1_path: VelocityPath = portal_paths[index * 2]
-            portal_opening2_path: VelocityPath = portal_paths[index * 2 + 1]
+    def find_ai_data(self, ai_x_coordinate):
+        """returns: [ball_y_coordinate, ball_time_to_ai]; the teleports on the way come from get_ball_trajectory()"""
 
-            portal_opening1_paths = portal_opening1_path.get_paths(portal_opening1.length, portal_opening1.height,
-                                                                   total_time)
-            portal_opening2_paths = portal_opening2_path.get_paths(portal_opening2.length, portal_opening2.height,
-                                                                   total_time)
+        ball_y_coordinate, time_to_ai, teleport_events = self.get_ball_trajectory(ai_x_coordinate)
+        return [ball_y_coordinate, time_to_ai]
 
-            collision_times.append(CollisionsUtilityFunctions.get_big_path_collision_time(portal_opening1_paths, ball_paths))
-            collision_times.append(CollisionsUtilityFunctions.get_big_path_collision_time(portal_opening2_paths, ball_paths))
+    def get_ball_trajectory(self, end_x_coordinate):
+        """returns: [ball_y_coordinate, time to reach the end_x_coordinate, List of TeleportEvent]; see PortalTrajectory"""
 
-            # The order which the portal openings and portal paths are added must be the inverse of the
-            # collision_times because they are where the portal will be teleported if it collided with a portal_opening
-            portal_openings += [portal_opening2, portal_opening1]
-            portal_opening_paths += [portal_opening2_path, portal_opening1_path]
\ No newline at end of file
+        return PortalTrajectory.get_trajectory(self.ball, end_x_coordinate, self.portals, self.portal_paths)
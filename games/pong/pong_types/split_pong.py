@@ -9,6 +9,7 @@ from base.velocity_calculator import VelocityCalculator
 from games.pong.pong_types.pong_type import PongType
 from games.pong.pong_types.normal_pong import NormalPong
 from games.pong.base_pong.score_keeper import ScoreKeeper
+from games.pong.logic.ball_predictor import BallPredictor
 from base.colors import red, white
 from copy import deepcopy
 
@@ -174,7 +175,7 @@ class SplitPong(PongType):
 
         for ball in self.balls:
             ball.name = id(ball)
-            HistoryKeeper.add(ball, ball.name, True)
+            HistoryKeeper.add_if_changed(ball, ball.name)
 
     def reset(self):
         """ summary: resets everything necessary after each time someone scores
@@ -191,6 +192,8 @@ class SplitPong(PongType):
         self.ball.height = self.base_ball_length
         self.ball.forwards_velocity = self.ball.base_forwards_velocity
         self.ai_data = {}
+        # The balls from the last point are gone
+        BallPredictor.reset()
         self.player2.path = None
         self.number_of_hits = 0
 
@@ -238,14 +241,19 @@ class SplitPong(PongType):
 
         return has_scored
 
-    def add_ball_to_ai_path(self, ball):
-        """Adds the ball to the ai's path, so it will hit it"""
+    def get_ball_ai_data(self, ball):
+        """returns: [ball_y_coordinate, ball_time_to_ai]; the BallPredictor remembers it until the ball's path changes"""
+
+        ai_x_coordinate = self.player2.x_coordinate - ball.length
+        find_ai_data = lambda: self.get_ball_prediction(ball.y_coordinate, ball.x_coordinate, ai_x_coordinate,
+                                                        ball.is_moving_down, ball.forwards_velocity)[0::2]
 
-        ball_path, unused, times = self.get_ball_path_data(ball.y_coordinate, ball.x_coordinate, self.player2.x_coordinate - ball.length, ball.is_moving_down, ball.forwards_velocity)
+        return BallPredictor.get_intercept(ball, ai_x_coordinate, self.get_ball_state(ball), find_ai_data)
 
-        time_to_ai = times[len(times) - 1]
+    def add_ball_to_ai_path(self, ball):
+        """Adds the ball to the ai's path, so it will hit it"""
 
-        end_y_coordinate = ball_path.get_end_points()[0].y_coordinate
+        end_y_coordinate, time_to_ai = self.get_ball_ai_data(ball)
 
         self.ai_data[ball] = AIData(time_to_ai, end_y_coordinate)
 
@@ -282,9 +290,9 @@ class SplitPong(PongType):
                 self.add_ball_to_ai_path(ball)
 
             elif should_add_ball_to_path and not self.ai_should_hit_ball:
-                ball_path, unused, times = self.get_ball_path_data(ball.y_coordinate, ball.x_coordinate, self.player2.x_coordinate - ball.length, ball.is_moving_down, ball.forwards_velocity)
-                self.player2.move_away_from_ball(ball_path.get_end_points()[0].y_coordinate, times[len(times) - 1])
-                self.ai_data[ball] = AIData(times[len(times) - 1], ball_path.get_end_points()[0].y_coordinate)
+                end_y_coordinate, time_to_ai = self.get_ball_ai_data(ball)
+                self.player2.move_away_from_ball(end_y_coordinate, time_to_ai)
+                self.ai_data[ball] = AIData(time_to_ai, end_y_coordinate)
 
             # Meaning it hit the AI and is not traveling towards it anymore
             if not ball.is_moving_right and self.ai_data.__contains__(ball):
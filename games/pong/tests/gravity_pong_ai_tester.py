@@ -99,5 +99,5 @@ while True:
 
     game_window.run()
 
-    HistoryKeeper.last_time = VelocityCalculator.time
+    HistoryKeeper.start_new_frame()
     VelocityCalculator.time = time.time() - start_time
@@ -189,10 +189,9 @@ class CollisionsFinderTests:
         return ellipse
 
     def simulate_game(self, prev_object1s, prev_object2s, object1s, object2s):
-        CollisionsFinder.objects_to_data = {}
+        CollisionsFinder.collision_cache.start_new_frame()
         HistoryKeeper.reset()
         VelocityCalculator.time = 1
-        HistoryKeeper.last_time = 1
 
         for x in range(len(prev_object1s)):
             prev_object1 = prev_object1s[x]
@@ -206,6 +205,7 @@ class CollisionsFinderTests:
             object2s[x].name = prev_object2.name
             HistoryKeeper.add(prev_object2, prev_object2.name, True)
 
+        HistoryKeeper.start_new_frame()
         VelocityCalculator.time = 2
 
 
@@ -225,6 +225,7 @@ while True:
 
     game_window.run()
 
-    CollisionsFinder.objects_to_data = {}
-    HistoryKeeper.last_time = VelocityCalculator.time
+    CollisionsFinder.collision_cache.start_new_frame()
+    CollisionsUtilityFunctions.start_new_frame()
+    HistoryKeeper.start_new_frame()
     VelocityCalculator.time = time.time() - start_time
\ No newline at end of file
@@ -0,0 +1,42 @@
+import unittest
+
+from games.pong.base_pong.ball import Ball
+from games.pong.base_pong.players import Paddle
+from games.pong.logic.ball_predictor import BallPredictor
+from games.pong.pong_types.normal_pong import NormalPong
+
+
+class BallPredictorTests(unittest.TestCase):
+    def test_ball_predictor_only_finds_intercepts_again_when_the_path_changes(self):
+        pong_type = NormalPong(Paddle(), Paddle(), Ball())
+        ball = pong_type.ball
+        ball.x_coordinate, ball.y_coordinate, ball.is_moving_right = 200, 100, True
+        intercepts_found = []
+
+        def get_ai_data():
+            find_ai_data = lambda: intercepts_found.append(ball.x_coordinate) or pong_type.find_ai_data(1200)
+            return BallPredictor.get_intercept(ball, 1200, pong_type.get_ball_state(ball), find_ai_data)
+
+        end_y_coordinate, time = get_ai_data()
+
+        # Moving forwards (and bouncing) doesn't change the ball's path, so the intercept is only found once
+        ball.x_coordinate += 500
+        wanted_outputs = [end_y_coordinate, time - 500 / ball.forwards_velocity, [200]]
+        gotten_outputs = get_ai_data() + [intercepts_found]
+
+        self.assertAlmostEqual(wanted_outputs[0], gotten_outputs[0])
+        self.assertAlmostEqual(wanted_outputs[1], gotten_outputs[1])
+        self.assertEqual(wanted_outputs[2], gotten_outputs[2])
+
+        ball.forwards_velocity *= 2
+        get_ai_data()
+        BallPredictor.invalidate(ball)
+        get_ai_data()
+        self.assertEqual([200, 700, 700], intercepts_found)
+
+        BallPredictor.reset()
+        ball.reset()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -179,10 +179,9 @@ class CollisionsFinderTests(unittest.TestCase):
         return ellipse
 
     def simulate_game(self, prev_object1s, prev_object2s, object1s, object2s):
-        CollisionsFinder.objects_to_data = {}
+        CollisionsFinder.collision_cache.start_new_frame()
         HistoryKeeper.reset()
         VelocityCalculator.time = 1
-        HistoryKeeper.last_time = 1
 
         for x in range(len(prev_object1s)):
             prev_object1 = prev_object1s[x]
@@ -196,6 +195,7 @@ class CollisionsFinderTests(unittest.TestCase):
             object2s[x].name = prev_object2.name
             HistoryKeeper.add(prev_object2, prev_object2.name, True)
 
+        HistoryKeeper.start_new_frame()
         VelocityCalculator.time = 2
 
 
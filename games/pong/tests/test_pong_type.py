@@ -0,0 +1,44 @@
+import unittest
+from random import Random
+
+from base.important_variables import screen_height, screen_length
+from base.utility_classes import HistoryKeeper
+from games.pong.base_pong.ball import Ball
+from games.pong.base_pong.players import Paddle
+from games.pong.pong_types.normal_pong import NormalPong
+
+
+class PongTypeTests(unittest.TestCase):
+    def test_ball_prediction_matches_ball_path_data(self):
+        pong_type = NormalPong(Paddle(), Paddle(), Ball())
+        lowest_y_coordinate = screen_height - pong_type.ball.height
+        random = Random(3)
+
+        for x in range(2000):
+            # Starting at the top and bottom are the tricky cases because the ball bounces right away
+            ball_y_coordinate = random.choice([0, lowest_y_coordinate, random.uniform(0, lowest_y_coordinate)])
+            ball_x_coordinate = random.uniform(0, screen_length)
+            end_x_coordinate = ball_x_coordinate + random.choice([-1, 1]) * random.uniform(1, 6 * screen_length)
+            ball_is_moving_down = random.random() < .5
+            pong_type.ball.upwards_velocity = random.uniform(100, 3000)
+
+            ball_path, wanted_is_moving_down, times = pong_type.get_ball_path_data(ball_y_coordinate, ball_x_coordinate,
+                                                                                   end_x_coordinate, ball_is_moving_down)
+            end_y_coordinate, gotten_is_moving_down, time = pong_type.get_ball_prediction(ball_y_coordinate, ball_x_coordinate,
+                                                                                         end_x_coordinate, ball_is_moving_down)
+
+            self.assertAlmostEqual(ball_path.get_end_points()[0].y_coordinate, end_y_coordinate, places=6)
+            self.assertEqual(wanted_is_moving_down, gotten_is_moving_down)
+            self.assertAlmostEqual(times[len(times) - 1], time, places=9)
+
+    def test_ball_predictions_are_remembered_for_the_frame(self):
+        pong_type = NormalPong(Paddle(), Paddle(), Ball())
+        prediction = pong_type.get_ball_prediction(100, 200, 1200, True)
+
+        self.assertIs(prediction, pong_type.get_ball_prediction(100, 200, 1200, True))
+        HistoryKeeper.start_new_frame()
+        self.assertIsNot(prediction, pong_type.get_ball_prediction(100, 200, 1200, True))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import unittest
+from random import Random
+
+from base.equations import Point
+from base.important_variables import screen_height, screen_length
+from base.path import VelocityPath
+from games.pong.base_pong.ball import Ball
+from games.pong.base_pong.players import Paddle
+from games.pong.logic.portal_trajectory import PortalTrajectory
+from games.pong.pong_types.portal_pong import PortalPong
+
+
+class PortalTrajectoryTests(unittest.TestCase):
+    def test_portal_trajectory_finds_the_first_teleport(self):
+        portal_pong = PortalPong(Paddle(), Paddle(), Ball())
+        ball = portal_pong.ball
+        random = Random(7)
+        time_step = .001
+
+        for x in range(20):
+            ball.x_coordinate, ball.y_coordinate = random.uniform(0, screen_length * .8), random.uniform(0, screen_height - ball.height)
+            ball.forwards_velocity, ball.upwards_velocity = random.uniform(300, 1500), random.uniform(300, 1500)
+            ball.is_moving_down = random.random() < .5
+
+            for portal_path in portal_pong.portal_paths:
+                portal_path.total_time = random.uniform(0, portal_path.last_end_time)
+
+            end_x_coordinate = screen_length * .95
+            teleport_events = portal_pong.get_ball_trajectory(end_x_coordinate)[2]
+            ball_pieces = PortalTrajectory.get_ball_pieces(ball, ball.y_coordinate, ball.is_moving_down,
+                                                           (end_x_coordinate - ball.x_coordinate) / ball.forwards_velocity)
+
+            # Going forwards a little at a time should find the same first teleport (to within a time step)
+            wanted_time = self.get_first_portal_collision_time(portal_pong, ball_pieces, time_step)
+            gotten_time = teleport_events[0].time if len(teleport_events) != 0 else None
+
+            self.assertEqual(wanted_time is None, gotten_time is None)
+
+            if wanted_time is not None:
+                self.assertAlmostEqual(wanted_time, gotten_time, delta=time_step)
+
+        for portal in portal_pong.portals:
+            portal.enable()
+
+    def get_first_portal_collision_time(self, portal_pong, ball_pieces, time_step):
+        """returns: double; the first time (a multiple of time_step) the ball's and a portal opening's bounding boxes touch"""
+
+        ball = portal_pong.ball
+
+        for start_time, end_time, start_y_coordinate, end_y_coordinate, unused in ball_pieces:
+            time = start_time
+
+            while time < end_time:
+                ball_x_coordinate = ball.x_coordinate + ball.forwards_velocity * time
+                ball_y_coordinate = start_y_coordinate + (end_y_coordinate - start_y_coordinate) * (time - start_time) / (end_time - start_time)
+
+                for x in range(len(portal_pong.portal_paths)):
+                    portal_opening = PortalTrajectory.get_portal_opening(portal_pong.portals[x // 2], x)
+                    portal_x_coordinate, portal_y_coordinate = PortalTrajectory.get_path_coordinates(portal_pong.portal_paths[x], time)
+
+                    if (-ball.length <= ball_x_coordinate - portal_x_coordinate <= portal_opening.length and
+                            -ball.height <= ball_y_coordinate - portal_y_coordinate <= portal_opening.height):
+                        return time
+
+                time = round(time / time_step + 1) * time_step
+
+        return None
+
+    def test_get_line_at_matches_checking_every_line(self):
+        random = Random(8)
+
+        for x in range(100):
+            portal_path = VelocityPath(Point(random.uniform(0, 500), random.uniform(0, 500)), [], random.uniform(50, 500))
+
+            # Points that don't move horizontally make vertical lines, which are the tricky case
+            for y in range(random.randint(1, 8)):
+                x_coordinate = random.choice([portal_path.last_point.x_coordinate, random.uniform(0, 500)])
+                portal_path.add_point(Point(x_coordinate, random.uniform(0, 500)))
+
+            line_end_times = portal_path.line_end_times
+
+            for path_time in [random.uniform(-1, portal_path.last_end_time * 3) for y in range(20)] + line_end_times:
+                index = PortalTrajectory.find_line_at(portal_path, path_time % portal_path.last_end_time)
+                index = min(index, len(line_end_times) - 1)
+                end_time = line_end_times[index] if index != len(line_end_times) - 1 else portal_path.last_end_time
+                wanted_outputs = [index, portal_path.line_start_times[index], end_time]
+
+                # The line that is checked first shouldn't change which line is found
+                for first_index in range(len(line_end_times) + 1):
+                    self.assertEqual(wanted_outputs, PortalTrajectory.get_line_at(portal_path, path_time, first_index))
+
+
+if __name__ == '__main__':
+    unittest.main()
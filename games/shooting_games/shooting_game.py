@@ -1,6 +1,6 @@
 from base.colors import red, blue, white
 from base.dimensions import Dimensions
-from base.engines import CollisionsFinder
+from base.engines import CollisionsFinder, SweepAndPrune
 from base.game_movement import GameMovement
 from base.important_variables import *
 from base.utility_classes import HistoryKeeper
@@ -26,9 +26,11 @@ class ShootingGameScreen(Screen):
     player2_score = 0
     player1_score_field = TextBox("Player 1 Score: ", 20, False, red, white)
     player2_score_field = TextBox("Player 2 Score: ", 20, False, blue, white)
+    sweep_and_prune = None
 
     def __init__(self):
         """Initializes the object"""
+        self.sweep_and_prune = SweepAndPrune()
         self.player1 = Player(pygame.K_a, pygame.K_d, pygame.K_w, pygame.K_s, pygame.K_g, pygame.K_f)
         self.player2 = Player(pygame.K_LEFT, pygame.K_RIGHT, pygame.K_UP, pygame.K_DOWN, pygame.K_PERIOD, pygame.K_COMMA)
 
@@ -42,29 +44,39 @@ class ShootingGameScreen(Screen):
 
         self.base_components = [self.player1_score_field, self.player2_score_field, self.player1, self.player2, self.death_ball]
 
+        # The bullets are registered when they are shot and unregistered when they are destroyed (see run())
+        for game_object in [self.player1, self.player2, self.death_ball]:
+            self.sweep_and_prune.add(game_object)
+
     def run(self):
         """Runs all the code necessary for this game to run properly"""
 
         self.player1_score_field.text = f"Player 1 Score: {self.player1_score}"
         self.player2_score_field.text = f"Player 2 Score: {self.player2_score}"
-        self.bullets += self.player1.bullets + self.player2.bullets
+        new_bullets = self.player1.bullets + self.player2.bullets
+        self.bullets += new_bullets
+
+        for bullet in new_bullets:
+            self.sweep_and_prune.add(bullet)
 
         self.components = self.base_components + self.bullets
 
         self.add_needed_objects()
         self.run_players_movement()
+
+        self.sweep_and_prune.run()
         self.run_bullet_collisions()
 
     def add_needed_objects(self):
         """Adds all the object to the HistoryKeeper"""
 
-        HistoryKeeper.add(self.player1, self.player1.name, True)
-        HistoryKeeper.add(self.player2, self.player2.name, True)
-        HistoryKeeper.add(self.death_ball, self.death_ball.name, True)
+        HistoryKeeper.add_if_changed(self.player1, self.player1.name)
+        HistoryKeeper.add_if_changed(self.player2, self.player2.name)
+        HistoryKeeper.add_if_changed(self.death_ball, self.death_ball.name)
 
         for bullet in self.bullets:
             bullet.name = id(bullet)
-            HistoryKeeper.add(bullet, bullet.name, True)
+            HistoryKeeper.add_if_changed(bullet, bullet.name)
 
     def run_players_movement(self):
         """Runs the players movement"""
@@ -88,14 +100,19 @@ class ShootingGameScreen(Screen):
         """Runs the collisions for the bullets"""
 
         base_stun_time = .4
+        bullet_to_indexes = {}
+
+        for x in range(len(self.bullets)):
+            bullet_to_indexes[id(self.bullets[x])] = bullet_to_indexes.get(id(self.bullets[x]), []) + [x]
 
         for i in range(len(self.bullets)):
             stun_time = base_stun_time * self.bullets[i].total_hits_to_destroy
             bullet1: Bullet = self.bullets[i]
 
-            bullet_has_hit_player1 = CollisionsFinder.is_collision(self.player1, bullet1)
-            bullet_has_hit_player2 = CollisionsFinder.is_collision(self.player2, bullet1)
-            bullet_has_hit_death_ball = CollisionsFinder.is_collision(bullet1, self.death_ball)
+            # The sweep and prune already found which objects the bullet could have hit; the rest can be skipped
+            bullet_has_hit_player1 = self.sweep_and_prune.could_have_collided(bullet1, self.player1) and CollisionsFinder.is_collision(self.player1, bullet1)
+            bullet_has_hit_player2 = self.sweep_and_prune.could_have_collided(bullet1, self.player2) and CollisionsFinder.is_collision(self.player2, bullet1)
+            bullet_has_hit_death_ball = self.sweep_and_prune.could_have_collided(bullet1, self.death_ball) and CollisionsFinder.is_collision(bullet1, self.death_ball)
 
             if bullet_has_hit_player1:
                 # The bigger the bullet the longer the stun time should be
@@ -112,15 +129,26 @@ class ShootingGameScreen(Screen):
                 bullet1.hits_left_to_destroy = 0
                 continue
 
-            for j in range(len(self.bullets) - i):
-                bullet2: Bullet = self.bullets[j + i]
+            # The same pairs as the nested loop 'for j in range(len(self.bullets) - i): bullet2 = self.bullets[j + i]' (every
+            # index from i on that isn't bullet1) in the same order, but only the bullets that could have been hit
+            other_bullet_indexes = []
 
+            for game_object in self.sweep_and_prune.get_overlapping_objects(bullet1):
+                other_bullet_indexes += [index for index in bullet_to_indexes.get(id(game_object), []) if index >= i]
+
+            other_bullet_indexes.sort()
+
+            for bullet2 in [self.bullets[index] for index in other_bullet_indexes]:
                 # For speed; don't have to check collision if the bullets don't have health left
                 if bullet2.hits_left_to_destroy <= 0 or bullet1.hits_left_to_destroy <= 0:
                     continue
 
-                if bullet1 != bullet2 and CollisionsFinder.is_collision(bullet1, bullet2):
+                if CollisionsFinder.is_collision(bullet1, bullet2):
                     bullet1.hits_left_to_destroy -= bullet2.total_hits_to_destroy
                     bullet2.hits_left_to_destroy -= bullet2.total_hits_to_destroy
 
+        for bullet in self.bullets:
+            if bullet.hits_left_to_destroy <= 0:
+                self.sweep_and_prune.remove(bullet)
+
         self.bullets = list(filter(lambda item: item.hits_left_to_destroy > 0, self.bullets))
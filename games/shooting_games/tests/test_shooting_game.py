@@ -0,0 +1,91 @@
+import unittest
+from random import Random
+
+from base.engines import CollisionsFinder
+from base.utility_classes import HistoryKeeper
+from base.velocity_calculator import VelocityCalculator
+from games.shooting_games.base.bullet import Bullet
+from games.shooting_games.shooting_game import ShootingGameScreen
+
+
+def get_screen(seed):
+    """returns: ShootingGameScreen; a screen with bullets that were shot at random places (some of them overlap)"""
+
+    random = Random(seed)
+    screen = ShootingGameScreen()
+    screen.bullets = []
+    prev_bullets = []
+
+    # So only the bullets can collide with each other
+    for game_object in [screen.player1, screen.player2, screen.death_ball]:
+        game_object.x_coordinate, game_object.y_coordinate = -1000, -1000
+
+    for x in range(40):
+        x_coordinate, y_coordinate, size = random.uniform(0, 300), random.uniform(0, 300), random.uniform(5, 40)
+        is_moving_right = random.random() < .5
+        prev_bullet = Bullet(random.randint(1, 3), is_moving_right, x_coordinate, y_coordinate, size, size)
+        bullet = Bullet(prev_bullet.total_hits_to_destroy, is_moving_right, x_coordinate + random.uniform(-30, 30), y_coordinate, size, size)
+
+        prev_bullet.name, bullet.name = x, x
+        prev_bullets.append(prev_bullet)
+        screen.bullets.append(bullet)
+
+    # The same bullet can be in the list twice
+    screen.bullets.append(screen.bullets[3])
+
+    CollisionsFinder.collision_cache.start_new_frame()
+    HistoryKeeper.reset()
+    VelocityCalculator.time = 1
+
+    for prev_bullet in prev_bullets:
+        HistoryKeeper.add(prev_bullet, prev_bullet.name, True)
+
+    HistoryKeeper.frame += 1
+
+    for bullet in screen.bullets:
+        screen.sweep_and_prune.add(bullet)
+
+    screen.sweep_and_prune.run()
+    return screen
+
+
+def run_bullet_collisions_with_nested_loop(screen):
+    """The bullet to bullet collisions how ShootingGameScreen.run_bullet_collisions() did them before the sweep and prune"""
+
+    for i in range(len(screen.bullets)):
+        bullet1 = screen.bullets[i]
+
+        for j in range(len(screen.bullets) - i):
+            bullet2 = screen.bullets[j + i]
+
+            if bullet2.hits_left_to_destroy <= 0 or bullet1.hits_left_to_destroy <= 0:
+                continue
+
+            if bullet1 != bullet2 and CollisionsFinder.is_collision(bullet1, bullet2):
+                bullet1.hits_left_to_destroy -= bullet2.total_hits_to_destroy
+                bullet2.hits_left_to_destroy -= bullet2.total_hits_to_destroy
+
+    screen.bullets = list(filter(lambda item: item.hits_left_to_destroy > 0, screen.bullets))
+
+
+class ShootingGameTests(unittest.TestCase):
+    def test_bullet_collisions_match_nested_loop(self):
+        for seed in range(5):
+            screen = get_screen(seed)
+            run_bullet_collisions_with_nested_loop(screen)
+            wanted_outputs = [[bullet.name, bullet.hits_left_to_destroy] for bullet in screen.bullets]
+
+            screen = get_screen(seed)
+            screen.run_bullet_collisions()
+            gotten_outputs = [[bullet.name, bullet.hits_left_to_destroy] for bullet in screen.bullets]
+
+            self.assertEqual(wanted_outputs, gotten_outputs, f"Seed {seed} Failed")
+            self.assertNotEqual(len(gotten_outputs), 41, f"Seed {seed} Failed | no bullets collided")
+
+    def test_destroyed_bullets_are_unregistered(self):
+        screen = get_screen(0)
+        screen.run_bullet_collisions()
+
+        wanted_outputs = sorted(set(id(game_object) for game_object in [screen.player1, screen.player2, screen.death_ball] + screen.bullets))
+        gotten_outputs = sorted(screen.sweep_and_prune.game_objects.keys())
+        self.assertEqual(wanted_outputs, gotten_outputs)
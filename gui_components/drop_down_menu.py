@@ -165,6 +165,9 @@ class DropDownMenu(ClickableComponent):
             returns: None
         """
 
+        if not game_window.is_rendering:
+            return
+
         arrow_container = GameObject(x_coordinate, y_coordinate, self.item_height, remaining_length, self.menu_color)
 
         # From here down is talking about the arrow part
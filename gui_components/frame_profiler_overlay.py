@@ -0,0 +1,73 @@
+from base.events import Event
+from base.frame_profiler import FrameProfiler
+from base.gui_utility_functions import render_words
+from base.important_variables import *
+from base.utility_functions import key_is_hit
+from gui_components.component import Component
+
+
+class FrameProfilerOverlay(Component):
+    """Shows the 50th, 95th, and 99th percentile of the FrameProfiler's frame times for every section in the top left of
+    the screen; the toggle_key shows and hides it"""
+
+    # Made the first time the overlay is drawn (see get_font()), so importing this doesn't need pygame's fonts
+    font = None
+    text_color = (255, 255, 0)
+    text_background = (0, 0, 0)
+    line_height = 16
+    column_x_coordinates = [4, 230, 300, 370]
+    toggle_key = pygame.K_F3
+    toggle_event = None
+    is_showing = True
+
+    def __init__(self, is_showing=True):
+        """ summary: initializes the object
+
+            params:
+                is_showing: boolean; if the overlay starts out shown
+
+            returns: None
+        """
+
+        self.is_showing = is_showing
+        self.toggle_event = Event()
+        self.number_set_dimensions(0, 0, screen_length, screen_height)
+
+    def run(self):
+        """Shows or hides the overlay if the toggle_key was just pressed"""
+
+        self.toggle_event.run(key_is_hit(self.toggle_key))
+
+        if self.toggle_event.is_click():
+            self.is_showing = not self.is_showing
+
+    def get_font(self):
+        """returns: pygame.font.Font; the font the percentiles are drawn with"""
+
+        if FrameProfilerOverlay.font is None:
+            FrameProfilerOverlay.font = pygame.font.Font('freesansbold.ttf', 13)
+
+        return FrameProfilerOverlay.font
+
+    def render(self):
+        """ summary: draws a line of the percentiles (in milliseconds) for every section
+            params: None
+            returns: None
+        """
+
+        if not self.is_showing or not game_window.is_rendering:
+            return
+
+        # The font isn't monospaced, so each column is drawn at its own x_coordinate
+        rows = [["section", "p50 ms", "p95 ms", "p99 ms"]]
+
+        for section in FrameProfiler.get_sections():
+            rows.append([section] + [f"{frame_time:.2f}" for frame_time in FrameProfiler.get_percentiles(section)])
+
+        font = self.get_font()
+
+        for x in range(len(rows)):
+            for y in range(len(rows[x])):
+                render_words(rows[x][y], font, x_coordinate=self.x_coordinate + self.column_x_coordinates[y],
+                             y_coordinate=self.y_coordinate + x * self.line_height, text_color=self.text_color,
+                             text_background=self.text_background)
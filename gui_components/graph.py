@@ -1,6 +1,6 @@
 from copy import deepcopy
 
-from base.equations import LineSegment, Point
+from base.equations import LineSegment, Point, DrawnLine
 from gui_components.component import Component
 from base.colors import black
 
@@ -20,9 +20,6 @@ class Graph(Component):
         self.unmodified_lines = lines
         self.colors = colors
 
-        for x in range(len(self.unmodified_lines)):
-            self.unmodified_lines[x].color = self.colors[x]
-
     def run(self):
         pass
 
@@ -32,12 +29,10 @@ class Graph(Component):
         x_axis = LineSegment(Point(self.x_coordinate, self.bottom), Point(self.right_edge, self.bottom))
         y_axis = LineSegment(Point(self.x_coordinate, self.y_coordinate), Point(self.x_coordinate, self.bottom))
 
-        x_axis.color, y_axis.color = black, black
-
-        components = [x_axis, y_axis] + self.modified_lines
+        components = [DrawnLine(x_axis, black), DrawnLine(y_axis, black)]
 
         for x in range(len(self.modified_lines)):
-            self.modified_lines[x].color = self.colors[x]
+            components.append(DrawnLine(self.modified_lines[x], self.colors[x]))
 
         for component in components:
             component.render()
@@ -1,13 +1,22 @@
 import pygame
 
+from base.frame_profiler import FrameProfiler
+
 # TODO add method schedule_update() to make performance better
 class Window:
     """Shows everything onto the users screen through adding components to it and displaying those added components"""
 
     components = []
     screens = []
+    # Components that are always ran and drawn on top of everything else no matter what screen is shown (like FrameProfilerOverlay)
+    overlays = []
     background_color = (0, 0, 0)
     window = None
+    is_headless = False
+    # If the components should be drawn this cycle (never when headless)
+    is_rendering = True
+    # How far (0 - 1) between last cycle and this cycle the GameObjects should be drawn
+    interpolation = 1
     
     def get_window(self):
         """ summary: Other functions from use this to put stuff on the screen like drawing and displaying text
@@ -16,19 +25,22 @@ class Window:
         """
         return self.window
 
-    def __init__(self, length, height, title, background_color):
+    def __init__(self, length, height, title, background_color, is_headless=False):
         """ summary: creates a window with the length, height, and title of the values given
 
             params:
                 length: int; the length of the window
                 height: int; the height of the window
                 title: String; the title displayed of the window
+                is_headless: boolean; if nothing should be drawn (the window is then only 1 by 1 pixels)
 
             returns: None
         """
 
         self.components = []
-        self.window = pygame.display.set_mode((length, height))
+        self.overlays = []
+        self.is_headless, self.is_rendering = is_headless, not is_headless
+        self.window = pygame.display.set_mode((length, height) if not is_headless else (1, 1))
         pygame.display.set_caption(title)
         self.background_color = background_color
 
@@ -55,6 +67,17 @@ class Window:
         for component in components:
             self.components.append(component)
 
+    def add_overlay(self, overlay):
+        """ summary: adds the overlay to the window; it is ran and drawn every cycle after everything else
+
+            params:
+                overlay: Component; the component that is going to be drawn on top of everything else
+
+            returns: None
+        """
+
+        self.overlays.append(overlay)
+
     def remove_component(self, component):
         """ summary: removes the component from the window
 
@@ -68,37 +91,55 @@ class Window:
 
     def run(self):
         """ summary: calls Component.run() for every component in Window.components and only calls Component.render() if the component is_visible
+            (render() is still called when the window isn't rendering because some components change their state in it, but nothing is drawn)
             params: None
             returns: None
         """
-        self.get_window().fill(self.background_color)
+        if self.is_rendering:
+            self.get_window().fill(self.background_color)
+
         selected_component = None
         all_components = []
         for screen in self.screens:
-            if screen.is_visible:
-                screen.run()
-
-            else:
+            if not screen.is_visible:
                 continue
-            
+
+            # The FrameProfiler times the screen's run() and its components' run() apart from their render()
+            run_section, render_section = None, None
+
+            if FrameProfiler.is_enabled:
+                run_section, render_section = f"{type(screen).__name__}.run", f"{type(screen).__name__}.render"
+
+            start_time = FrameProfiler.start()
+            screen.run()
+            FrameProfiler.end(run_section, start_time)
+
             all_components += screen.get_components()
             for component in screen.get_components():
                 if component.got_clicked():
                     selected_component = component
                 
                 if component.is_runnable:
+                    start_time = FrameProfiler.start()
                     component.run()
+                    FrameProfiler.end(run_section, start_time)
                 
                 if component.is_visible:
+                    start_time = FrameProfiler.start()
                     component.render()
+                    FrameProfiler.end(render_section, start_time)
 
         for component in self.components:
             # Only visible components should be displayed onto the screen
             if component.is_visible:
+                start_time = FrameProfiler.start()
                 component.render()
+                FrameProfiler.end("Window.render", start_time)
 
             if component.is_runnable and component.is_visible:
+                start_time = FrameProfiler.start()
                 component.run()
+                FrameProfiler.end("Window.run", start_time)
         
         for component in all_components + self.components:
             if selected_component is not None:
@@ -108,7 +149,12 @@ class Window:
         if selected_component is not None:
             selected_component.is_selected = True
 
-        pygame.display.update()
+        for overlay in self.overlays:
+            overlay.run()
+            overlay.render()
+
+        if self.is_rendering:
+            pygame.display.update()
 
     def set_component_visible(self, components, is_visible):
         """ summary: sets is_visible in all the components in components to the value passed in the parameter is_visible
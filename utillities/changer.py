@@ -37,7 +37,7 @@ class Changer:
         """Runs all the changes to the objects; NOTE: must be called at the end of the cycle to function properly"""
 
         for change in self.changes:
-            change.changed_object.__dict__[change.attribute] = change.value
+            setattr(change.changed_object, change.attribute, change.value)
 
         self.changes = []
 